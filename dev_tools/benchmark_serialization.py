@@ -0,0 +1,59 @@
+"""Benchmarks qiskit_superstaq.serialization on circuits with many distinct custom gates.
+
+Usage:
+    python dev_tools/benchmark_serialization.py [--sizes 250 500 1000 2000] [--repeat 3]
+"""
+import argparse
+import timeit
+from typing import List
+
+import numpy as np
+import qiskit
+
+import qiskit_superstaq
+
+
+def _custom_gate_circuit(num_gates: int) -> qiskit.QuantumCircuit:
+    """Builds a circuit of `num_gates` (mostly distinct) parameterized custom gates."""
+    rng = np.random.default_rng(0)
+    circuit = qiskit.QuantumCircuit(4)
+    for index, theta in enumerate(rng.uniform(0, 2 * np.pi, num_gates)):
+        if index % 3 == 0:
+            circuit.append(qiskit_superstaq.AceCR("+-", sandwich_rx_rads=theta), [0, 1])
+        elif index % 3 == 1:
+            circuit.append(qiskit_superstaq.ZZSwapGate(theta), [1, 2])
+        else:
+            gate = qiskit_superstaq.ParallelGates(
+                qiskit_superstaq.ZZSwapGate(theta), qiskit.circuit.library.RXGate(theta)
+            )
+            circuit.append(gate, [2, 3, 0])
+    return circuit
+
+
+def main(sizes: List[int], repeat: int) -> None:
+    print(f"{'gates':>8} {'_assign_unique_inst_names (s)':>30} {'serialize_circuits (s)':>24}")
+    for size in sizes:
+        circuit = _custom_gate_circuit(size)
+        assign_time = min(
+            timeit.repeat(
+                lambda: qiskit_superstaq.serialization._assign_unique_inst_names(circuit),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        serialize_time = min(
+            timeit.repeat(
+                lambda: qiskit_superstaq.serialization.serialize_circuits(circuit),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(f"{size:>8} {assign_time:>30.4f} {serialize_time:>24.4f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat)
@@ -1,8 +1,12 @@
 from ._init_vars import API_URL, API_VERSION
-from . import compiler_output, serialization  # noqa: I100; b/c ._init_vars need to be init first
+from . import compile_cache, compiler_output  # noqa: I100; b/c ._init_vars need to be init first
+from . import polling
+from . import serialization
 from . import superstaq_backend
 from . import superstaq_job
 from . import superstaq_provider
+from . import validation
+from . import local_simulator  # noqa: I100; b/c depends on superstaq_backend and superstaq_job
 from ._version import __version__
 from .custom_gates import (
     AceCR,
@@ -18,13 +22,17 @@ __all__ = [
     "API_VERSION",
     "AQTiCCXGate",
     "AQTiToffoliGate",
+    "compile_cache",
     "compiler_output",
     "ITOFFOLIGate",
+    "local_simulator",
     "ParallelGates",
+    "polling",
     "serialization",
     "superstaq_backend",
     "superstaq_job",
     "superstaq_provider",
+    "validation",
     "ZZSwapGate",
     "__version__",
 ]
@@ -0,0 +1,172 @@
+import collections
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# a cached response, along with the time at which it was created
+_Entry = Tuple[float, Dict[str, Any]]
+
+
+class CompileCache:
+    """Content-addressed cache of SuperstaQ compile responses.
+
+    Responses are keyed on a hash of the full compile request (i.e. the serialized circuits, the
+    target and any other compile options) along with the API url and version it was sent to and
+    (a hash of) the API key it was sent with, so a hit is only possible for an identical request
+    by the same user. Entries are kept in an in-memory LRU cache, and (optionally) in an on-disk
+    cache which persists between sessions.
+
+    Compile output can also depend on server-side state, e.g. uploaded AQT configs. Providers
+    clear their cache whenever they change this state, but changes made elsewhere (e.g. by
+    another session) can only be accounted for by setting `max_age`.
+
+    Typical usage is:
+
+    .. code-block:: python
+
+        cache = qss.compile_cache.CompileCache(cache_dir="~/.cache/qiskit-superstaq")
+        ss_provider = qss.superstaq_provider.SuperstaQProvider(compile_cache=cache)
+
+    Args:
+        max_entries: the maximum number of responses to keep in memory.
+        cache_dir: if provided, the directory in which to also cache responses on disk.
+        max_disk_bytes: the maximum total size of the on-disk cache. When exceeded, the least
+            recently used entries are evicted.
+        max_age: if provided, the number of seconds after which cached responses expire.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = 2**30,
+        max_age: Optional[float] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age = max_age
+
+        self._memory_cache: "collections.OrderedDict[str, _Entry]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(
+        url: str, endpoint: str, request_json: Dict[str, Any], api_key: Optional[str] = None
+    ) -> str:
+        """Returns the cache key of a compile request.
+
+        Args:
+            url: the SuperstaQ API url (including the API version) the request is sent to.
+            endpoint: the compile endpoint, e.g. "aqt_compile".
+            request_json: the JSON body of the request.
+            api_key: the API key the request is sent with.
+        Returns:
+            A hex digest uniquely identifying the request.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(hashlib.sha256((api_key or "").encode()).digest())
+        hasher.update(f"{url}/{endpoint}\n".encode())
+        hasher.update(json.dumps(request_json, sort_keys=True).encode())
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Looks up a cached response, first in memory and then on disk.
+
+        Args:
+            key: the cache key of the compile request (see `CompileCache.key`).
+        Returns:
+            The cached JSON response, or None if there isn't one.
+        """
+        with self._lock:
+            if key in self._memory_cache:
+                created, json_dict = self._memory_cache[key]
+                if not self._expired(created):
+                    self._memory_cache.move_to_end(key)
+                    return json_dict
+                del self._memory_cache[key]
+
+        if not self.cache_dir:
+            return None
+
+        # on disk, an entry's modification time is when it was created, and its access time is
+        # when it was last used
+        path = self._path(key)
+        try:
+            created = os.stat(path).st_mtime
+            if self._expired(created):
+                return None
+            with open(path) as file:
+                json_dict = json.load(file)
+            os.utime(path, (time.time(), created))  # mark as recently used
+        except (OSError, ValueError):
+            return None
+
+        self._put_in_memory(key, json_dict, created)
+        return json_dict
+
+    def put(self, key: str, json_dict: Dict[str, Any]) -> None:
+        """Adds a response to the cache.
+
+        Args:
+            key: the cache key of the compile request (see `CompileCache.key`).
+            json_dict: the JSON response returned by the server.
+        """
+        self._put_in_memory(key, json_dict)
+
+        if self.cache_dir:
+            # write atomically, so concurrent readers never see a partially-written file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as file:
+                json.dump(json_dict, file)
+            os.replace(tmp_path, self._path(key))
+            self._evict_from_disk()
+
+    def clear(self) -> None:
+        """Removes every entry from the cache (including on disk)."""
+        with self._lock:
+            self._memory_cache.clear()
+
+        if self.cache_dir:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".json"):
+                    os.remove(entry.path)
+
+    def _expired(self, created: float) -> bool:
+        return self.max_age is not None and time.time() - created > self.max_age
+
+    def _put_in_memory(
+        self, key: str, json_dict: Dict[str, Any], created: Optional[float] = None
+    ) -> None:
+        with self._lock:
+            self._memory_cache[key] = (time.time() if created is None else created, json_dict)
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self.max_entries:
+                self._memory_cache.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        assert self.cache_dir
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _evict_from_disk(self) -> None:
+        """Removes least recently used files until the on-disk cache fits in `max_disk_bytes`."""
+        assert self.cache_dir
+        entries = [
+            (entry.stat().st_atime, entry.stat().st_size, entry.path)
+            for entry in os.scandir(self.cache_dir)
+            if entry.name.endswith(".json")
+        ]
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            os.remove(path)
+            total_bytes -= size
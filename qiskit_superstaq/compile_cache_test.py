@@ -0,0 +1,109 @@
+import os
+import time
+from typing import Any
+from unittest import mock
+
+import qiskit_superstaq as qss
+
+
+def test_key() -> None:
+    key = qss.compile_cache.CompileCache.key
+    request_json = {"qiskit_circuits": "abc", "backend": "keysight"}
+
+    assert key("url/v0.1.0", "aqt_compile", request_json) == key(
+        "url/v0.1.0", "aqt_compile", {"backend": "keysight", "qiskit_circuits": "abc"}
+    )
+    assert key("url/v0.1.0", "aqt_compile", request_json) != key(
+        "url/v0.2.0", "aqt_compile", request_json
+    )
+    assert key("url/v0.1.0", "aqt_compile", request_json) != key(
+        "url/v0.1.0", "cq_compile", request_json
+    )
+    assert key("url/v0.1.0", "aqt_compile", request_json) != key(
+        "url/v0.1.0", "aqt_compile", {**request_json, "backend": "other"}
+    )
+    assert key("url/v0.1.0", "aqt_compile", request_json) != key(
+        "url/v0.1.0", "aqt_compile", {**request_json, "random_seed": 1}
+    )
+    assert key("url/v0.1.0", "aqt_compile", request_json, "api_key") != key(
+        "url/v0.1.0", "aqt_compile", request_json, "other_api_key"
+    )
+    assert "api_key" not in key("url/v0.1.0", "aqt_compile", request_json, "api_key")
+
+
+def test_memory_cache() -> None:
+    cache = qss.compile_cache.CompileCache(max_entries=2)
+    assert cache.get("a") is None
+
+    cache.put("a", {"qiskit_circuits": "a"})
+    cache.put("b", {"qiskit_circuits": "b"})
+    assert cache.get("a") == {"qiskit_circuits": "a"}
+
+    # "b" is now the least recently used entry, so it is evicted first
+    cache.put("c", {"qiskit_circuits": "c"})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"qiskit_circuits": "a"}
+    assert cache.get("c") == {"qiskit_circuits": "c"}
+
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_disk_cache(tmp_path: Any) -> None:
+    cache_dir = str(tmp_path / "cache")
+    cache = qss.compile_cache.CompileCache(max_entries=1, cache_dir=cache_dir)
+    cache.put("a", {"qiskit_circuits": "a"})
+    cache.put("b", {"qiskit_circuits": "b"})
+    assert sorted(os.listdir(cache_dir)) == ["a.json", "b.json"]
+
+    # entries evicted from memory (or written by another session) are read back from disk
+    assert cache.get("a") == {"qiskit_circuits": "a"}
+    new_cache = qss.compile_cache.CompileCache(cache_dir=cache_dir)
+    assert new_cache.get("b") == {"qiskit_circuits": "b"}
+
+    # unreadable entries are treated as misses
+    with open(os.path.join(cache_dir, "c.json"), "w") as file:
+        file.write("{not json")
+    assert new_cache.get("c") is None
+    assert new_cache.get("d") is None
+
+    new_cache.clear()
+    assert os.listdir(cache_dir) == []
+    assert new_cache.get("b") is None
+
+
+def test_disk_cache_eviction(tmp_path: Any) -> None:
+    cache = qss.compile_cache.CompileCache(cache_dir=str(tmp_path), max_disk_bytes=100)
+    entry_size = len('{"qiskit_circuits": "aaaaaaaaaa"}')
+
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, {"qiskit_circuits": key * 10})
+        os.utime(tmp_path / f"{key}.json", (i, i))
+    assert sorted(os.listdir(tmp_path)) == ["a.json", "b.json", "c.json"]
+
+    # the least recently used file is evicted once the cache exceeds its size limit
+    cache.put("d", {"qiskit_circuits": "d" * 10})
+    assert sorted(os.listdir(tmp_path)) == ["b.json", "c.json", "d.json"]
+    assert 3 * entry_size <= 100 < 4 * entry_size
+
+
+def test_max_age(tmp_path: Any) -> None:
+    cache = qss.compile_cache.CompileCache(cache_dir=str(tmp_path), max_age=60)
+    cache.put("a", {"qiskit_circuits": "a"})
+    assert cache.get("a") == {"qiskit_circuits": "a"}
+
+    # using an entry on disk doesn't extend its lifetime
+    os.utime(tmp_path / "a.json", (0, time.time() - 30))
+    created = os.stat(tmp_path / "a.json").st_mtime
+    new_cache = qss.compile_cache.CompileCache(cache_dir=str(tmp_path), max_age=60)
+    assert new_cache.get("a") == {"qiskit_circuits": "a"}
+    assert os.stat(tmp_path / "a.json").st_mtime == created
+    assert os.stat(tmp_path / "a.json").st_atime > created
+    os.utime(tmp_path / "a.json", (time.time(), time.time() - 120))
+    assert qss.compile_cache.CompileCache(cache_dir=str(tmp_path), max_age=60).get("a") is None
+    assert qss.compile_cache.CompileCache(cache_dir=str(tmp_path)).get("a") is not None
+
+    # entries in memory expire too
+    with mock.patch("time.time", return_value=time.time() + 120):
+        assert cache.get("a") is None
+    assert "a" not in cache._memory_cache
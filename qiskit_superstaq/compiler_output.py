@@ -1,8 +1,11 @@
+import copy
 import importlib
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 import applications_superstaq
+import numpy as np
 import qiskit
+import sympy
 
 import qiskit_superstaq
 
@@ -12,13 +15,106 @@ except ModuleNotFoundError:
     pass
 
 
+class _ParameterBinder:
+    """Binds many sets of parameter values into a parameterized (compiled) circuit.
+
+    The locations of the circuit's parameters are found once up front. Each parameter expression
+    is then evaluated for a whole batch of parameter sets at once (with numpy), and each bound
+    circuit only copies the instructions which actually depend on the parameters. Instructions
+    without parameters are shared between the bound circuits and the original circuit.
+    """
+
+    def __init__(self, circuit: qiskit.QuantumCircuit) -> None:
+        self.circuit = circuit
+        self.parameter_names = {parameter.name for parameter in circuit.parameters}
+
+        # (instruction index, param index, expression) of every parameterized instruction param
+        self._locations: List[Tuple[int, int, qiskit.circuit.ParameterExpression]] = []
+        for inst_index, (inst, _, _) in enumerate(circuit._data):
+            for param_index, param in enumerate(inst.params):
+                if isinstance(param, qiskit.circuit.ParameterExpression):
+                    self._locations.append((inst_index, param_index, param))
+
+        self._functions: Dict[int, Tuple[List[str], Callable[..., Any]]] = {}
+
+    def _evaluate(
+        self, expr: qiskit.circuit.ParameterExpression, values: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """Evaluates a parameter expression for every set of parameter values at once."""
+        if isinstance(expr, qiskit.circuit.Parameter):
+            return values[expr.name]
+
+        if id(expr) not in self._functions:
+            names = sorted(parameter.name for parameter in expr.parameters)
+            function = sympy.lambdify(
+                [sympy.Symbol(name) for name in names],
+                sympy.sympify(expr._symbol_expr),
+                "numpy",
+                dummify=True,
+            )
+            self._functions[id(expr)] = (names, function)
+
+        names, function = self._functions[id(expr)]
+        num_sets = len(next(iter(values.values())))
+        return np.broadcast_to(function(*(values[name] for name in names)), (num_sets,))
+
+    def bind(self, values: Dict[str, np.ndarray]) -> List[qiskit.QuantumCircuit]:
+        """Binds each set of parameter values into the circuit.
+
+        Args:
+            values: a dictionary mapping the name of every parameter in the circuit to an array
+                of its values (one for each set of parameter values to bind).
+        Returns:
+            A bound copy of the circuit for each set of parameter values.
+        """
+        missing_names = self.parameter_names - set(values)
+        if missing_names:
+            raise ValueError(f"Missing values for parameter(s): {', '.join(sorted(missing_names))}")
+
+        num_sets = len(next(iter(values.values()))) if values else 1
+        evaluated = [self._evaluate(expr, values) for _, _, expr in self._locations]
+
+        global_phase = self.circuit.global_phase
+        if isinstance(global_phase, qiskit.circuit.ParameterExpression):
+            global_phases = self._evaluate(global_phase, values)
+
+        bound_circuits = []
+        for set_index in range(num_sets):
+            data = list(self.circuit._data)
+            bound_insts: Dict[int, qiskit.circuit.Instruction] = {}
+            for (inst_index, param_index, _), param_values in zip(self._locations, evaluated):
+                if inst_index not in bound_insts:
+                    inst, qargs, cargs = data[inst_index]
+                    bound_insts[inst_index] = copy.copy(inst)
+                    bound_insts[inst_index]._params = list(inst.params)
+                    data[inst_index] = (bound_insts[inst_index], qargs, cargs)
+                bound_insts[inst_index].params[param_index] = float(param_values[set_index])
+
+            for inst in bound_insts.values():
+                if inst._definition is not None:
+                    definition_values = {
+                        parameter: values[parameter.name][set_index]
+                        for parameter in inst._definition.parameters
+                    }
+                    inst._definition = inst._definition.assign_parameters(definition_values)
+
+            bound_circuit = qiskit_superstaq.serialization._copy_with_data(
+                self.circuit, data, qiskit.circuit.parametertable.ParameterTable()
+            )
+            if isinstance(global_phase, qiskit.circuit.ParameterExpression):
+                bound_circuit.global_phase = float(global_phases[set_index])
+            bound_circuits.append(bound_circuit)
+
+        return bound_circuits
+
+
 class CompilerOutput:
     def __init__(
         self,
-        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        circuits: Union[qiskit.QuantumCircuit, Sequence[qiskit.QuantumCircuit]],
         pulse_sequences: Union[qiskit.pulse.Schedule, List[qiskit.pulse.Schedule]] = None,
         seq: Optional["qtrl.sequencer.Sequence"] = None,
-        jaqal_programs: List[str] = None,
+        jaqal_programs: Optional[Union[str, List[str]]] = None,
         pulse_lists: Optional[Union[List[List], List[List[List]]]] = None,
     ) -> None:
         if isinstance(circuits, qiskit.QuantumCircuit):
@@ -34,6 +130,49 @@ class CompilerOutput:
 
         self.seq = seq
 
+        # lazily-constructed parameter binders for the compiled circuit(s)
+        self._binders: Optional[List[_ParameterBinder]] = None
+
+        # functions computing attributes which haven't been decoded yet (see `_set_lazily`)
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+
+    @classmethod
+    def _lazy(cls, circuits_is_list: bool, **loaders: Callable[[], Any]) -> "CompilerOutput":
+        """Creates a CompilerOutput whose attributes are only decoded when first accessed.
+
+        Args:
+            circuits_is_list: whether the returned object represents multiple circuits.
+            loaders: functions computing each (non-None) attribute of the returned object, keyed
+                by attribute name (e.g. "circuit" or "pulse_sequences").
+        Returns:
+            The new CompilerOutput.
+        """
+        output = cls([] if circuits_is_list else qiskit.QuantumCircuit())
+        for name, loader in loaders.items():
+            output._set_lazily(name, loader)
+        return output
+
+    def _set_lazily(self, name: str, loader: Callable[[], Any]) -> None:
+        """Replaces the attribute `name` with the result of `loader()`, computed (and cached) when
+        the attribute is first accessed."""
+        self.__dict__.pop(name, None)
+        self._loaders[name] = loader
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes which haven't been set, i.e. those which are still lazy
+        loaders = self.__dict__.get("_loaders", {})
+        if name not in loaders:
+            raise AttributeError(f"'CompilerOutput' object has no attribute '{name}'")
+
+        value = loaders.pop(name)()
+        setattr(self, name, value)
+        return value
+
+    def __getstate__(self) -> Dict[str, Any]:
+        for name in list(self._loaders):
+            getattr(self, name)
+        return self.__dict__
+
     def has_multiple_circuits(self) -> bool:
         """Returns True if this object represents multiple circuits.
 
@@ -42,6 +181,57 @@ class CompilerOutput:
         """
         return hasattr(self, "circuits")
 
+    def bind_parameters(
+        self, parameter_values: Mapping[qiskit.circuit.Parameter, float]
+    ) -> Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]:
+        """Binds values into the parameters of the compiled circuit(s) locally, so that a
+        parameterized circuit only needs to be compiled once (e.g. in a variational loop).
+
+        Note that only the compiled circuit(s) are bound; pulse sequences and programs returned by
+        the compiler are specific to the parameter values they were compiled with.
+
+        Args:
+            parameter_values: a dictionary mapping each parameter of the compiled circuit(s) to a
+                value. Parameters are matched by name.
+        Returns:
+            The bound compiled circuit (or list of circuits, if this object represents multiple
+            circuits).
+        """
+        values = {parameter: [value] for parameter, value in parameter_values.items()}
+        return self.bind_parameters_batch(values)[0]
+
+    def bind_parameters_batch(
+        self, parameter_values: Mapping[qiskit.circuit.Parameter, Sequence[float]]
+    ) -> List[Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]]:
+        """Vectorized version of `bind_parameters`, binding many sets of parameter values at once.
+
+        Args:
+            parameter_values: a dictionary mapping each parameter of the compiled circuit(s) to a
+                sequence of values, all of the same length (the number of parameter sets).
+        Returns:
+            For each set of parameter values, the bound compiled circuit (or list of circuits, if
+            this object represents multiple circuits).
+        """
+        values = {
+            parameter.name: np.asarray(param_values, dtype=float)
+            for parameter, param_values in parameter_values.items()
+        }
+        if len({len(param_values) for param_values in values.values()}) > 1:
+            raise ValueError("Every parameter must be given the same number of values.")
+
+        if not self.has_multiple_circuits():
+            return list(self._parameter_binders([self.circuit])[0].bind(values))
+
+        bound_circuits = [binder.bind(values) for binder in self._parameter_binders(self.circuits)]
+        return [list(circuits) for circuits in zip(*bound_circuits)]
+
+    def _parameter_binders(
+        self, circuits: Sequence[qiskit.QuantumCircuit]
+    ) -> List[_ParameterBinder]:
+        if self._binders is None:
+            self._binders = [_ParameterBinder(circuit) for circuit in circuits]
+        return self._binders
+
     def __repr__(self) -> str:
         if not self.has_multiple_circuits():
             return (
@@ -77,6 +267,11 @@ class CompilerOutput:
         )
 
 
+def _deserialize_circuits(json_dict: dict) -> List[qiskit.QuantumCircuit]:
+    """Deserializes the compiled circuits in a compile response (when they are first accessed)."""
+    return qiskit_superstaq.serialization.deserialize_circuits(json_dict["qiskit_circuits"])
+
+
 def read_json_aqt(json_dict: dict, circuits_is_list: bool) -> CompilerOutput:
     """Reads out returned JSON from SuperstaQ API's AQT compilation endpoint.
 
@@ -89,30 +284,37 @@ def read_json_aqt(json_dict: dict, circuits_is_list: bool) -> CompilerOutput:
         the returned object also stores the pulse sequence in the .seq attribute and the
         list(s) of cycles in the .pulse_list(s) attribute.
     """
-    seq = None
-    pulse_lists = None
+    loaders: Dict[str, Callable[[], Any]] = {}
+    if circuits_is_list:
+        loaders["circuits"] = lambda: _deserialize_circuits(json_dict)
+    else:
+        loaders["circuit"] = lambda: _deserialize_circuits(json_dict)[0]
 
     if importlib.util.find_spec(
         "qtrl"
     ):  # pragma: no cover, b/c qtrl is not open source so it is not in qiskit-superstaq reqs
-        state_str = json_dict["state_jp"]
-        state = applications_superstaq.converters.deserialize(state_str)
-
-        seq = qtrl.sequencer.Sequence(n_elements=1)
-        seq.__setstate__(state)
-        seq.compile()
+        loaders["seq"] = lambda: _read_seq(json_dict["state_jp"])
 
         pulse_lists_str = json_dict["pulse_lists_jp"]
-        pulse_lists = applications_superstaq.converters.deserialize(pulse_lists_str)
+        if circuits_is_list:
+            loaders["pulse_lists"] = lambda: applications_superstaq.converters.deserialize(
+                pulse_lists_str
+            )
+        else:
+            loaders["pulse_list"] = lambda: applications_superstaq.converters.deserialize(
+                pulse_lists_str
+            )[0]
+
+    return CompilerOutput._lazy(circuits_is_list, **loaders)
 
-    compiled_circuits = qiskit_superstaq.serialization.deserialize_circuits(
-        json_dict["qiskit_circuits"]
-    )
-    if circuits_is_list:
-        return CompilerOutput(circuits=compiled_circuits, seq=seq, pulse_lists=pulse_lists)
 
-    pulse_list = pulse_lists[0] if pulse_lists is not None else None
-    return CompilerOutput(circuits=compiled_circuits[0], seq=seq, pulse_lists=pulse_list)
+def _read_seq(state_str: str) -> "qtrl.sequencer.Sequence":  # pragma: no cover, b/c requires qtrl
+    """Builds (and compiles) a qtrl Sequence from its serialized state."""
+    state = applications_superstaq.converters.deserialize(state_str)
+    seq = qtrl.sequencer.Sequence(n_elements=1)
+    seq.__setstate__(state)
+    seq.compile()
+    return seq
 
 
 def read_json_qscout(json_dict: dict, circuits_is_list: bool) -> CompilerOutput:
@@ -126,16 +328,17 @@ def read_json_qscout(json_dict: dict, circuits_is_list: bool) -> CompilerOutput:
         a CompilerOutput object with the compiled circuit(s) and a list of
         jaqal programs in a string representation.
     """
-    compiled_circuits = qiskit_superstaq.serialization.deserialize_circuits(
-        json_dict["qiskit_circuits"]
-    )
     if circuits_is_list:
-        return CompilerOutput(
-            circuits=compiled_circuits, jaqal_programs=json_dict["jaqal_programs"]
+        return CompilerOutput._lazy(
+            circuits_is_list,
+            circuits=lambda: _deserialize_circuits(json_dict),
+            jaqal_programs=lambda: json_dict["jaqal_programs"],
         )
 
-    return CompilerOutput(
-        circuits=compiled_circuits[0], jaqal_programs=json_dict["jaqal_programs"][0]
+    return CompilerOutput._lazy(
+        circuits_is_list,
+        circuit=lambda: _deserialize_circuits(json_dict)[0],
+        jaqal_program=lambda: json_dict["jaqal_programs"][0],
     )
 
 
@@ -149,10 +352,11 @@ def read_json_only_circuits(json_dict: dict, circuits_is_list: bool) -> Compiler
     Returns:
         a CompilerOutput object with the compiled circuit(s)
     """
-    compiled_circuits = qiskit_superstaq.serialization.deserialize_circuits(
-        json_dict["qiskit_circuits"]
-    )
     if circuits_is_list:
-        return CompilerOutput(circuits=compiled_circuits)
+        return CompilerOutput._lazy(
+            circuits_is_list, circuits=lambda: _deserialize_circuits(json_dict)
+        )
 
-    return CompilerOutput(circuits=compiled_circuits[0])
+    return CompilerOutput._lazy(
+        circuits_is_list, circuit=lambda: _deserialize_circuits(json_dict)[0]
+    )
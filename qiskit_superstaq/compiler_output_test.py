@@ -154,3 +154,99 @@ def test_compiler_output_eq() -> None:
     circuit1.h(0)
 
     assert compiler_output.CompilerOutput([circuit, circuit1]) != co
+
+
+def test_bind_parameters() -> None:
+    theta = qiskit.circuit.Parameter("θ")
+    phi = qiskit.circuit.Parameter("φ")
+
+    circuit = qiskit.QuantumCircuit(2, global_phase=theta / 2)
+    circuit.h(0)
+    circuit.rz(theta, 0)
+    circuit.rx(2 * theta + phi, 1)
+    circuit.u(theta, phi, 0.5, 1)
+    circuit.append(qiskit_superstaq.AceCR("+-", sandwich_rx_rads=phi), [0, 1])
+    circuit.cx(0, 1)
+
+    subcircuit = qiskit.QuantumCircuit(1)
+    subcircuit.ry(phi - theta, 0)
+    circuit.append(subcircuit.to_gate(), [1])
+
+    out = compiler_output.CompilerOutput(circuit)
+    bound = out.bind_parameters({theta: 0.1, phi: 0.2})
+    expected = circuit.assign_parameters({theta: 0.1, phi: 0.2})
+    assert isinstance(bound, qiskit.QuantumCircuit)
+    assert bound == expected
+    assert not bound.parameters
+    assert qiskit.quantum_info.Operator(bound.data[-1][0]) == qiskit.quantum_info.Operator(
+        expected.data[-1][0]
+    )
+
+    # unparameterized instructions are shared, and the original circuit is left untouched
+    assert bound._data[0][0] is circuit._data[0][0]
+    assert circuit.parameters == {theta, phi}
+
+    # parameters are matched by name, and every parameter needs a value
+    assert out.bind_parameters({qiskit.circuit.Parameter("θ"): 0.1, phi: 0.2}) == expected
+    with pytest.raises(ValueError, match="Missing values for parameter"):
+        out.bind_parameters({theta: 0.1})
+
+    values = {theta: [0.1, 0.3, 0.5], phi: [0.2, 0.4, 0.6]}
+    bound_circuits = out.bind_parameters_batch(values)
+    assert bound_circuits == [
+        circuit.assign_parameters({theta: t, phi: p}) for t, p in zip(values[theta], values[phi])
+    ]
+
+    with pytest.raises(ValueError, match="same number of values"):
+        out.bind_parameters_batch({theta: [0.1, 0.3], phi: [0.2]})
+
+    # circuits without parameters are returned as-is
+    circuit1 = qiskit.QuantumCircuit(1)
+    circuit1.h(0)
+    out = compiler_output.CompilerOutput([circuit, circuit1])
+    assert out.bind_parameters({theta: 0.1, phi: 0.2}) == [expected, circuit1]
+    assert out.bind_parameters_batch(values)[2] == [bound_circuits[2], circuit1]
+    assert out.bind_parameters_batch({theta: [], phi: []}) == []
+
+
+def test_lazy_compiler_output() -> None:
+    circuit = qiskit.QuantumCircuit(2)
+    circuit.append(qiskit_superstaq.ZZSwapGate(0.5), [0, 1])
+    json_dict = {
+        "qiskit_circuits": qiskit_superstaq.serialization.serialize_circuits([circuit, circuit]),
+        "jaqal_programs": ["jaqal_program_0", "jaqal_program_1"],
+    }
+
+    # compiled circuits are only deserialized when accessed
+    with mock.patch(
+        "qiskit_superstaq.custom_gates.custom_resolver",
+        wraps=qiskit_superstaq.custom_gates.custom_resolver,
+    ) as mock_resolver:
+        out = compiler_output.read_json_qscout(json_dict, circuits_is_list=True)
+        assert out.jaqal_programs == json_dict["jaqal_programs"]
+        mock_resolver.assert_not_called()
+
+        assert out.circuits[1] == circuit
+        assert mock_resolver.call_count == 2
+
+    # and are then a regular list
+    assert isinstance(out.circuits, list)
+    assert out.circuits + [circuit] == [circuit] * 3
+    assert len(qiskit.transpile(out.circuits, basis_gates=["rz", "sx", "cx"])) == 2
+    out.circuits.append(circuit)
+    assert len(out.circuits) == 3
+
+    out = compiler_output.read_json_qscout(json_dict, circuits_is_list=False)
+    assert "circuit" not in out.__dict__ and "jaqal_program" not in out.__dict__
+    assert out.jaqal_program == "jaqal_program_0"
+    assert out.circuit == circuit
+    assert out.circuit is out.circuit
+
+    with pytest.raises(AttributeError, match="has no attribute 'circuits'"):
+        _ = out.circuits
+
+    # pickling decodes everything first
+    out = compiler_output.read_json_qscout(json_dict, circuits_is_list=False)
+    assert pickle.loads(pickle.dumps(out)) == compiler_output.CompilerOutput(
+        circuit, jaqal_programs="jaqal_program_0"
+    )
@@ -1,8 +1,67 @@
 import functools
-from typing import Optional, Type, Union
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Sequence, Type, Union
 
 import numpy as np
 import qiskit
+from qiskit.converters.ast_to_dag import AstInterpreter
+
+
+def _read_only(mat: np.ndarray) -> np.ndarray:
+    mat.setflags(write=False)
+    return mat
+
+
+def _with_dtype(mat: np.ndarray, dtype: Any) -> np.ndarray:
+    """Returns a (read-only) cached matrix, converted to the given dtype if necessary."""
+    if dtype is None or mat.dtype == dtype:
+        return mat
+    return _read_only(mat.astype(dtype))
+
+
+def _cached_unitary(
+    gate: qiskit.circuit.Gate, key: Hashable, compute: Callable[[], np.ndarray]
+) -> np.ndarray:
+    """Returns the unitary of a parameterized gate, which is cached (read-only) on the gate itself.
+
+    Args:
+        gate: the gate whose unitary to return.
+        key: every value the unitary depends on (e.g. the gate's params). The unitary is only
+            recomputed if this has changed since it was last cached.
+        compute: a function computing the (complex-valued) unitary.
+
+    Returns:
+        The (read-only) unitary.
+    """
+    cache = getattr(gate, "_unitary_cache", None)
+    if cache is None or cache[0] != key:
+        cache = (key, _read_only(compute()))
+        gate._unitary_cache = cache
+    return cache[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _acecr_unitary(polarity: str) -> np.ndarray:
+    cval = 1 / np.sqrt(2)
+    sval = 1j * cval if polarity == "+-" else -1j * cval
+    return _read_only(
+        np.array(
+            [
+                [0, cval, 0, sval],
+                [cval, 0, -sval, 0],
+                [0, sval, 0, cval],
+                [-sval, 0, cval, 0],
+            ],
+            dtype=complex,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _iccx_unitary(base_rads: float, ctrl_state: int) -> np.ndarray:
+    base_mat = qiskit.circuit.library.RXGate(base_rads).to_matrix()
+    return _read_only(
+        qiskit.circuit._utils._compute_control_matrix(base_mat, 2, ctrl_state=ctrl_state)
+    )
 
 
 class AceCR(qiskit.circuit.Gate):
@@ -43,28 +102,47 @@ class AceCR(qiskit.circuit.Gate):
         qc.rzx(-first_sign * np.pi / 4, 0, 1)
         self.definition = qc
 
-    def __array__(self, dtype: Type = None) -> np.ndarray:
-        cval = 1 / np.sqrt(2)
-        if self.polarity == "+-":
-            sval = 1j * cval
-        else:
-            sval = -1j * cval
+    @staticmethod
+    def batch_unitaries(
+        polarity: str, sandwich_rx_rads: Union[float, Sequence[float], np.ndarray]
+    ) -> np.ndarray:
+        """Computes the unitaries of AceCR gates with many sandwich angles at once.
 
-        mat = np.array(
-            [
-                [0, cval, 0, sval],
-                [cval, 0, -sval, 0],
-                [0, sval, 0, cval],
-                [-sval, 0, cval, 0],
-            ],
-            dtype=dtype,
-        )
+        Args:
+            polarity: Should be either "+-" or "-+". Specifies if positive or negative half-CR is
+                first.
+            sandwich_rx_rads: an array of sandwich angles (of any shape).
+
+        Returns:
+            A stack of unitaries with shape `np.shape(sandwich_rx_rads) + (4, 4)`, such that each
+            matches the unitary of `AceCR(polarity, sandwich_rx_rads=rads)` for the corresponding
+            angle.
+        """
+        if polarity not in ("+-", "-+"):
+            raise ValueError("Polarity must be either '+-' or '-+'")
+
+        rads = np.asarray(sandwich_rx_rads, dtype=float)[..., None, None]
+        cos = np.cos(rads / 2)
+        isin = 1j * np.sin(rads / 2)
+
+        # sandwiched rx gate commutes and can just be multiplied with non-sandwiched part, i.e.
+        # `mat @ np.kron(rx_mat, np.eye(2))`:
+        mat = _acecr_unitary(polarity)
+        mats = np.empty(rads.shape[:-2] + (4, 4), dtype=complex)
+        mats[..., :2] = cos * mat[:, :2] - isin * mat[:, 2:]
+        mats[..., 2:] = cos * mat[:, 2:] - isin * mat[:, :2]
+        return mats
 
-        # sandwiched rx gate commutes and can just be multiplied with non-sandwiched part:
-        return mat @ np.kron(
-            np.asarray(qiskit.circuit.library.RXGate(self.sandwich_rx_rads), dtype=dtype),
-            np.eye(2, dtype=dtype),
+    def __array__(self, dtype: Type = None) -> np.ndarray:
+        if not self.sandwich_rx_rads:
+            return _with_dtype(_acecr_unitary(self.polarity), dtype)
+
+        mat = _cached_unitary(
+            self,
+            (self.polarity, self.sandwich_rx_rads),
+            lambda: AceCR.batch_unitaries(self.polarity, self.sandwich_rx_rads),
         )
+        return _with_dtype(mat, dtype)
 
     def __repr__(self) -> str:
         args = f"'{self.polarity}'"
@@ -122,16 +200,28 @@ class ZZSwapGate(qiskit.circuit.Gate):
         qc.cx(0, 1)
         self.definition = qc
 
+    @staticmethod
+    def batch_unitaries(thetas: Union[float, Sequence[float], np.ndarray]) -> np.ndarray:
+        """Computes the unitaries of ZZ-SWAP gates with many ZZ-interaction angles at once.
+
+        Args:
+            thetas: an array of ZZ-interaction angles in radians (of any shape).
+
+        Returns:
+            A stack of unitaries with shape `np.shape(thetas) + (4, 4)`, such that each matches
+            the unitary of `ZZSwapGate(theta)` for the corresponding angle.
+        """
+        thetas = np.asarray(thetas, dtype=float)
+        mats = np.zeros(thetas.shape + (4, 4), dtype=complex)
+        mats[..., 0, 0] = mats[..., 3, 3] = 1
+        mats[..., 1, 2] = mats[..., 2, 1] = np.exp(1j * thetas)
+        return mats
+
     def __array__(self, dtype: Type = None) -> np.ndarray:
-        return np.array(
-            [
-                [1, 0, 0, 0],
-                [0, 0, np.exp(1j * self.params[0]), 0],
-                [0, np.exp(1j * self.params[0]), 0, 0],
-                [0, 0, 0, 1],
-            ],
-            dtype=dtype,
+        mat = _cached_unitary(
+            self, tuple(self.params), lambda: ZZSwapGate.batch_unitaries(float(self.params[0]))
         )
+        return _with_dtype(mat, dtype)
 
     def __repr__(self) -> str:
         args = f"{self.params[0]}"
@@ -174,9 +264,56 @@ class ParallelGates(qiskit.circuit.Gate):
             qubits = qubits[num_qubits:]
         self.definition = qc
 
+    def _leaf_gates(self) -> Iterator[qiskit.circuit.Gate]:
+        """Yields the component gates of this gate, expanding any which are ParallelGates."""
+        for gate in self.component_gates:
+            if isinstance(gate, ParallelGates):
+                yield from gate._leaf_gates()
+            else:
+                yield gate
+
+    def apply(self, state: np.ndarray) -> np.ndarray:
+        """Applies this gate to a statevector without forming its (dense) unitary.
+
+        Each component gate's unitary is applied to just the qubits it acts on, so time and memory
+        scale with the size of the statevector (rather than its square), along with the sizes of
+        the component gates' unitaries.
+
+        Args:
+            state: a statevector over this gate's qubits (in qiskit's little-endian ordering), or
+                any array whose first axis has size `2 ** self.num_qubits` (e.g. a matrix, each of
+                whose columns is such a statevector).
+
+        Returns:
+            The transformed state, i.e. `self.to_matrix() @ state`.
+
+        Raises:
+            ValueError: if the state has the wrong size.
+        """
+        state = np.asarray(state)
+        if not state.shape or state.shape[0] != 2**self.num_qubits:
+            raise ValueError(
+                f"State must have size {2 ** self.num_qubits} along its first axis, but its shape "
+                f"is {state.shape}."
+            )
+
+        shape = state.shape
+        num_lower_states = state.size // shape[0]  # i.e. including any additional axes
+        for gate in self._leaf_gates():
+            dim = 2**gate.num_qubits
+            state = gate.to_matrix() @ state.reshape(-1, dim, num_lower_states)
+            num_lower_states *= dim
+        return state.reshape(shape)
+
     def __array__(self, dtype: Type = None) -> np.ndarray:
-        mat = functools.reduce(np.kron, (gate.to_matrix() for gate in self.component_gates[::-1]))
-        return np.asarray(mat, dtype=dtype)
+        def compute() -> np.ndarray:
+            return functools.reduce(
+                np.kron, (gate.to_matrix() for gate in self.component_gates[::-1])
+            )
+
+        # component gates could be modified in place (e.g. when binding parameters)
+        key = tuple(tuple(gate.params) for gate in self.component_gates)
+        return _with_dtype(_cached_unitary(self, key, compute), dtype)
 
     def __str__(self) -> str:
         args = ", ".join(gate.qasm() for gate in self.component_gates)
@@ -207,12 +344,7 @@ class ICCXGate(qiskit.circuit.ControlledGate):
         return ICCXdgGate(ctrl_state=self.ctrl_state)
 
     def __array__(self, dtype: Optional[np.ndarray] = None) -> np.ndarray:
-        mat = qiskit.circuit._utils._compute_control_matrix(
-            self.base_gate.to_matrix(), self.num_ctrl_qubits, ctrl_state=self.ctrl_state
-        )
-        if dtype:
-            return np.asarray(mat, dtype=dtype)
-        return mat
+        return _with_dtype(_iccx_unitary(self.base_gate.params[0], self.ctrl_state), dtype)
 
     def __repr__(self) -> str:
         return f"qiskit_superstaq.ICCXGate(label={self.label}, ctrl_state={self.ctrl_state})"
@@ -248,12 +380,7 @@ class ICCXdgGate(qiskit.circuit.ControlledGate):
         return ICCXGate(ctrl_state=self.ctrl_state)
 
     def __array__(self, dtype: Optional[np.dtype] = None) -> np.ndarray:
-        mat = qiskit.circuit._utils._compute_control_matrix(
-            self.base_gate.to_matrix(), self.num_ctrl_qubits, ctrl_state=self.ctrl_state
-        )
-        if dtype:
-            return np.asarray(mat, dtype=dtype)
-        return mat
+        return _with_dtype(_iccx_unitary(self.base_gate.params[0], self.ctrl_state), dtype)
 
     def __repr__(self) -> str:
         return f"qiskit_superstaq.ICCXdgGate(label={self.label}, ctrl_state={self.ctrl_state})"
@@ -265,29 +392,102 @@ class ICCXdgGate(qiskit.circuit.ControlledGate):
 AQTiToffoliGate = AQTiCCXGate
 
 
+# Constructors of custom gates, which recover them from generic gates (e.g. as deserialized from
+# QPY). Gates are looked up by their names, or (for gates whose names vary) by the names of their
+# definitions. See `register_custom_gate`.
+_CUSTOM_GATES_BY_NAME: Dict[str, Callable[[qiskit.circuit.Gate], qiskit.circuit.Gate]] = {}
+_CUSTOM_GATES_BY_DEFINITION_NAME: Dict[
+    str, Callable[[qiskit.circuit.Gate], qiskit.circuit.Gate]
+] = {}
+
+# standard qiskit gates, which are never custom gates (so their definitions needn't be checked)
+_STANDARD_GATE_NAMES = frozenset(AstInterpreter.standard_extension) | {"measure"}
+
+
+def register_custom_gate(
+    constructor: Callable[[qiskit.circuit.Gate], qiskit.circuit.Gate],
+    name: Optional[str] = None,
+    definition_name: Optional[str] = None,
+) -> None:
+    """Registers a custom gate type, so that it is recovered when circuits are deserialized (see
+    `custom_resolver`).
+
+    Gates registered by `name` are identified by their name alone (so must be fully determined by
+    their name and params), and are serialized under that name. Otherwise gates are identified by
+    `definition_name`, the name of their definitions (i.e. `gate.definition.name`); this allows
+    for gates whose names vary (e.g. with their parameters), or which are renamed during
+    serialization to distinguish non-equivalent gates sharing a name.
+
+    For example, a downstream package could register its own native gate with:
+
+    .. code-block:: python
+
+        qss.custom_gates.register_custom_gate(
+            lambda gate: MyGate(*gate.params, label=gate.label), definition_name="my_gate"
+        )
+
+    Registering a constructor under an existing name replaces the previous one.
+
+    Args:
+        constructor: a function returning the custom gate represented by a given generic gate
+            (which has the same name, params, label and definition).
+        name: the name of gates of this type.
+        definition_name: the name of the definitions of gates of this type.
+
+    Raises:
+        ValueError: if neither (or both) of `name` and `definition_name` are provided.
+    """
+    if (name is None) == (definition_name is None):
+        raise ValueError("Exactly one of name and definition_name must be provided.")
+
+    if name is not None:
+        _CUSTOM_GATES_BY_NAME[name] = constructor
+    if definition_name is not None:
+        _CUSTOM_GATES_BY_DEFINITION_NAME[definition_name] = constructor
+
+
 def custom_resolver(gate: qiskit.circuit.Gate) -> Optional[qiskit.circuit.Gate]:
-    """Recover a custom gate type from a generic qiskit.circuit.Gate. Resolution is done using
-    gate.definition.name rather than gate.name, as the former is set by all qiskit_superstaq
-    custom gates and the latter may be modified by calls such as QuantumCircuit.qasm()
+    """Recover a custom gate type from a generic qiskit.circuit.Gate.
+
+    Custom gate types are looked up in the registry (see `register_custom_gate`) by gate.name, or
+    else by gate.definition.name, as the latter is set by all qiskit_superstaq custom gates and
+    the former may be modified by calls such as QuantumCircuit.qasm(). Standard gates are rejected
+    without building their definitions.
     """
+    constructor = _CUSTOM_GATES_BY_NAME.get(gate.name)
+    if constructor is not None:
+        return constructor(gate)
 
-    if gate.definition is None:
+    if gate.name in _STANDARD_GATE_NAMES or gate.definition is None:
         return None
-    if gate.definition.name == "acecr_pm":
-        return AceCR("+-", label=gate.label)
-    if gate.definition.name == "acecr_mp":
-        return AceCR("-+", label=gate.label)
-    if gate.definition.name == "zzswap":
-        return ZZSwapGate(gate.params[0], label=gate.label)
-    if gate.definition.name == "parallel_gates":
-        component_gates = [custom_resolver(inst) or inst for inst, _, _ in gate.definition]
-        return ParallelGates(*component_gates, label=gate.label)
-    if gate.name == "iccx":
-        return ICCXGate(label=gate.label)
-    if gate.name == "iccx_o0":
-        return AQTiCCXGate(label=gate.label)
-    if gate.name == "iccx_o1":
-        return ICCXGate(label=gate.label, ctrl_state="01")
-    if gate.name == "iccx_o2":
-        return ICCXGate(label=gate.label, ctrl_state="10")
+
+    constructor = _CUSTOM_GATES_BY_DEFINITION_NAME.get(gate.definition.name)
+    if constructor is not None:
+        return constructor(gate)
+
     return None
+
+
+register_custom_gate(lambda gate: AceCR("+-", label=gate.label), definition_name="acecr_pm")
+register_custom_gate(lambda gate: AceCR("-+", label=gate.label), definition_name="acecr_mp")
+register_custom_gate(
+    lambda gate: AceCR("+-", sandwich_rx_rads=gate.params[0], label=gate.label),
+    definition_name="acecr_pm_rx",
+)
+register_custom_gate(
+    lambda gate: AceCR("-+", sandwich_rx_rads=gate.params[0], label=gate.label),
+    definition_name="acecr_mp_rx",
+)
+register_custom_gate(
+    lambda gate: ZZSwapGate(gate.params[0], label=gate.label), definition_name="zzswap"
+)
+register_custom_gate(
+    lambda gate: ParallelGates(
+        *[custom_resolver(inst) or inst for inst, _, _ in gate.definition], label=gate.label
+    ),
+    definition_name="parallel_gates",
+)
+register_custom_gate(lambda gate: ICCXGate(label=gate.label), name="iccx")
+register_custom_gate(lambda gate: AQTiCCXGate(label=gate.label), name="iccx_o0")
+register_custom_gate(lambda gate: ICCXGate(label=gate.label, ctrl_state="01"), name="iccx_o1")
+register_custom_gate(lambda gate: ICCXGate(label=gate.label, ctrl_state="10"), name="iccx_o2")
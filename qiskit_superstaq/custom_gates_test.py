@@ -1,4 +1,5 @@
-from typing import Set
+from typing import List, Optional, Set
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -110,6 +111,42 @@ def test_parallel_gates() -> None:
         _ = qiskit_superstaq.ParallelGates(qiskit.circuit.Measure())
 
 
+def test_parallel_gates_apply() -> None:
+    gate = qiskit_superstaq.ParallelGates(
+        qiskit.circuit.library.RXGate(1.23),
+        qiskit_superstaq.ParallelGates(
+            qiskit_superstaq.AceCR("+-"), qiskit.circuit.library.HGate()
+        ),
+        qiskit_superstaq.ZZSwapGate(4.56),
+        qiskit.circuit.library.CCXGate(),
+    )
+    assert gate.num_qubits == 9
+
+    rng = np.random.default_rng(0)
+    state = rng.normal(size=2**9) + 1j * rng.normal(size=2**9)
+    assert np.allclose(gate.apply(state), gate.to_matrix() @ state)
+    assert np.allclose(
+        gate.apply(state), qiskit.quantum_info.Statevector(state).evolve(gate.definition).data
+    )
+
+    # also applies to each column of a matrix
+    mat = rng.normal(size=(2**9, 3))
+    assert np.allclose(gate.apply(mat), gate.to_matrix() @ mat)
+    assert np.allclose(gate.apply(np.eye(2**9)), gate.to_matrix())
+
+    # large gates can be applied without forming their unitaries
+    gate = qiskit_superstaq.ParallelGates(*[qiskit.circuit.library.HGate()] * 20)
+    with mock.patch.object(qiskit_superstaq.ParallelGates, "__array__") as mock_array:
+        state = gate.apply(np.eye(2**20, 1))
+        mock_array.assert_not_called()
+    assert np.allclose(state, 2**-10)
+
+    with pytest.raises(ValueError, match="State must have size 1048576"):
+        _ = gate.apply(np.ones(2**19))
+    with pytest.raises(ValueError, match="State must have size"):
+        _ = gate.apply(np.array(1))
+
+
 def test_aqticcx() -> None:
     gate = qiskit_superstaq.AQTiCCXGate()
     _check_gate_definition(gate)
@@ -144,9 +181,89 @@ def test_iccxdg() -> None:
     assert str(gate) == "ICCXdgGate(label=None, ctrl_state=3)"
 
 
+def test_cached_unitaries() -> None:
+    # unitaries of parameter-free gates are shared between instances
+    for gate_type in [
+        lambda: qiskit_superstaq.AceCR("+-"),
+        lambda: qiskit_superstaq.AQTiCCXGate(),
+        lambda: qiskit_superstaq.custom_gates.ICCXGate(ctrl_state="01"),
+        lambda: qiskit_superstaq.custom_gates.ICCXdgGate(),
+    ]:
+        mat = np.asarray(gate_type())
+        assert np.asarray(gate_type()) is mat
+        assert not mat.flags.writeable
+
+    # unitaries of parameterized gates are cached per instance
+    rx_gate = qiskit.circuit.library.RXGate(1.2)
+    gates: List[qiskit.circuit.Gate] = [
+        qiskit_superstaq.AceCR("-+", sandwich_rx_rads=1.2),
+        qiskit_superstaq.ZZSwapGate(1.2),
+        qiskit_superstaq.ParallelGates(rx_gate, qiskit_superstaq.ZZSwapGate(3.4)),
+    ]
+    for gate in gates:
+        mat = np.asarray(gate)
+        assert np.asarray(gate) is mat
+        assert gate.to_matrix() is mat
+        assert not mat.flags.writeable
+        with pytest.raises(ValueError, match="read-only"):
+            mat[0, 0] = 0
+
+        mat_64 = np.asarray(gate, dtype=np.complex64)
+        assert mat_64.dtype == np.complex64
+        assert not mat_64.flags.writeable
+        assert np.allclose(mat_64, mat)
+
+    # but are recomputed if the gates' parameters change
+    gate = qiskit_superstaq.ZZSwapGate(1.2)
+    _ = gate.to_matrix()
+    gate.params = [3.4]
+    assert np.allclose(gate.to_matrix(), qiskit_superstaq.ZZSwapGate(3.4).to_matrix())
+
+    parallel_gates = qiskit_superstaq.ParallelGates(rx_gate, qiskit_superstaq.ZZSwapGate(3.4))
+    _ = parallel_gates.to_matrix()
+    rx_gate.params = [5.6]
+    expected_mat = np.kron(
+        qiskit_superstaq.ZZSwapGate(3.4).to_matrix(), qiskit.circuit.library.RXGate(5.6).to_matrix()
+    )
+    assert np.allclose(parallel_gates.to_matrix(), expected_mat)
+
+
+def test_batch_unitaries() -> None:
+    thetas = np.linspace(-2 * np.pi, 2 * np.pi, 101)
+
+    zzswap_mats = qiskit_superstaq.ZZSwapGate.batch_unitaries(thetas)
+    assert zzswap_mats.shape == (101, 4, 4)
+    for theta, mat in zip(thetas, zzswap_mats):
+        assert np.array_equal(mat, qiskit_superstaq.ZZSwapGate(theta).to_matrix())
+
+    for polarity in ["+-", "-+"]:
+        acecr_mats = qiskit_superstaq.AceCR.batch_unitaries(polarity, thetas)
+        assert acecr_mats.shape == (101, 4, 4)
+        for theta, mat in zip(thetas, acecr_mats):
+            gate = qiskit_superstaq.AceCR(polarity, sandwich_rx_rads=theta)
+            assert np.array_equal(mat, gate.to_matrix())
+            assert np.allclose(mat, qiskit.quantum_info.Operator(gate.definition).data)
+
+    # arbitrary shapes are supported
+    assert qiskit_superstaq.ZZSwapGate.batch_unitaries(1.2).shape == (4, 4)
+    assert qiskit_superstaq.AceCR.batch_unitaries("+-", np.array([[1.2, 3.4]])).shape == (
+        1,
+        2,
+        4,
+        4,
+    )
+    assert np.array_equal(
+        qiskit_superstaq.AceCR.batch_unitaries("-+", 0), qiskit_superstaq.AceCR("-+").to_matrix()
+    )
+
+    with pytest.raises(ValueError, match="Polarity must be"):
+        _ = qiskit_superstaq.AceCR.batch_unitaries("++", thetas)
+
+
 def test_custom_resolver() -> None:
     gates = [
         qiskit_superstaq.AceCR("+-"),
+        qiskit_superstaq.AceCR("-+", sandwich_rx_rads=1.23),
         qiskit_superstaq.ZZSwapGate(1.23),
         qiskit_superstaq.AQTiCCXGate(),
         qiskit_superstaq.custom_gates.ICCXGate(),
@@ -167,3 +284,68 @@ def test_custom_resolver() -> None:
 
     assert qiskit_superstaq.custom_gates.custom_resolver(qiskit.circuit.library.CXGate()) is None
     assert qiskit_superstaq.custom_gates.custom_resolver(qiskit.circuit.library.RXGate(2)) is None
+
+    # names may have suffixes appended (e.g. during serialization)
+    renamed_gate = qiskit_superstaq.ZZSwapGate(1.23)
+    renamed_gate.name = "zzswap_1"
+    resolved_gate = qiskit_superstaq.custom_gates.custom_resolver(renamed_gate)
+    assert resolved_gate == qiskit_superstaq.ZZSwapGate(1.23)
+
+    # definitions of gates without a matching resolver are never built
+    with mock.patch("qiskit.circuit.library.CXGate._define") as mock_define:
+        assert (
+            qiskit_superstaq.custom_gates.custom_resolver(qiskit.circuit.library.CXGate()) is None
+        )
+        mock_define.assert_not_called()
+
+    # gates with names matching a custom gate, but which are otherwise unrecognized
+    for name in ["acecr_foo", "zzswap_foo", "parallel_foo", "iccx_foo"]:
+        unknown_gate = qiskit.circuit.Gate(name, 2, [])
+        unknown_gate.definition = qiskit.QuantumCircuit(2, name=name)
+        assert qiskit_superstaq.custom_gates.custom_resolver(unknown_gate) is None
+
+    assert (
+        qiskit_superstaq.custom_gates.custom_resolver(qiskit.circuit.Gate("acecr", 2, [])) is None
+    )
+
+
+class _MyGate(qiskit.circuit.Gate):
+    def __init__(self, theta: float, label: Optional[str] = None) -> None:
+        super().__init__("my_gate", 1, [theta], label=label)
+
+    def _define(self) -> None:
+        qc = qiskit.QuantumCircuit(1, name="my_gate")
+        qc.rx(self.params[0], 0)
+        self.definition = qc
+
+
+def test_register_custom_gate() -> None:
+    with pytest.raises(ValueError, match="Exactly one of"):
+        qiskit_superstaq.custom_gates.register_custom_gate(lambda gate: gate)
+    with pytest.raises(ValueError, match="Exactly one of"):
+        qiskit_superstaq.custom_gates.register_custom_gate(
+            lambda gate: gate, name="my_gate", definition_name="my_gate"
+        )
+
+    gate = qiskit.circuit.Gate("my_gate_1", 1, [1.23], label="label")
+    gate.definition = _MyGate(1.23).definition
+    assert qiskit_superstaq.custom_gates.custom_resolver(gate) is None
+
+    with mock.patch.dict(qiskit_superstaq.custom_gates._CUSTOM_GATES_BY_DEFINITION_NAME):
+        qiskit_superstaq.custom_gates.register_custom_gate(
+            lambda gate: _MyGate(gate.params[0], label=gate.label), definition_name="my_gate"
+        )
+        resolved_gate = qiskit_superstaq.custom_gates.custom_resolver(gate)
+        assert isinstance(resolved_gate, _MyGate)
+        assert resolved_gate == _MyGate(1.23)
+        assert resolved_gate.label == "label"
+
+    assert qiskit_superstaq.custom_gates.custom_resolver(gate) is None
+
+    with mock.patch.dict(qiskit_superstaq.custom_gates._CUSTOM_GATES_BY_NAME):
+        qiskit_superstaq.custom_gates.register_custom_gate(
+            lambda gate: _MyGate(gate.params[0], label=gate.label), name="my_gate_1"
+        )
+        resolved_gate = qiskit_superstaq.custom_gates.custom_resolver(gate)
+        assert isinstance(resolved_gate, _MyGate)
+        assert resolved_gate == _MyGate(1.23)
@@ -0,0 +1,251 @@
+import collections
+import math
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import qiskit
+
+import qiskit_superstaq as qss
+
+# name of the local simulator backend (see `qss.superstaq_provider.SuperstaQProvider.get_backend`)
+LOCAL_SIMULATOR_NAME = "local_simulator"
+
+# instructions which don't affect the state (and are therefore ignored by the simulator)
+_IGNORED_INSTRUCTIONS = {"barrier", "delay", "id"}
+
+_CircuitData = Iterable[Tuple[qiskit.circuit.Instruction, List, List]]
+
+
+def _apply_matrix(state: np.ndarray, mat: np.ndarray, axes: Sequence[int]) -> np.ndarray:
+    """Applies a (little-endian) unitary to the given axes of a statevector tensor.
+
+    Args:
+        state: the statevector, as a tensor with one axis of size 2 per qubit.
+        mat: the unitary to apply.
+        axes: the axes of `state` corresponding to each qubit the unitary acts on (in order).
+
+    Returns:
+        The new statevector tensor.
+    """
+    num_qubits = len(axes)
+    # reshaped unitaries have (big-endian) output axes followed by (big-endian) input axes
+    mat = mat.reshape((2,) * 2 * num_qubits)
+    input_axes = list(range(num_qubits, 2 * num_qubits))
+    big_endian_axes = list(axes)[::-1]
+    state = np.tensordot(mat, state, axes=(input_axes, big_endian_axes))
+    return np.moveaxis(state, list(range(num_qubits)), big_endian_axes)
+
+
+def _apply_zzswap(state: np.ndarray, theta: float, axes: Sequence[int]) -> np.ndarray:
+    """Native ZZSwapGate kernel: swaps two qubits, and then applies a phase to the states in which
+    they differ."""
+    state = np.swapaxes(state, axes[0], axes[1]).copy()
+    phase = np.exp(1j * theta)
+    for bits in [(0, 1), (1, 0)]:
+        index: List[Any] = [slice(None)] * state.ndim
+        index[axes[0]], index[axes[1]] = bits
+        state[tuple(index)] *= phase
+    return state
+
+
+def _apply_gate(state: np.ndarray, gate: qiskit.circuit.Gate, axes: List[int]) -> np.ndarray:
+    """Applies a gate to the given axes of a statevector tensor, using a native kernel where there
+    is one, the gate's unitary if it has one, and otherwise its definition."""
+    if isinstance(gate, qss.ParallelGates):
+        for component_gate in gate._leaf_gates():
+            num_qubits = component_gate.num_qubits
+            state = _apply_gate(state, component_gate, axes[:num_qubits])
+            axes = axes[num_qubits:]
+        return state
+
+    if isinstance(gate, qss.ZZSwapGate):
+        return _apply_zzswap(state, float(gate.params[0]), axes)
+
+    try:
+        mat = gate.to_matrix()
+    except qiskit.circuit.exceptions.CircuitError:
+        if gate.definition is None:
+            raise ValueError(f"The local simulator does not support '{gate.name}'.") from None
+
+        qubit_axes = dict(zip(gate.definition.qubits, axes))
+        state = _evolve(state, gate.definition, qubit_axes)
+        return state * np.exp(1j * float(gate.definition.global_phase))
+
+    return _apply_matrix(state, mat, axes)
+
+
+def _evolve(
+    state: np.ndarray, data: _CircuitData, qubit_axes: Dict[qiskit.circuit.Qubit, int]
+) -> np.ndarray:
+    """Applies a sequence of (unitary) instructions to a statevector tensor.
+
+    Args:
+        state: the statevector, as a tensor with one axis of size 2 per qubit.
+        data: the instructions (and their qubits and clbits) to apply.
+        qubit_axes: the axis of `state` corresponding to each qubit.
+
+    Returns:
+        The new statevector tensor.
+
+    Raises:
+        ValueError: if any of the instructions are non-unitary or classically-conditioned.
+    """
+    for inst, qargs, _ in data:
+        if inst.name in _IGNORED_INSTRUCTIONS:
+            continue
+        if not isinstance(inst, qiskit.circuit.Gate) or inst.condition is not None:
+            raise ValueError(f"The local simulator does not support '{inst.name}'.")
+        state = _apply_gate(state, inst, [qubit_axes[qubit] for qubit in qargs])
+    return state
+
+
+def _simulate(circuit: qiskit.QuantumCircuit, data: _CircuitData) -> np.ndarray:
+    """Computes the statevector produced by applying the given instructions (on the qubits of
+    `circuit`) to the all-zeros state."""
+    state = np.zeros((2,) * circuit.num_qubits, dtype=complex)
+    state.flat[0] = 1
+
+    # tensor axes are big-endian, i.e. qubit i corresponds to axis num_qubits - 1 - i
+    qubit_axes = {qubit: circuit.num_qubits - 1 - i for i, qubit in enumerate(circuit.qubits)}
+    state = _evolve(state, data, qubit_axes)
+    return state.reshape(-1) * np.exp(1j * float(circuit.global_phase))
+
+
+def simulate_statevector(circuit: qiskit.QuantumCircuit) -> np.ndarray:
+    """Computes the final statevector of a (measurement-free) circuit.
+
+    Instructions are applied directly to the statevector (as a tensor with one axis per qubit),
+    with native kernels for `qss.ZZSwapGate` and `qss.ParallelGates`. Other gates are applied via
+    their (cached) unitaries, or else their definitions.
+
+    Args:
+        circuit: the circuit to simulate. Barriers and delays are ignored.
+
+    Returns:
+        The final statevector, in qiskit's (little-endian) ordering.
+
+    Raises:
+        ValueError: if the circuit contains non-unitary (or classically-conditioned) instructions.
+    """
+    return _simulate(circuit, circuit._data)
+
+
+def sample_counts(
+    circuit: qiskit.QuantumCircuit, shots: int, seed: Optional[int] = None
+) -> Dict[str, int]:
+    """Simulates a circuit and samples its (final) measurements.
+
+    Args:
+        circuit: the circuit to simulate, which must end in measurements.
+        shots: the number of samples to take.
+        seed: an optional seed for the random number generator.
+
+    Returns:
+        A dictionary mapping bitstrings (of the circuit's classical bits, in qiskit's little-endian
+        ordering) to the number of times they were measured.
+
+    Raises:
+        ValueError: if the circuit contains no measurements, measurements followed by gates, or any
+            other unsupported instructions.
+    """
+    measurements: Dict[int, int] = {}
+    data = []
+    qubit_indices = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    clbit_indices = {clbit: i for i, clbit in enumerate(circuit.clbits)}
+
+    for inst, qargs, cargs in circuit._data:
+        qubits = [qubit_indices[qubit] for qubit in qargs]
+        if inst.name == "measure" and inst.condition is None:
+            measurements[qubits[0]] = clbit_indices[cargs[0]]
+        elif measurements.keys() & set(qubits) and inst.name not in _IGNORED_INSTRUCTIONS:
+            raise ValueError(
+                "The local simulator only supports measurements at the end of circuits."
+            )
+        else:
+            data.append((inst, qargs, cargs))
+
+    if not measurements:
+        raise ValueError("Circuits run on the local simulator must contain measurements.")
+
+    probabilities = np.abs(_simulate(circuit, data)) ** 2
+    probabilities /= probabilities.sum()
+    samples = np.random.default_rng(seed).multinomial(shots, probabilities)
+
+    counts: Dict[str, int] = collections.Counter()
+    for outcome in np.flatnonzero(samples):
+        bits = ["0"] * circuit.num_clbits
+        for qubit, clbit in measurements.items():
+            bits[clbit] = str((outcome >> qubit) & 1)
+        counts["".join(reversed(bits))] += int(samples[outcome])
+    return dict(counts)
+
+
+class LocalSimulatorBackend(qss.superstaq_backend.SuperstaQBackend):
+    """A statevector simulator supporting SuperstaQ's custom gates, which runs circuits locally
+    with the same interface as (remote) SuperstaQ backends.
+
+    Typical usage is:
+
+    .. code-block:: python
+
+        backend = ss_provider.get_backend("local_simulator")
+        job = backend.run(circuits, shots=100)
+        counts = job.result().get_counts()
+
+    Simulation happens as soon as circuits are run, with results available immediately from the
+    returned job (so that no requests are ever made to the SuperstaQ server). Results are sampled
+    using the "seed_simulator" option (if set).
+
+    Args:
+        provider: the provider this backend was obtained from.
+    """
+
+    def __init__(self, provider: "qss.superstaq_provider.SuperstaQProvider") -> None:
+        super().__init__(provider, provider.remote_host, LOCAL_SIMULATOR_NAME)
+        self.configuration_dict.update(local=True, simulator=True)
+        self._configuration = qiskit.providers.models.BackendConfiguration.from_dict(
+            self.configuration_dict
+        )
+        self._configuration_expiry = math.inf  # there is no remote target metadata to fetch
+
+    @classmethod
+    def _default_options(cls) -> qiskit.providers.Options:
+        options = super()._default_options()
+        options.update_options(seed_simulator=None)
+        return options
+
+    def run(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        shots: int,
+        ibmq_pulse: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> "LocalSimulatorJob":
+        if isinstance(circuits, qiskit.QuantumCircuit):
+            circuits = [circuits]
+
+        rng = np.random.default_rng(self.options.seed_simulator)
+        results = {}
+        for circuit in circuits:
+            seed = rng.integers(2**63)
+            counts = sample_counts(circuit, shots, seed)
+            results[str(uuid.uuid4())] = {"status": "Done", "samples": counts, "shots": shots}
+
+        return LocalSimulatorJob(self, results)
+
+
+class LocalSimulatorJob(qss.superstaq_job.SuperstaQJob):
+    """A job run on the local simulator, whose results are known from the start.
+
+    Args:
+        backend: the local simulator which ran the job.
+        results: the result dictionary of each circuit, keyed by (sub-)job id.
+    """
+
+    def __init__(self, backend: LocalSimulatorBackend, results: Dict[str, Dict]) -> None:
+        super().__init__(backend, ",".join(results))
+        self._results = results
+
+    def _fetch_jobs(self, job_ids: List[str], max_workers: Optional[int] = None) -> Dict[str, Dict]:
+        return {job_id: self._results[job_id] for job_id in job_ids}
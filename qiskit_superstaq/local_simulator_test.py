@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+import qiskit
+
+import qiskit_superstaq as qss
+
+
+def _custom_gate_circuit() -> qiskit.QuantumCircuit:
+    subcircuit = qiskit.QuantumCircuit(2, global_phase=0.1)
+    subcircuit.h(0)
+    subcircuit.append(qss.ZZSwapGate(0.2), [1, 0])
+    opaque_gate = subcircuit.to_gate()
+
+    circuit = qiskit.QuantumCircuit(5, global_phase=0.3)
+    circuit.h(range(5))
+    circuit.append(qss.AceCR("+-", sandwich_rx_rads=0.4), [3, 1])
+    circuit.append(qss.ZZSwapGate(0.5), [4, 0])
+    circuit.barrier()
+    circuit.append(qss.AQTiCCXGate(), [2, 0, 4])
+    circuit.append(
+        qss.ParallelGates(
+            qiskit.circuit.library.RXGate(0.6),
+            qss.ParallelGates(qss.ZZSwapGate(0.7), qss.AceCR("-+")),
+        ),
+        [1, 4, 0, 2, 3],
+    )
+    circuit.append(opaque_gate, [0, 3])
+    circuit.id(2)
+    circuit.cx(3, 2)
+    return circuit
+
+
+def test_simulate_statevector() -> None:
+    circuit = _custom_gate_circuit()
+    expected_state = qiskit.quantum_info.Statevector(circuit).data
+    assert np.allclose(qss.local_simulator.simulate_statevector(circuit), expected_state)
+
+    assert np.allclose(
+        qss.local_simulator.simulate_statevector(qiskit.QuantumCircuit(2)), [1, 0, 0, 0]
+    )
+
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.reset(0)
+    with pytest.raises(ValueError, match="does not support 'reset'"):
+        _ = qss.local_simulator.simulate_statevector(circuit)
+
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.append(qiskit.circuit.Gate("opaque", 1, []), [0])
+    with pytest.raises(ValueError, match="does not support 'opaque'"):
+        _ = qss.local_simulator.simulate_statevector(circuit)
+
+    circuit = qiskit.QuantumCircuit(1, 1)
+    circuit.x(0).c_if(circuit.cregs[0], 1)
+    with pytest.raises(ValueError, match="does not support 'x'"):
+        _ = qss.local_simulator.simulate_statevector(circuit)
+
+
+def test_sample_counts() -> None:
+    circuit = qiskit.QuantumCircuit(3, 3)
+    circuit.h(0)
+    circuit.cx(0, 2)
+    circuit.measure(0, 1)
+    circuit.barrier()
+    circuit.measure(2, 2)
+
+    counts = qss.local_simulator.sample_counts(circuit, 1000, seed=123)
+    assert counts.keys() == {"000", "110"}
+    assert sum(counts.values()) == 1000
+    assert 400 < counts["000"] < 600
+    assert qss.local_simulator.sample_counts(circuit, 1000, seed=123) == counts
+
+    circuit = _custom_gate_circuit()
+    circuit.add_register(qiskit.ClassicalRegister(5))
+    circuit.measure(range(5), range(5))
+    counts = qss.local_simulator.sample_counts(circuit, 100000, seed=123)
+
+    probabilities = qiskit.quantum_info.Statevector(circuit.remove_final_measurements(False))
+    for bitstring, probability in probabilities.probabilities_dict().items():
+        assert abs(counts.get(bitstring, 0) / 100000 - probability) < 0.01
+
+    circuit = qiskit.QuantumCircuit(1, 1)
+    circuit.h(0)
+    with pytest.raises(ValueError, match="must contain measurements"):
+        _ = qss.local_simulator.sample_counts(circuit, 100)
+
+    circuit.measure(0, 0)
+    circuit.h(0)
+    with pytest.raises(ValueError, match="only supports measurements at the end"):
+        _ = qss.local_simulator.sample_counts(circuit, 100)
+
+
+def test_local_simulator_backend() -> None:
+    ss_provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
+    backend = ss_provider.get_backend("local_simulator")
+    assert isinstance(backend, qss.local_simulator.LocalSimulatorBackend)
+    assert backend.name() == "local_simulator"
+    assert backend.configuration().local
+    assert backend.configuration().simulator
+    assert backend == qss.local_simulator.LocalSimulatorBackend(ss_provider)
+    assert backend.options.seed_simulator is None
+
+    circuit1 = qiskit.QuantumCircuit(2, 2)
+    circuit1.h(0)
+    circuit1.append(qss.ZZSwapGate(1.23), [0, 1])
+    circuit1.measure([0, 1], [0, 1])
+
+    circuit2 = qiskit.QuantumCircuit(3, 3)
+    circuit2.x(0)
+    circuit2.x(1)
+    circuit2.append(qss.AQTiCCXGate(), [0, 1, 2])
+    circuit2.measure([0, 1, 2], [0, 1, 2])
+
+    backend.set_options(seed_simulator=1234)
+    job = backend.run([circuit1, circuit2], shots=100)
+    assert isinstance(job, qss.local_simulator.LocalSimulatorJob)
+    assert job.status() == qiskit.providers.jobstatus.JobStatus.DONE
+
+    result = job.result()
+    assert isinstance(result, qiskit.result.Result)
+    assert result.backend_name == "local_simulator"
+    assert result.job_id == job.job_id()
+    assert len(job.job_id().split(",")) == 2
+
+    counts1, counts2 = result.get_counts()
+    assert counts1.keys() == {"00", "10"}
+    assert sum(counts1.values()) == 100
+    assert counts2 == {"011": 100}
+
+    assert backend.run(circuit1, shots=100).result().get_counts() == counts1
@@ -0,0 +1,98 @@
+import abc
+import random
+from typing import Dict, Optional
+
+
+class PollingStrategy(abc.ABC):
+    """Decides how long a SuperstaQJob waits between successive rounds of polling its sub-jobs."""
+
+    @abc.abstractmethod
+    def next_delay(self, num_polls: int, pending_jobs: Dict[str, Dict]) -> float:
+        """Returns the number of seconds to wait before the next round of polling.
+
+        Args:
+            num_polls: the number of polling rounds made so far (starting from 1).
+            pending_jobs: the most recent result dictionary returned by the server for each
+                unfinished sub-job, keyed by job id.
+        """
+
+
+class FixedInterval(PollingStrategy):
+    """Polls at a fixed interval.
+
+    Args:
+        interval: number of seconds to wait between rounds of polling.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+
+    def next_delay(self, num_polls: int, pending_jobs: Dict[str, Dict]) -> float:
+        return self.interval
+
+    def __repr__(self) -> str:
+        return f"qiskit_superstaq.polling.FixedInterval({self.interval!r})"
+
+
+class ExponentialBackoff(PollingStrategy):
+    """Polls quickly at first and then increasingly rarely, so that fast (e.g. simulator) jobs are
+    picked up promptly while long-queued jobs aren't polled more often than necessary.
+
+    The nth delay is `min_interval * multiplier ** (n - 1)`, randomly perturbed by up to
+    `jitter` (as a fraction of the delay) and clipped to `[min_interval, max_interval]`.
+
+    Args:
+        min_interval: the shortest delay between rounds of polling, in seconds.
+        max_interval: the longest delay between rounds of polling, in seconds.
+        multiplier: factor by which the delay grows after every round.
+        jitter: maximum relative random perturbation of each delay, which keeps many jobs from
+            polling the server in lockstep.
+        queue_position_interval: if set, the (approximate) number of seconds each job ahead of
+            ours in the queue takes. When the server reports a "queue_position" for the pending
+            sub-jobs, the delay is extended to at least the expected time for the queue ahead of
+            the first of them to clear.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.5,
+        max_interval: float = 60.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.25,
+        queue_position_interval: Optional[float] = None,
+    ) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Polling intervals must satisfy 0 < min_interval <= max_interval")
+        if multiplier < 1:
+            raise ValueError("Backoff multiplier must be at least 1")
+        if not 0 <= jitter < 1:
+            raise ValueError("Jitter must be in the range [0, 1)")
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.queue_position_interval = queue_position_interval
+
+    def next_delay(self, num_polls: int, pending_jobs: Dict[str, Dict]) -> float:
+        # cap the exponent so the delay can't overflow for (very) long-running jobs
+        delay = self.min_interval * self.multiplier ** min(num_polls - 1, 64)
+
+        if self.queue_position_interval is not None:
+            queue_positions = [
+                job["queue_position"]
+                for job in pending_jobs.values()
+                if job.get("queue_position") is not None
+            ]
+            if queue_positions:
+                delay = max(delay, min(queue_positions) * self.queue_position_interval)
+
+        delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return min(max(delay, self.min_interval), self.max_interval)
+
+    def __repr__(self) -> str:
+        return (
+            f"qiskit_superstaq.polling.ExponentialBackoff(min_interval={self.min_interval!r}, "
+            f"max_interval={self.max_interval!r}, multiplier={self.multiplier!r}, "
+            f"jitter={self.jitter!r}, queue_position_interval={self.queue_position_interval!r})"
+        )
@@ -0,0 +1,66 @@
+from typing import Dict
+
+import pytest
+
+import qiskit_superstaq as qss
+
+
+def test_fixed_interval() -> None:
+    strategy = qss.polling.FixedInterval(2.5)
+    assert strategy.next_delay(1, {}) == 2.5
+    assert strategy.next_delay(100, {"job_id": {"status": "Queued"}}) == 2.5
+    assert repr(strategy) == "qiskit_superstaq.polling.FixedInterval(2.5)"
+
+
+def test_exponential_backoff() -> None:
+    strategy = qss.polling.ExponentialBackoff(0.5, 10, multiplier=3, jitter=0)
+    assert [strategy.next_delay(n, {}) for n in range(1, 6)] == [0.5, 1.5, 4.5, 10, 10]
+
+    # very long-running jobs don't overflow the delay computation
+    assert strategy.next_delay(10000, {}) == 10
+
+    assert repr(strategy) == (
+        "qiskit_superstaq.polling.ExponentialBackoff(min_interval=0.5, max_interval=10, "
+        "multiplier=3, jitter=0, queue_position_interval=None)"
+    )
+
+
+def test_exponential_backoff_jitter() -> None:
+    strategy = qss.polling.ExponentialBackoff(1, 100, multiplier=2, jitter=0.5)
+    delays = [strategy.next_delay(4, {}) for _ in range(100)]
+    assert all(4 <= delay <= 12 for delay in delays)
+    assert len(set(delays)) > 1
+
+    # jittered delays are still clipped to the allowed range
+    assert all(1 <= strategy.next_delay(1, {}) <= 1.5 for _ in range(100))
+
+
+def test_exponential_backoff_queue_position() -> None:
+    strategy = qss.polling.ExponentialBackoff(1, 60, jitter=0, queue_position_interval=2)
+    pending_jobs: Dict[str, Dict] = {
+        "job1": {"status": "Queued", "queue_position": 10},
+        "job2": {"status": "Queued", "queue_position": 4},
+        "job3": {"status": "Running", "queue_position": None},
+        "job4": {"status": "Running"},
+    }
+
+    # the delay is extended to the expected time for the shortest queue to clear
+    assert strategy.next_delay(1, pending_jobs) == 8
+    assert strategy.next_delay(5, pending_jobs) == 16
+    assert strategy.next_delay(1, {"job1": {"status": "Queued", "queue_position": 100}}) == 60
+    assert strategy.next_delay(1, {"job4": {"status": "Running"}}) == 1
+
+    # queue positions are ignored without a `queue_position_interval`
+    strategy = qss.polling.ExponentialBackoff(1, 60, jitter=0)
+    assert strategy.next_delay(1, pending_jobs) == 1
+
+
+def test_exponential_backoff_validation() -> None:
+    with pytest.raises(ValueError, match="Polling intervals"):
+        _ = qss.polling.ExponentialBackoff(min_interval=0)
+    with pytest.raises(ValueError, match="Polling intervals"):
+        _ = qss.polling.ExponentialBackoff(min_interval=2, max_interval=1)
+    with pytest.raises(ValueError, match="multiplier"):
+        _ = qss.polling.ExponentialBackoff(multiplier=0.5)
+    with pytest.raises(ValueError, match="Jitter"):
+        _ = qss.polling.ExponentialBackoff(jitter=1)
@@ -1,14 +1,130 @@
+import base64
+import binascii
+import concurrent.futures
+import contextlib
+import copy
 import io
+import struct
 import warnings
-from typing import Dict, List, Set, Tuple, Union
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
-import applications_superstaq
+import numpy as np
 import qiskit
 import qiskit.circuit.qpy_serialization
-from qiskit.converters.ast_to_dag import AstInterpreter
 
 import qiskit_superstaq
 
+# smallest batch of circuits `serialize_circuits` will split across multiple processes
+PARALLEL_SERIALIZATION_THRESHOLD = 256
+
+# approximate number of bytes base64-encoded or -decoded at a time (i.e. held in memory at once)
+_BASE64_CHUNK_SIZE = 2**20
+
+
+def _copy_with_data(
+    circuit: qiskit.QuantumCircuit,
+    data: List[Tuple[qiskit.circuit.Instruction, List, List]],
+    parameter_table: qiskit.circuit.parametertable.ParameterTable,
+) -> qiskit.QuantumCircuit:
+    """Copies a circuit like `qiskit.QuantumCircuit.copy`, but with new instruction data (and a
+    corresponding parameter table) in place of deep copies of all of its instructions.
+
+    Args:
+        circuit: the qiskit.QuantumCircuit to copy.
+        data: the instructions (and their qubits and clbits) of the copy.
+        parameter_table: the parameter table of the copy, referring to instructions in `data`.
+
+    Returns:
+        The new circuit.
+    """
+    new_circuit = copy.copy(circuit)
+    new_circuit.qregs = circuit.qregs.copy()
+    new_circuit.cregs = circuit.cregs.copy()
+    new_circuit._qubits = circuit._qubits.copy()
+    new_circuit._clbits = circuit._clbits.copy()
+    new_circuit._qubit_set = circuit._qubit_set.copy()
+    new_circuit._clbit_set = circuit._clbit_set.copy()
+    new_circuit._data = data
+    new_circuit._parameter_table = parameter_table
+    new_circuit._parameters = None
+    new_circuit._calibrations = copy.deepcopy(circuit._calibrations)
+    new_circuit._metadata = copy.deepcopy(circuit._metadata)
+    return new_circuit
+
+
+def _inst_fingerprint(
+    inst: qiskit.circuit.Instruction,
+    qiskit_gates: AbstractSet[str],
+    fingerprints: Dict[int, Hashable],
+) -> Hashable:
+    """Computes a hashable fingerprint of an instruction, such that equal instructions (almost
+    always) have equal fingerprints. Fingerprints are keyed on everything `Instruction.__eq__`
+    compares: the instruction's type, name, size, parameters and (for custom instructions) its
+    definition.
+
+    Args:
+        inst: the instruction to fingerprint.
+        qiskit_gates: names of the standard qiskit gates, whose definitions are fully determined by
+            their names and parameters (and are therefore not fingerprinted).
+        fingerprints: fingerprints which have already been computed, keyed by instruction id().
+            Updated in place.
+
+    Returns:
+        The fingerprint of the instruction.
+    """
+    if id(inst) in fingerprints:
+        return fingerprints[id(inst)]
+
+    def param_key(param: Any) -> Hashable:
+        if isinstance(param, qiskit.circuit.Instruction):
+            return _inst_fingerprint(param, qiskit_gates, fingerprints)
+        if isinstance(param, np.ndarray):
+            return (param.dtype.str, param.shape, param.tobytes())
+        if isinstance(param, (list, tuple)):
+            return tuple(param_key(p) for p in param)
+        return param
+
+    definition_key: Hashable = None
+    if inst.name not in qiskit_gates and inst.definition is not None:
+        bit_indices = {bit: index for index, bit in enumerate(inst.definition.qubits)}
+        bit_indices.update({bit: index for index, bit in enumerate(inst.definition.clbits)})
+        definition_key = (
+            param_key(inst.definition.global_phase),
+            tuple(
+                (
+                    _inst_fingerprint(sub_inst, qiskit_gates, fingerprints),
+                    tuple(bit_indices[bit] for bit in qargs),
+                    tuple(bit_indices[bit] for bit in cargs),
+                )
+                for sub_inst, qargs, cargs in inst.definition
+            ),
+        )
+
+    fingerprint = (
+        type(inst),
+        inst.name,
+        inst.num_qubits,
+        inst.num_clbits,
+        tuple(param_key(param) for param in inst.params),
+        definition_key,
+    )
+    fingerprints[id(inst)] = fingerprint
+    return fingerprint
+
 
 def _assign_unique_inst_names(circuit: qiskit.QuantumCircuit) -> qiskit.QuantumCircuit:
     """QPY requires unique custom gates to have unique `.name` attributes (including parameterized
@@ -17,65 +133,305 @@ def _assign_unique_inst_names(circuit: qiskit.QuantumCircuit) -> qiskit.QuantumC
     name of any custom instruction which shares a name with a non-equivalent prior instruction in
     the circuit.
 
+    Equivalent instructions are found via an index of instruction fingerprints (see
+    `_inst_fingerprint`), so each instruction is only compared (for equality) against prior
+    instructions with the same fingerprint.
+
+    The input circuit is never modified. If no instructions need to be renamed it is returned
+    as-is; otherwise only the renamed instructions are copied (with all others shared between the
+    input and output circuits).
+
     Args:
         circuit: qiskit.QuantumCircuit to be rewritten
 
     Returns:
-        A copy of the input circuit with unique custom instruction names
+        The input circuit, or a copy of it with unique custom instruction names
     """
 
-    unique_insts_by_name: Dict[str, List[qiskit.circuit.Instruction]] = {}
-    insts_to_update: List[Tuple[int, int]] = []
+    num_unique_insts_by_name: Dict[str, int] = {}
+    unique_insts_by_fingerprint: Dict[Hashable, List[Tuple[qiskit.circuit.Instruction, int]]] = {}
+    insts_to_update: List[Tuple[qiskit.circuit.Instruction, int]] = []
     unique_inst_ids: Set[int] = set()
+    fingerprints: Dict[int, Hashable] = {}
 
-    qiskit_gates = set(AstInterpreter.standard_extension) | {"measure"}
+    qiskit_gates = qiskit_superstaq.custom_gates._STANDARD_GATE_NAMES
+    # custom gates registered by name are resolved from just their names (and params), so they can
+    # share names even if they aren't equivalent
+    named_custom_gates = qiskit_superstaq.custom_gates._CUSTOM_GATES_BY_NAME
 
-    new_circuit = circuit.copy()
-    for inst, _, _ in new_circuit:
-        if inst.name in qiskit_gates or id(inst) in unique_inst_ids:
+    for inst, _, _ in circuit._data:
+        if inst.name in qiskit_gates or inst.name in named_custom_gates:
+            continue
+        if id(inst) in unique_inst_ids:
             continue
 
         # save id() in case instruction instance is used more than once
         unique_inst_ids.add(id(inst))
 
-        if inst.name in unique_insts_by_name:
-            index = 0
-            for other in unique_insts_by_name[inst.name]:
-                # compare qasm strings first because equality checking is very slow
-                if inst.qasm() == other.qasm() and inst == other:
-                    break
-                index += 1
-
-            if index == len(unique_insts_by_name[inst.name]):
-                unique_insts_by_name[inst.name].append(inst)
-            if index > 0:
-                insts_to_update.append((inst, index))
-        else:
-            unique_insts_by_name[inst.name] = [inst]
+        fingerprint = _inst_fingerprint(inst, qiskit_gates, fingerprints)
+        candidates = unique_insts_by_fingerprint.setdefault(fingerprint, [])
+
+        # equality checking is very slow, so only do it for instructions with matching fingerprints
+        index = next((index for other, index in candidates if inst == other), -1)
+        if index < 0:
+            index = num_unique_insts_by_name.get(inst.name, 0)
+            num_unique_insts_by_name[inst.name] = index + 1
+            candidates.append((inst, index))
+        if index > 0:
+            insts_to_update.append((inst, index))
 
+    if not insts_to_update:
+        return circuit
+
+    renamed_insts: Dict[int, qiskit.circuit.Instruction] = {}
     for inst, index in insts_to_update:
-        inst.name += f"_{index}"
+        renamed_insts[id(inst)] = copy.copy(inst)
+        renamed_insts[id(inst)].name += f"_{index}"
 
-    return new_circuit
+    data = [
+        (renamed_insts.get(id(inst), inst), qargs, cargs) for inst, qargs, cargs in circuit._data
+    ]
+    parameter_table = qiskit.circuit.parametertable.ParameterTable(
+        {
+            param: [
+                (renamed_insts.get(id(inst), inst), param_index)
+                for inst, param_index in circuit._parameter_table[param]
+            ]
+            for param in circuit._parameter_table
+        }
+    )
+    return _copy_with_data(circuit, data, parameter_table)
+
+
+class _Base64Writer(io.RawIOBase):
+    """Writable file object which incrementally base64-encodes everything written to it.
+
+    The output is identical to `applications_superstaq.converters._bytes_to_str` applied to all of
+    the written bytes, but encoding happens in chunks of (roughly) `chunk_size` bytes as they are
+    written, so the raw bytes are never held in memory all at once.
+    """
+
+    def __init__(self, chunk_size: int = _BASE64_CHUNK_SIZE) -> None:
+        super().__init__()
+        # base64.encodebytes() encodes 57 bytes per (76-character) line
+        self._chunk_size = max(57, chunk_size - chunk_size % 57)
+        self._buffer = bytearray()
+        self._encoded_chunks: List[str] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._buffer += data
+        if len(self._buffer) >= self._chunk_size:
+            num_bytes = len(self._buffer) - len(self._buffer) % self._chunk_size
+            self._encoded_chunks.append(base64.encodebytes(self._buffer[:num_bytes]).decode())
+            del self._buffer[:num_bytes]
+        return len(data)
+
+    def getvalue(self) -> str:
+        """Returns the base64 encoding of everything written so far."""
+        if self._buffer:
+            self._encoded_chunks.append(base64.encodebytes(self._buffer).decode())
+            self._buffer.clear()
+        return "".join(self._encoded_chunks)
+
+
+class _Base64Reader(io.RawIOBase):
+    """Readable file object which incrementally decodes a base64-encoded string as it is read.
+
+    Only (roughly) `chunk_size` decoded bytes are held in memory at any time.
+    """
+
+    def __init__(self, data: str, chunk_size: int = _BASE64_CHUNK_SIZE) -> None:
+        super().__init__()
+        self._data = data
+        self._position = 0
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        # base64 characters left over from the last (partial) 4-character group
+        self._remainder = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while len(self._buffer) < len(buffer) and self._position < len(self._data):
+            # ignore line breaks (and any other whitespace) in the encoded data
+            start, stop = self._position, self._position + self._chunk_size
+            chunk = self._remainder + "".join(self._data[start:stop].split())
+            self._position = stop
+
+            num_chars = len(chunk) - len(chunk) % 4
+            self._buffer += binascii.a2b_base64(chunk[:num_chars])
+            self._remainder = chunk[num_chars:]
+
+        num_bytes = min(len(buffer), len(self._buffer))
+        buffer[:num_bytes] = self._buffer[:num_bytes]
+        del self._buffer[:num_bytes]
+        return num_bytes
 
 
-def serialize_circuits(circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]) -> str:
+def _dump_circuits(circuits: List[qiskit.QuantumCircuit]) -> bytes:
+    """QPY-serializes a list of circuits (after assigning them unique instruction names)."""
+    buf = io.BytesIO()
+    qiskit.circuit.qpy_serialization.dump(
+        [_assign_unique_inst_names(circuit) for circuit in circuits], buf
+    )
+    return buf.getvalue()
+
+
+def serialize_circuits(
+    circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+    max_workers: int = 1,
+) -> str:
     """Serialize QuantumCircuit(s) into a single string
 
+    Serialized circuits are base64-encoded as they are written, so the full QPY payload is never
+    held in memory.
+
     Args:
         circuits: a QuantumCircuit or list of QuantumCircuits to be serialized
+        max_workers: the maximum number of processes to serialize with. If greater than 1, batches
+            of at least `PARALLEL_SERIALIZATION_THRESHOLD` circuits are split into chunks which are
+            serialized in parallel (across a process pool) and then merged.
 
     Returns:
         str representing the serialized circuit(s)
     """
     if isinstance(circuits, qiskit.QuantumCircuit):
-        circuits = [_assign_unique_inst_names(circuits)]
-    else:
+        circuits = [circuits]
+
+    writer = _Base64Writer()
+    if max_workers <= 1 or len(circuits) < PARALLEL_SERIALIZATION_THRESHOLD:
         circuits = [_assign_unique_inst_names(circuit) for circuit in circuits]
+        qiskit.circuit.qpy_serialization.dump(circuits, writer)
+        return writer.getvalue()
 
-    buf = io.BytesIO()
-    qiskit.circuit.qpy_serialization.dump(circuits, buf)
-    return applications_superstaq.converters._bytes_to_str(buf.getvalue())
+    # use a few chunks per worker to even out differences in circuit size
+    chunk_size = -(-len(circuits) // (4 * max_workers))
+    bounds = list(range(0, len(circuits), chunk_size)) + [len(circuits)]
+    chunks = [circuits[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        _write_merged_qpy(writer, executor.map(_dump_circuits, chunks), len(circuits))
+
+    return writer.getvalue()
+
+
+def _write_merged_qpy(writer: io.RawIOBase, qpy_files: Iterable[bytes], num_circuits: int) -> None:
+    """Writes a single QPY file containing every circuit in the given QPY files (in order).
+
+    Every circuit in a QPY file is self-contained, so a QPY file is just a header (including the
+    number of circuits) followed by each of its circuits. Separately-serialized QPY files can
+    therefore be merged by replacing their headers with a single header for the whole batch.
+    """
+    header_pack = qiskit.circuit.qpy_serialization.FILE_HEADER_PACK
+    header_size = qiskit.circuit.qpy_serialization.FILE_HEADER_SIZE
+
+    for index, qpy_file in enumerate(qpy_files):
+        if index == 0:
+            *header, _ = struct.unpack(header_pack, qpy_file[:header_size])
+            writer.write(struct.pack(header_pack, *header, num_circuits))
+        writer.write(memoryview(qpy_file)[header_size:])
+
+
+def _base64_size(num_bytes: int) -> int:
+    """The length of the base64 encoding of `num_bytes` bytes (as generated by `_Base64Writer`)."""
+    return 4 * -(-num_bytes // 3) + -(-num_bytes // 57)  # plus a newline per 57 bytes
+
+
+def serialize_circuit_chunks(
+    circuits: Union[qiskit.QuantumCircuit, Sequence[qiskit.QuantumCircuit]],
+    max_circuits: Optional[int] = None,
+    max_size: Optional[int] = None,
+    max_workers: int = 1,
+) -> Iterator[Tuple[int, str]]:
+    """Serializes a batch of circuits into (consecutive) chunks, each of which is no larger than
+    the given limits.
+
+    Chunks are serialized lazily (i.e. as they are iterated over), so each chunk can be used (e.g.
+    submitted) while the next one is being serialized. Each chunk is identical to
+    `serialize_circuits` applied to just the circuits it contains.
+
+    Args:
+        circuits: a QuantumCircuit or list of QuantumCircuits to be serialized.
+        max_circuits: the maximum number of circuits in any chunk.
+        max_size: the maximum length of any serialized chunk. Circuits which don't fit in a chunk
+            by themselves are serialized alone.
+        max_workers: the maximum number of processes to serialize with (see `serialize_circuits`).
+
+    Yields:
+        The number of circuits in each chunk, along with the serialized chunk.
+    """
+    if isinstance(circuits, qiskit.QuantumCircuit):
+        circuits = [circuits]
+
+    if not circuits:
+        yield 0, serialize_circuits([])
+        return
+
+    header_size = qiskit.circuit.qpy_serialization.FILE_HEADER_SIZE
+    circuit_limit = max_circuits or len(circuits)
+    size_limit = max_size or float("inf")
+
+    with contextlib.ExitStack() as stack:
+        if max_workers > 1 and len(circuits) >= PARALLEL_SERIALIZATION_THRESHOLD:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+            map_func: Callable[..., Iterator[bytes]] = stack.enter_context(executor).map
+        else:
+            map_func = map
+
+        # serialize circuits one at a time, so chunks can be split at any circuit
+        qpy_files = map_func(_dump_circuits, [[circuit] for circuit in circuits])
+
+        chunk: List[bytes] = []
+        chunk_bytes = header_size
+        for qpy_file in qpy_files:
+            num_bytes = len(qpy_file) - header_size
+            if chunk and (
+                len(chunk) >= circuit_limit or _base64_size(chunk_bytes + num_bytes) > size_limit
+            ):
+                yield len(chunk), _merge_and_encode(chunk)
+                chunk, chunk_bytes = [], header_size
+
+            chunk.append(qpy_file)
+            chunk_bytes += num_bytes
+
+        yield len(chunk), _merge_and_encode(chunk)
+
+
+def _merge_and_encode(qpy_files: List[bytes]) -> str:
+    writer = _Base64Writer()
+    _write_merged_qpy(writer, qpy_files, len(qpy_files))
+    return writer.getvalue()
+
+
+def _resolve_custom_gates(circuit: qiskit.QuantumCircuit) -> None:
+    """Replaces (in place) generic instructions in a deserialized circuit with the
+    qiskit_superstaq custom gates they represent.
+
+    Standard gates are skipped based on their names alone, and each distinct custom instruction is
+    only resolved once. This relies on `_assign_unique_inst_names` having given distinct custom
+    instructions in the circuit distinct names, so that instructions with the same name, params
+    and label are equivalent.
+    """
+    resolved_insts: Dict[Hashable, Optional[qiskit.circuit.Instruction]] = {}
+
+    for pc, (inst, qargs, cargs) in enumerate(circuit._data):
+        if inst.name in qiskit_superstaq.custom_gates._STANDARD_GATE_NAMES:
+            continue
+
+        key = (inst.name, tuple(inst.params), inst.label)
+        try:
+            new_inst = resolved_insts[key]
+        except KeyError:
+            new_inst = resolved_insts[key] = qiskit_superstaq.custom_gates.custom_resolver(inst)
+        except TypeError:  # unhashable params
+            new_inst = qiskit_superstaq.custom_gates.custom_resolver(inst)
+
+        if new_inst is not None:
+            circuit._data[pc] = (new_inst, qargs, cargs)
 
 
 def deserialize_circuits(serialized_circuits: str) -> List[qiskit.QuantumCircuit]:
@@ -87,16 +443,11 @@ def deserialize_circuits(serialized_circuits: str) -> List[qiskit.QuantumCircuit
     Returns:
         a list of QuantumCircuits
     """
-    buf = io.BytesIO(applications_superstaq.converters._str_to_bytes(serialized_circuits))
-
     with warnings.catch_warnings(record=False):
         warnings.filterwarnings("ignore", "The qiskit version", UserWarning, "qiskit")
-        circuits = qiskit.circuit.qpy_serialization.load(buf)
+        circuits = qiskit.circuit.qpy_serialization.load(_Base64Reader(serialized_circuits))
 
     for circuit in circuits:
-        for pc, (inst, qargs, cargs) in enumerate(circuit._data):
-            new_inst = qiskit_superstaq.custom_gates.custom_resolver(inst)
-            if new_inst is not None:
-                circuit._data[pc] = (new_inst, qargs, cargs)
+        _resolve_custom_gates(circuit)
 
     return circuits
@@ -1,8 +1,10 @@
 import io
 import warnings
+from typing import List, Tuple
 from unittest import mock
 
 import applications_superstaq
+import numpy as np
 import pytest
 import qiskit
 
@@ -34,6 +36,88 @@ def test_assign_unique_inst_names() -> None:
     new_circuit = qiskit_superstaq.serialization._assign_unique_inst_names(circuit)
     assert [inst.name for inst, _, _ in new_circuit] == expected_inst_names
 
+    # the input circuit is unchanged, and only renamed instructions are copied
+    assert [inst.name for inst, _, _ in circuit] == 4 * ["zzswap"] + 2 * ["rxx"]
+    is_shared = [new_inst is inst for (new_inst, _, _), (inst, _, _) in zip(new_circuit, circuit)]
+    assert is_shared == [True, False, True, False, True, True]
+    assert new_circuit.data[1][0] is new_circuit.data[3][0]
+
+    # equality is still checked for instructions with matching fingerprints
+    with mock.patch("qiskit_superstaq.serialization._inst_fingerprint", return_value=0):
+        new_circuit = qiskit_superstaq.serialization._assign_unique_inst_names(circuit)
+    assert [inst.name for inst, _, _ in new_circuit] == expected_inst_names
+
+
+def test_assign_unique_inst_names_no_renaming() -> None:
+    circuit = qiskit.QuantumCircuit(3)
+    circuit.h(0)
+    circuit.append(qiskit_superstaq.ZZSwapGate(0.1), [0, 1])
+    circuit.append(qiskit_superstaq.ZZSwapGate(0.1), [1, 2])
+    circuit.append(qiskit_superstaq.AceCR("+-"), [0, 2])
+
+    # circuits which don't need any renaming aren't copied
+    assert qiskit_superstaq.serialization._assign_unique_inst_names(circuit) is circuit
+
+
+def test_assign_unique_inst_names_parameterized() -> None:
+    theta = qiskit.circuit.Parameter("θ")
+    phi = qiskit.circuit.Parameter("φ")
+
+    circuit = qiskit.QuantumCircuit(2, global_phase=theta, metadata={"foo": "bar"})
+    circuit.append(qiskit_superstaq.ZZSwapGate(theta), [0, 1])
+    circuit.append(qiskit_superstaq.ZZSwapGate(phi), [0, 1])
+    circuit.rx(phi, 0)
+
+    new_circuit = qiskit_superstaq.serialization._assign_unique_inst_names(circuit)
+    assert [inst.name for inst, _, _ in new_circuit] == ["zzswap", "zzswap_1", "rx"]
+    assert [inst.name for inst, _, _ in circuit] == ["zzswap", "zzswap", "rx"]
+    assert new_circuit.metadata == circuit.metadata
+    assert new_circuit.metadata is not circuit.metadata
+
+    # the parameter table of the new circuit refers to its own instructions
+    bound_circuit = new_circuit.assign_parameters({theta: 0.1, phi: 0.2})
+    assert [inst.params for inst, _, _ in bound_circuit] == [[0.1], [0.2], [0.2]]
+    assert [inst.name for inst, _, _ in bound_circuit] == ["zzswap", "zzswap_1", "rx"]
+    assert circuit.parameters == {theta, phi}
+
+
+def test_assign_unique_inst_names_fingerprints() -> None:
+    circuit = qiskit.QuantumCircuit(4)
+    for theta in [0.1, 0.2, 0.1]:
+        circuit.append(
+            qiskit_superstaq.ParallelGates(
+                qiskit_superstaq.ZZSwapGate(theta), qiskit.circuit.library.RXGate(0.3)
+            ),
+            [0, 1, 2],
+        )
+    for unitary in [np.eye(2), np.diag([1, -1]), np.eye(2)]:
+        circuit.unitary(unitary, [3])
+    for params in [[[0.1, 0.2], qiskit.circuit.library.RXGate(0.1)], [[0.1, 0.2], 0.3]]:
+        circuit.append(qiskit.circuit.Instruction("foo", 1, 0, params), [0])
+
+    # the same instruction instance used more than once
+    inst = qiskit_superstaq.ZZSwapGate(0.4)
+    circuit.append(qiskit_superstaq.ParallelGates(inst, inst), [0, 1, 2, 3])
+    circuit.append(inst, [0, 1])
+    circuit.append(inst, [2, 3])
+
+    expected_inst_names = [
+        "parallel_zzswap_rx",
+        "parallel_zzswap_rx_1",
+        "parallel_zzswap_rx",
+        "unitary",
+        "unitary_1",
+        "unitary",
+        "foo",
+        "foo_1",
+        "parallel_zzswap_zzswap",
+        "zzswap",
+        "zzswap",
+    ]
+
+    new_circuit = qiskit_superstaq.serialization._assign_unique_inst_names(circuit)
+    assert [inst.name for inst, _, _ in new_circuit] == expected_inst_names
+
 
 def test_circuit_serialization() -> None:
     circuit_0 = qiskit.QuantumCircuit(3)
@@ -78,6 +162,222 @@ def test_circuit_serialization() -> None:
     assert qiskit_superstaq.serialization.deserialize_circuits(serialized_circuits) == circuits
 
 
+@pytest.mark.parametrize("chunk_size", [1, 57, 100, 2**20])
+def test_base64_writer(chunk_size: int) -> None:
+    data = bytes(range(256)) * 10
+
+    writer = qiskit_superstaq.serialization._Base64Writer(chunk_size)
+    assert writer.writable()
+    for start in range(0, len(data), 99):
+        chunk = data[start:][:99]
+        assert writer.write(chunk) == len(chunk)
+    assert writer.getvalue() == applications_superstaq.converters._bytes_to_str(data)
+    assert writer.getvalue() == applications_superstaq.converters._bytes_to_str(data)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 77, 2**20])
+def test_base64_reader(chunk_size: int) -> None:
+    data = bytes(range(256)) * 10
+    encoded = applications_superstaq.converters._bytes_to_str(data)
+
+    reader = qiskit_superstaq.serialization._Base64Reader(encoded, chunk_size)
+    assert reader.readable()
+    assert reader.read(1) == data[:1]
+    assert reader.read(1000) == data[1:1001]
+    assert reader.read() == data[1001:]
+    assert reader.read(1) == b""
+
+    # line breaks are optional
+    reader = qiskit_superstaq.serialization._Base64Reader(encoded.replace("\n", ""), chunk_size)
+    assert reader.read() == data
+
+
+def test_parallel_circuit_serialization() -> None:
+    circuits = []
+    for theta in np.linspace(0, np.pi, 10):
+        circuit = qiskit.QuantumCircuit(3)
+        circuit.append(qiskit_superstaq.ZZSwapGate(theta), [0, 1])
+        circuit.append(qiskit_superstaq.ZZSwapGate(theta / 2), [1, 2])
+        circuit.append(qiskit_superstaq.AceCR("+-"), [0, 2])
+        circuit.rx(theta, 0)
+        circuits.append(circuit)
+
+    serialized_circuits = qiskit_superstaq.serialization.serialize_circuits(circuits)
+
+    # below the threshold, circuits are serialized in this process
+    with mock.patch("concurrent.futures.ProcessPoolExecutor") as mock_executor:
+        assert (
+            qiskit_superstaq.serialization.serialize_circuits(circuits, max_workers=2)
+            == serialized_circuits
+        )
+    mock_executor.assert_not_called()
+
+    # chunks serialized in parallel should be merged into the same payload
+    with mock.patch("qiskit_superstaq.serialization.PARALLEL_SERIALIZATION_THRESHOLD", 4):
+        assert (
+            qiskit_superstaq.serialization.serialize_circuits(circuits, max_workers=2)
+            == serialized_circuits
+        )
+    assert qiskit_superstaq.serialization.deserialize_circuits(serialized_circuits) == circuits
+
+
+def test_serialize_circuit_chunks() -> None:
+    circuits = []
+    for i in range(10):
+        circuit = qiskit.QuantumCircuit(2, 2)
+        circuit.append(qiskit_superstaq.ZZSwapGate(0.1 * i), [0, 1])
+        circuit.rx(0.2 * i, 0)
+        circuit.measure([0, 1], [0, 1])
+        circuits.append(circuit)
+
+    def check_chunks(chunks: List[Tuple[int, str]], expected_sizes: List[int]) -> None:
+        assert [num_circuits for num_circuits, _ in chunks] == expected_sizes
+
+        bounds = np.cumsum([0] + expected_sizes)
+        for (_, chunk), start, stop in zip(chunks, bounds, bounds[1:]):
+            assert chunk == qiskit_superstaq.serialization.serialize_circuits(circuits[start:stop])
+
+    chunks = list(qiskit_superstaq.serialization.serialize_circuit_chunks(circuits))
+    check_chunks(chunks, [10])
+
+    chunks = list(qiskit_superstaq.serialization.serialize_circuit_chunks(circuits, max_circuits=4))
+    check_chunks(chunks, [4, 4, 2])
+
+    # chunks are split by their serialized sizes
+    size = len(qiskit_superstaq.serialization.serialize_circuits(circuits[:3]))
+    chunks = list(qiskit_superstaq.serialization.serialize_circuit_chunks(circuits, max_size=size))
+    check_chunks(chunks, [3, 3, 3, 1])
+    assert all(len(chunk) <= size for _, chunk in chunks)
+
+    chunks = list(
+        qiskit_superstaq.serialization.serialize_circuit_chunks(
+            circuits, max_circuits=2, max_size=size
+        )
+    )
+    check_chunks(chunks, [2, 2, 2, 2, 2])
+
+    # circuits too large for any chunk are serialized alone
+    chunks = list(qiskit_superstaq.serialization.serialize_circuit_chunks(circuits, max_size=1))
+    check_chunks(chunks, [1] * 10)
+
+    with mock.patch("qiskit_superstaq.serialization.PARALLEL_SERIALIZATION_THRESHOLD", 4):
+        chunks = list(
+            qiskit_superstaq.serialization.serialize_circuit_chunks(
+                circuits, max_circuits=4, max_workers=2
+            )
+        )
+    check_chunks(chunks, [4, 4, 2])
+
+    chunks = list(qiskit_superstaq.serialization.serialize_circuit_chunks(circuits[0]))
+    check_chunks(chunks, [1])
+
+    chunks = list(qiskit_superstaq.serialization.serialize_circuit_chunks([]))
+    assert chunks == [(0, qiskit_superstaq.serialization.serialize_circuits([]))]
+
+
+def test_deserialize_circuits() -> None:
+    circuits = []
+    for theta in [0.1, 0.2, 0.3]:
+        circuit = qiskit.QuantumCircuit(2)
+        circuit.append(qiskit_superstaq.ZZSwapGate(theta), [0, 1])
+        circuit.rz(theta, 1)
+        circuits.append(circuit)
+    serialized_circuits = qiskit_superstaq.serialization.serialize_circuits(circuits)
+
+    with mock.patch(
+        "qiskit_superstaq.custom_gates.custom_resolver",
+        wraps=qiskit_superstaq.custom_gates.custom_resolver,
+    ) as mock_resolver:
+        deserialized_circuits = qiskit_superstaq.serialization.deserialize_circuits(
+            serialized_circuits
+        )
+        assert mock_resolver.call_count == 3
+
+    assert isinstance(deserialized_circuits, list)
+    assert deserialized_circuits == circuits
+    assert isinstance(deserialized_circuits[1][0][0], qiskit_superstaq.ZZSwapGate)
+
+
+def test_resolve_custom_gates() -> None:
+    gate = qiskit_superstaq.ZZSwapGate(1.23)
+    circuit = qiskit.QuantumCircuit(3)
+    circuit.append(gate, [0, 1])
+    circuit.cx(1, 2)
+    circuit.append(gate, [1, 2])
+    circuit.append(qiskit_superstaq.ZZSwapGate(4.56), [0, 2])
+    circuit.append(qiskit_superstaq.AceCR("+-", sandwich_rx_rads=1.23), [0, 1])
+    circuit.append(qiskit_superstaq.AceCR("-+", label="acecr"), [0, 1])
+
+    serialized_circuit = qiskit_superstaq.serialization.serialize_circuits(circuit)
+    with mock.patch(
+        "qiskit_superstaq.custom_gates.custom_resolver",
+        wraps=qiskit_superstaq.custom_gates.custom_resolver,
+    ) as mock_resolver:
+        deserialized_circuit = qiskit_superstaq.serialization.deserialize_circuits(
+            serialized_circuit
+        )[0]
+
+    # standard gates are skipped, and repeated instructions are only resolved once
+    assert deserialized_circuit == circuit
+    assert mock_resolver.call_count == 4
+    assert deserialized_circuit[0][0] is deserialized_circuit[2][0]
+    assert deserialized_circuit[0][0] is not deserialized_circuit[3][0]
+    assert deserialized_circuit[5][0].label == "acecr"
+
+    # instructions with unhashable params are resolved without memoization
+    gate = qiskit.circuit.Gate("zzswap", 2, [np.array([1.23])])
+    circuit = qiskit.QuantumCircuit(2)
+    circuit.append(gate, [0, 1])
+    qiskit_superstaq.serialization._resolve_custom_gates(circuit)
+    assert circuit[0][0] is gate
+
+
+def test_registered_custom_gates() -> None:
+    class MyGate(qiskit.circuit.Gate):
+        def __init__(self, theta: float) -> None:
+            super().__init__(f"my_gate({theta})", 1, [theta])
+
+        def _define(self) -> None:
+            qc = qiskit.QuantumCircuit(1, name="my_gate")
+            qc.rx(self.params[0], 0)
+            self.definition = qc
+
+    class MyNamedGate(qiskit.circuit.Gate):
+        def __init__(self, theta: float) -> None:
+            super().__init__("my_named_gate", 1, [theta])
+
+        def _define(self) -> None:
+            qc = qiskit.QuantumCircuit(1, name="my_named_gate")
+            qc.ry(self.params[0], 0)
+            self.definition = qc
+
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.append(MyGate(1.23), [0])
+    circuit.append(MyNamedGate(1.23), [0])
+    circuit.append(MyNamedGate(4.56), [0])
+
+    with mock.patch.dict(
+        qiskit_superstaq.custom_gates._CUSTOM_GATES_BY_DEFINITION_NAME
+    ), mock.patch.dict(qiskit_superstaq.custom_gates._CUSTOM_GATES_BY_NAME):
+        qiskit_superstaq.custom_gates.register_custom_gate(
+            lambda gate: MyGate(gate.params[0]), definition_name="my_gate"
+        )
+        qiskit_superstaq.custom_gates.register_custom_gate(
+            lambda gate: MyNamedGate(gate.params[0]), name="my_named_gate"
+        )
+
+        # gates registered by name aren't renamed
+        assert qiskit_superstaq.serialization._assign_unique_inst_names(circuit) is circuit
+
+        serialized_circuit = qiskit_superstaq.serialization.serialize_circuits(circuit)
+        deserialized_circuit = qiskit_superstaq.serialization.deserialize_circuits(
+            serialized_circuit
+        )[0]
+
+    assert deserialized_circuit == circuit
+    assert [type(inst) for inst, _, _ in deserialized_circuit] == [MyGate, MyNamedGate, MyNamedGate]
+
+
 def test_warning_suppression() -> None:
     circuit = qiskit.QuantumCircuit(3)
     circuit.cx(2, 1)
@@ -11,18 +11,53 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
-from typing import Any, List, Optional, Union
+import asyncio
+import collections
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import itertools
+import json
+import math
+import time
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import qiskit
 
 import qiskit_superstaq as qss
 
+# default limits on the number of circuits in (and the size of the serialized circuits of) each
+# job request made by `SuperstaQBackend.run`
+DEFAULT_MAX_CIRCUITS_PER_JOB = 1000
+DEFAULT_MAX_JOB_SIZE = 32 * 2**20
+
+# how long (in seconds) fetched target metadata is cached before it is fetched again
+DEFAULT_CONFIGURATION_TTL = 3600.0
+
+# fields of SuperstaQ's target metadata, and the `BackendConfiguration` fields they set
+_TARGET_INFO_FIELDS = {
+    "num_qubits": "n_qubits",
+    "native_gate_set": "basis_gates",
+    "coupling_map": "coupling_map",
+    "max_shots": "max_shots",
+}
+
 
 class SuperstaQBackend(qiskit.providers.BackendV1):
+    # whether the server accepts bulk job requests (cleared the first time it refuses one)
+    _bulk_job_fetch_supported = True
+
     def __init__(
-        self, provider: "qss.superstaq_provider.SuperstaQProvider", remote_host: str, backend: str
+        self,
+        provider: "qss.superstaq_provider.SuperstaQProvider",
+        remote_host: str,
+        backend: str,
+        configuration_ttl: float = DEFAULT_CONFIGURATION_TTL,
     ) -> None:
         self.remote_host = remote_host
+        self.configuration_ttl = configuration_ttl
         self._provider = provider
         self.configuration_dict = {
             "backend_name": backend,
@@ -45,9 +80,25 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
             provider=provider,
         )
 
+        # the placeholder configuration is replaced by the target's metadata when first needed
+        self._target_info: Dict[str, Any] = {}
+        self._configuration_expiry = -math.inf
+
     @classmethod
     def _default_options(cls) -> qiskit.providers.Options:
-        return qiskit.providers.Options(shots=1000)
+        # a `polling_strategy` of None means jobs use `qss.polling.ExponentialBackoff()`,
+        # `serialization_workers` is the number of processes used to serialize large batches, and
+        # batches are split into separate job requests of at most `max_circuits_per_job` circuits
+        # and `max_job_size` characters of serialized circuits (see `run` for the others)
+        return qiskit.providers.Options(
+            shots=1000,
+            polling_strategy=None,
+            serialization_workers=1,
+            max_circuits_per_job=DEFAULT_MAX_CIRCUITS_PER_JOB,
+            max_job_size=DEFAULT_MAX_JOB_SIZE,
+            hash_idempotency_keys=False,
+            deduplicate_circuits=False,
+        )
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, qss.superstaq_backend.SuperstaQBackend):
@@ -58,28 +109,253 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
             and self.configuration_dict == other.configuration_dict
         )
 
+    def configuration(self) -> qiskit.providers.models.BackendConfiguration:
+        """Returns the configuration of this backend, including its target's number of qubits,
+        native gates, coupling map and maximum number of shots.
+
+        This metadata is fetched from SuperstaQ when first needed, and then cached for
+        `configuration_ttl` seconds. Fields the server doesn't provide keep their placeholder values
+        (e.g. `n_qubits=-1`).
+        """
+        if time.monotonic() >= self._configuration_expiry:
+            target_info = self._provider._fetch_target_info([self.name()])
+            self._set_target_info(target_info.get(self.name()))
+        return self._configuration
+
+    def _set_target_info(self, target_info: Optional[Dict[str, Any]]) -> None:
+        """Rebuilds the configuration from fetched target metadata, and restarts its TTL."""
+        self._target_info = target_info if isinstance(target_info, dict) else {}
+        configuration_dict = dict(self.configuration_dict)
+        if isinstance(target_info, dict):
+            for key, field in _TARGET_INFO_FIELDS.items():
+                if target_info.get(key) is not None:
+                    configuration_dict[field] = target_info[key]
+
+        self._configuration = qiskit.providers.models.BackendConfiguration.from_dict(
+            configuration_dict
+        )
+        self._configuration_expiry = time.monotonic() + self.configuration_ttl
+
+    def transpile(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        **transpile_options: Any,
+    ) -> Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]:
+        """Transpiles circuit(s) locally to this backend's native gates and coupling map (as far
+        as they are known), e.g. to reduce the compilation required by the server when they are
+        run. Batches are transpiled in parallel.
+
+        Args:
+            circuits: the circuit(s) to transpile.
+            transpile_options: any other arguments to `qiskit.transpile`.
+
+        Returns:
+            The transpiled circuit(s).
+        """
+        return qiskit.transpile(circuits, backend=self, **transpile_options)
+
     def run(
         self,
         circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
         shots: int,
         ibmq_pulse: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
     ) -> "qss.superstaq_job.SuperstaQJob":
+        """Submits circuits to be run on this backend.
+
+        Large batches are split into chunks (see the "max_circuits_per_job" and "max_job_size"
+        options), each of which is submitted in a separate request. Chunks are pipelined, so each
+        is serialized while the previous one is being uploaded.
+
+        Every request carries an idempotency key, so that the server never creates its jobs twice
+        (e.g. if a request times out and is retried). Keys are random unless `idempotency_key` is
+        given, or the "hash_idempotency_keys" option is set (in which case they are derived from a
+        hash of the whole batch), so that resubmitting the same batch returns the same job. Hashed
+        keys require the whole batch to be serialized before its first chunk is uploaded.
+
+        If the "deduplicate_circuits" option is set, identical circuits in the batch are only
+        submitted once (with their shots combined). Their results are split back out between them
+        by `qss.superstaq_job.SuperstaQJob.result`.
+
+        Args:
+            circuits: the circuit(s) to run.
+            shots: the number of times to run each circuit.
+            ibmq_pulse: whether to run the job using SuperstaQ's pulse-level optimizations.
+            idempotency_key: an optional key identifying this submission. Each request is sent
+                with this key suffixed by its index, e.g. "my-key-0".
 
+        Returns:
+            A single job aggregating every chunk, whose results are in the order of `circuits`.
+
+        Raises:
+            ValueError: if any circuits are invalid, e.g. have more qubits than the target or no
+                measurements (see `qss.validation.validate_circuits`).
+        """
         if isinstance(circuits, qiskit.QuantumCircuit):
             circuits = [circuits]
 
-        qiskit_circuits = qss.serialization.serialize_circuits(circuits)
-
-        result = self._provider._client.create_job(
-            serialized_circuits={"qiskit_circuits": qiskit_circuits},
-            repetitions=shots,
-            target=self.name(),
-            ibmq_pulse=ibmq_pulse,
+        qss.validation.validate_circuits(
+            circuits, self.configuration(), shots=shots, require_measurements=True
         )
 
+        if self.options.deduplicate_circuits:
+            job_ids = self._submit_deduplicated(circuits, shots, ibmq_pulse, idempotency_key)
+        else:
+            job_ids = self._submit_chunks([(shots, circuits)], ibmq_pulse, idempotency_key)
+
         #  we make a virtual job_id that aggregates all of the individual jobs
         # into a single one, that comma-separates the individual jobs:
-        job_id = ",".join(result["job_ids"])
+        job_id = ",".join(job_ids)
         job = qss.superstaq_job.SuperstaQJob(self, job_id)
 
         return job
+
+    def _submit_deduplicated(
+        self,
+        circuits: List[qiskit.QuantumCircuit],
+        shots: int,
+        ibmq_pulse: Optional[bool],
+        idempotency_key: Optional[str],
+    ) -> List[str]:
+        """Submits each unique circuit in a batch once, with the combined shots of every copy of it.
+
+        Returns:
+            The job id of every circuit, in order (so that identical circuits share the same job).
+        """
+        unique_circuits, circuit_indices = _deduplicate_circuits(circuits)
+
+        # group unique circuits by the number of shots they need, as every circuit in a request is
+        # run with the same number of repetitions
+        multiplicities = collections.Counter(circuit_indices)
+        groups: Dict[int, List[int]] = {}
+        for index in range(len(unique_circuits)):
+            groups.setdefault(shots * multiplicities[index], []).append(index)
+
+        circuit_groups = [
+            (repetitions, [unique_circuits[index] for index in group])
+            for repetitions, group in groups.items()
+        ]
+        job_ids = self._submit_chunks(circuit_groups, ibmq_pulse, idempotency_key)
+        job_ids_by_index = dict(zip(itertools.chain(*groups.values()), job_ids))
+        return [job_ids_by_index[index] for index in circuit_indices]
+
+    def _submit_chunks(
+        self,
+        groups: List[Tuple[int, List[qiskit.QuantumCircuit]]],
+        ibmq_pulse: Optional[bool],
+        idempotency_key: Optional[str],
+    ) -> List[str]:
+        """Serializes and submits groups of circuits in chunks, uploading each chunk while the next
+        one is serialized.
+
+        Args:
+            groups: the number of repetitions, and the circuits to run with that many repetitions.
+            ibmq_pulse: whether to run the job using SuperstaQ's pulse-level optimizations.
+            idempotency_key: the (optional) key identifying this submission.
+
+        Returns:
+            The job id of every circuit, in order.
+        """
+        requests: Iterator[Tuple[int, str]] = (
+            (repetitions, qiskit_circuits)
+            for repetitions, group in groups
+            for _, qiskit_circuits in qss.serialization.serialize_circuit_chunks(
+                group,
+                max_circuits=self.options.max_circuits_per_job,
+                max_size=self.options.max_job_size,
+                max_workers=self.options.serialization_workers,
+            )
+        )
+
+        if idempotency_key is None and self.options.hash_idempotency_keys:
+            # identical chunks within a batch must still get distinct keys, so the key is derived
+            # from the whole batch (which therefore has to be serialized before it's uploaded)
+            serialized_requests = list(requests)
+            idempotency_key = _hash_requests(self.name(), ibmq_pulse, serialized_requests)
+            requests = iter(serialized_requests)
+
+        job_ids: List[str] = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            pending_request: Optional[concurrent.futures.Future] = None
+
+            # the next chunk is serialized (by the generator) while the previous one is uploaded
+            for request_index, (repetitions, qiskit_circuits) in enumerate(requests):
+                if pending_request is not None:
+                    job_ids += pending_request.result()["job_ids"]
+
+                if idempotency_key is not None:
+                    request_key = f"{idempotency_key}-{request_index}"
+                else:
+                    request_key = str(uuid.uuid4())
+
+                pending_request = executor.submit(
+                    self._provider._client.create_job,
+                    serialized_circuits={"qiskit_circuits": qiskit_circuits},
+                    repetitions=repetitions,
+                    target=self.name(),
+                    ibmq_pulse=ibmq_pulse,
+                    idempotency_key=request_key,
+                )
+
+            assert pending_request is not None
+            job_ids += pending_request.result()["job_ids"]
+
+        return job_ids
+
+    async def run_async(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        shots: int,
+        ibmq_pulse: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> "qss.superstaq_job.SuperstaQJob":
+        """Asynchronous version of `run`, which serializes and submits the circuit(s) without
+        blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        run = functools.partial(
+            self.run, circuits, shots, ibmq_pulse=ibmq_pulse, idempotency_key=idempotency_key
+        )
+        return await loop.run_in_executor(None, run)
+
+
+def _deduplicate_circuits(
+    circuits: List[qiskit.QuantumCircuit],
+) -> Tuple[List[qiskit.QuantumCircuit], List[int]]:
+    """Finds the unique circuits in a batch.
+
+    Circuits are identified by their (QPY) serializations, ignoring their names and metadata (so
+    that separately-constructed copies of a circuit, which are automatically given distinct names,
+    are still considered identical). The first copy of each circuit is the one submitted.
+
+    Returns:
+        The unique circuits, along with the index (in the unique circuits) of every circuit in the
+        batch.
+    """
+    unique_circuits: List[qiskit.QuantumCircuit] = []
+    unique_indices: Dict[bytes, int] = {}
+    circuit_indices = []
+    for circuit in circuits:
+        # (shallow) copy with the name and metadata normalized, so only the contents are hashed
+        anonymous_circuit = copy.copy(circuit)
+        anonymous_circuit.name = ""
+        anonymous_circuit.metadata = None
+        key = hashlib.sha256(qss.serialization._dump_circuits([anonymous_circuit])).digest()
+        if key not in unique_indices:
+            unique_indices[key] = len(unique_circuits)
+            unique_circuits.append(circuit)
+        circuit_indices.append(unique_indices[key])
+
+    return unique_circuits, circuit_indices
+
+
+def _hash_requests(
+    target: str, ibmq_pulse: Optional[bool], requests: Iterable[Tuple[int, str]]
+) -> str:
+    """Derives an idempotency key from the contents of every job request in a batch (i.e. the
+    number of repetitions and serialized circuits of each)."""
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([target, bool(ibmq_pulse)]).encode())
+    for repetitions, qiskit_circuits in requests:
+        hasher.update(json.dumps([repetitions, len(qiskit_circuits)]).encode())
+        hasher.update(qiskit_circuits.encode())
+    return hasher.hexdigest()
@@ -1,5 +1,10 @@
+import asyncio
+from typing import Any, Dict, List
+from unittest import mock
 from unittest.mock import MagicMock
 
+import applications_superstaq
+import pytest
 import qiskit
 
 import qiskit_superstaq as qss
@@ -13,7 +18,15 @@ def test_default_options() -> None:
         backend="ibmq_qasm_simulator",
     )
 
-    assert qiskit.providers.Options(shots=1000) == device._default_options()
+    assert device._default_options() == qiskit.providers.Options(
+        shots=1000,
+        polling_strategy=None,
+        serialization_workers=1,
+        max_circuits_per_job=qss.superstaq_backend.DEFAULT_MAX_CIRCUITS_PER_JOB,
+        max_job_size=qss.superstaq_backend.DEFAULT_MAX_JOB_SIZE,
+        hash_idempotency_keys=False,
+        deduplicate_circuits=False,
+    )
 
 
 class MockProvider(qss.superstaq_provider.SuperstaQProvider):
@@ -71,6 +84,266 @@ def test_multi_circuit_run() -> None:
 
     assert answer == expected
 
+    device.set_options(serialization_workers=2)
+    with mock.patch(
+        "qiskit_superstaq.serialization.serialize_circuit_chunks", return_value=[(2, "xyz")]
+    ) as mock_serialize:
+        _ = device.run(circuits=[qc1, qc2], shots=1000)
+    mock_serialize.assert_called_once_with(
+        [qc1, qc2],
+        max_circuits=qss.superstaq_backend.DEFAULT_MAX_CIRCUITS_PER_JOB,
+        max_size=qss.superstaq_backend.DEFAULT_MAX_JOB_SIZE,
+        max_workers=2,
+    )
+    assert mock_client.create_job.call_args.kwargs["serialized_circuits"] == {
+        "qiskit_circuits": "xyz"
+    }
+
+
+def test_run_chunks() -> None:
+    device = MockDevice()
+    device.set_options(max_circuits_per_job=2)
+
+    circuits = []
+    for i in range(5):
+        qc = qiskit.QuantumCircuit(1, 1)
+        qc.rx(i, 0)
+        qc.measure(0, 0)
+        circuits.append(qc)
+
+    job_ids = iter(range(5))
+    mock_client = MagicMock()
+    mock_client.create_job.side_effect = lambda serialized_circuits, **_: {
+        "job_ids": [
+            f"job{next(job_ids)}"
+            for _ in qss.serialization.deserialize_circuits(serialized_circuits["qiskit_circuits"])
+        ],
+        "status": "ready",
+    }
+    device._provider._client = mock_client
+
+    # every chunk is submitted, and their jobs are merged (in order)
+    job = device.run(circuits=circuits, shots=100, ibmq_pulse=True)
+    assert job == qss.superstaq_job.SuperstaQJob(device, "job0,job1,job2,job3,job4")
+
+    requests = [call.kwargs for call in mock_client.create_job.call_args_list]
+    assert [request["serialized_circuits"]["qiskit_circuits"] for request in requests] == [
+        qss.serialization.serialize_circuits(circuits[:2]),
+        qss.serialization.serialize_circuits(circuits[2:4]),
+        qss.serialization.serialize_circuits(circuits[4:]),
+    ]
+    assert all(request["repetitions"] == 100 for request in requests)
+    assert all(request["target"] == "mock_backend" for request in requests)
+    assert all(request["ibmq_pulse"] is True for request in requests)
+
+
+def _mock_create_job(
+    serialized_circuits: Dict[str, str], repetitions: int, **_: Any
+) -> Dict[str, Any]:
+    circuits = qss.serialization.deserialize_circuits(serialized_circuits["qiskit_circuits"])
+    return {"job_ids": [f"{circuit.name}_{repetitions}" for circuit in circuits]}
+
+
+def test_run_idempotency_keys() -> None:
+    device = MockDevice()
+    device.set_options(max_circuits_per_job=1)
+
+    circuits = []
+    for i in range(2):
+        qc = qiskit.QuantumCircuit(1, 1, name=f"qc{i}")
+        qc.rx(i, 0)
+        qc.measure(0, 0)
+        circuits.append(qc)
+
+    mock_client = MagicMock()
+    mock_client.create_job.side_effect = _mock_create_job
+    device._provider._client = mock_client
+
+    def request_keys() -> List[str]:
+        keys = [call.kwargs["idempotency_key"] for call in mock_client.create_job.call_args_list]
+        mock_client.create_job.reset_mock()
+        return keys
+
+    # every request gets a (random) key by default
+    _ = device.run(circuits, shots=100)
+    keys = request_keys()
+    assert len(keys) == len(set(keys)) == 2
+    _ = device.run(circuits, shots=100)
+    assert set(request_keys()).isdisjoint(keys)
+
+    # ...or one derived from a given key
+    job = device.run(circuits, shots=100, idempotency_key="my-key")
+    assert job.job_id() == "qc0_100,qc1_100"
+    assert request_keys() == ["my-key-0", "my-key-1"]
+
+    # ...or from the contents of the request
+    device.set_options(hash_idempotency_keys=True)
+    _ = device.run(circuits, shots=100)
+    keys = request_keys()
+    assert len(set(keys)) == 2
+    _ = device.run(circuits, shots=100)
+    assert request_keys() == keys
+    _ = device.run(circuits, shots=200)
+    assert set(request_keys()).isdisjoint(keys)
+    _ = device.run(circuits, shots=100, ibmq_pulse=True)
+    assert set(request_keys()).isdisjoint(keys)
+    _ = device.run(circuits[:1], shots=100)
+    assert set(request_keys()).isdisjoint(keys)
+
+    # identical chunks of a batch still get distinct keys
+    device.set_options(max_circuits_per_job=2)
+    _ = device.run(circuits[:1] * 4, shots=10)
+    keys = request_keys()
+    assert len(keys) == len(set(keys)) == 2
+    assert keys[1] == keys[0][:-1] + "1"
+
+
+def test_run_deduplicated() -> None:
+    device = MockDevice()
+    device.set_options(deduplicate_circuits=True)
+
+    # separately-constructed (and therefore automatically-named) circuits
+    circuits: List[qiskit.QuantumCircuit] = []
+    for angle in [0.1, 0.2, 0.1, 0.3, 0.1, 0.2]:
+        qc = qiskit.QuantumCircuit(1, 1, metadata={"angle": angle, "index": len(circuits)})
+        qc.rx(angle, 0)
+        qc.measure(0, 0)
+        circuits.append(qc)
+    assert len({qc.name for qc in circuits}) == 6
+
+    mock_client = MagicMock()
+    mock_client.create_job.side_effect = _mock_create_job
+    device._provider._client = mock_client
+
+    # identical circuits are submitted once, with their combined shots
+    job = device.run(circuits, shots=100)
+    names = [circuits[i].name for i in [0, 1, 3]]
+    assert job.job_id().split(",") == [
+        f"{names[0]}_300",
+        f"{names[1]}_200",
+        f"{names[0]}_300",
+        f"{names[2]}_100",
+        f"{names[0]}_300",
+        f"{names[1]}_200",
+    ]
+
+    requests = [call.kwargs for call in mock_client.create_job.call_args_list]
+    assert [request["repetitions"] for request in requests] == [300, 200, 100]
+    assert [request["serialized_circuits"]["qiskit_circuits"] for request in requests] == [
+        qss.serialization.serialize_circuits([circuits[0]]),
+        qss.serialization.serialize_circuits([circuits[1]]),
+        qss.serialization.serialize_circuits([circuits[3]]),
+    ]
+
+    # and otherwise unchanged batches aren't affected
+    mock_client.create_job.reset_mock()
+    job = device.run(circuits[:2], shots=100)
+    assert job.job_id() == f"{names[0]}_100,{names[1]}_100"
+    assert mock_client.create_job.call_count == 1
+
+    # nor are the circuits themselves
+    assert circuits[0].name == names[0]
+    assert circuits[0].metadata == {"angle": 0.1, "index": 0}
+
+
+def test_run_async() -> None:
+    qc = qiskit.QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+    device = MockDevice()
+
+    mock_client = MagicMock()
+    mock_client.create_job.return_value = {"job_ids": ["job_id"], "status": "ready"}
+    device._provider._client = mock_client
+
+    answer = asyncio.run(device.run_async(circuits=qc, shots=1000, ibmq_pulse=True))
+    assert answer == qss.superstaq_job.SuperstaQJob(device, "job_id")
+    assert mock_client.create_job.call_args.kwargs["ibmq_pulse"] is True
+
+
+def test_configuration() -> None:
+    device = MockDevice()
+    mock_client = MagicMock()
+    mock_client.target_info.return_value = {
+        "target_info": {
+            "mock_backend": {
+                "num_qubits": 3,
+                "native_gate_set": ["rz", "sx", "cx"],
+                "coupling_map": [[0, 1], [1, 2]],
+                "max_shots": 2000,
+            }
+        }
+    }
+    device._provider._client = mock_client
+
+    configuration = device.configuration()
+    assert configuration.backend_name == "mock_backend"
+    assert configuration.n_qubits == 3
+    assert configuration.basis_gates == ["rz", "sx", "cx"]
+    assert configuration.coupling_map == [[0, 1], [1, 2]]
+    assert configuration.max_shots == 2000
+    mock_client.target_info.assert_called_once_with(["mock_backend"])
+
+    # the metadata is cached until its TTL expires
+    assert device.configuration() is configuration
+    mock_client.target_info.assert_called_once()
+
+    device.configuration_ttl = 0.0
+    device._set_target_info({"num_qubits": 5})
+    assert device._configuration.n_qubits == 5
+    assert device._configuration.basis_gates is None
+    assert device.configuration().n_qubits == 3
+    assert mock_client.target_info.call_count == 2
+
+    # placeholders are kept if the server doesn't provide the metadata
+    mock_client.target_info.side_effect = applications_superstaq.SuperstaQException("Not found")
+    assert device.configuration().n_qubits == -1
+    assert device.configuration().coupling_map is None
+    assert device == MockDevice()
+
+
+def test_transpile() -> None:
+    device = MockDevice()
+    device._set_target_info(
+        {"num_qubits": 3, "native_gate_set": ["rz", "sx", "cx"], "coupling_map": [[0, 1], [1, 2]]}
+    )
+
+    qc = qiskit.QuantumCircuit(3, 3)
+    qc.h(0)
+    qc.cx(0, 2)
+    qc.measure([0, 1, 2], [0, 1, 2])
+
+    transpiled_circuits = device.transpile([qc, qc], seed_transpiler=123)
+    assert isinstance(transpiled_circuits, list)
+    for transpiled_circuit in transpiled_circuits:
+        assert set(transpiled_circuit.count_ops()) <= {"rz", "sx", "cx", "measure", "barrier"}
+        for inst, qargs, _ in transpiled_circuit:
+            if inst.name == "cx":
+                qubits = [transpiled_circuit.qubits.index(qubit) for qubit in qargs]
+                assert qubits in [[0, 1], [1, 2]]
+
+
+def test_run_limits() -> None:
+    qc = qiskit.QuantumCircuit(4, 4)
+    qc.measure(range(4), range(4))
+    device = MockDevice()
+    mock_client = MagicMock()
+    mock_client.target_info.return_value = {
+        "target_info": {"mock_backend": {"num_qubits": 3, "max_shots": 2000}}
+    }
+    device._provider._client = mock_client
+
+    with pytest.raises(ValueError, match="Circuit 1 has 4 qubits, but mock_backend only has 3"):
+        _ = device.run([qiskit.QuantumCircuit(3, 3), qc], shots=1000)
+
+    with pytest.raises(ValueError, match="at most 2000 shots"):
+        _ = device.run(qiskit.QuantumCircuit(3, 3), shots=3000)
+
+    with pytest.raises(ValueError, match="Circuit 0 contains no measurements"):
+        _ = device.run(qiskit.QuantumCircuit(3, 3), shots=1000)
+
+    mock_client.create_job.assert_not_called()
+
 
 def test_eq() -> None:
 
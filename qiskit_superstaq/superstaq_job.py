@@ -12,14 +12,30 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import asyncio
+import collections
+import concurrent.futures
+import hashlib
+import itertools
 import time
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import qiskit
 import requests
 
 import qiskit_superstaq as qss
 
+# upper bound on the number of sub-jobs of an aggregated job that are polled concurrently
+DEFAULT_MAX_POLLING_WORKERS = 16
+
+# responses to a bulk job request indicating that the server doesn't support them
+_BULK_UNSUPPORTED_STATUS_CODES = {
+    requests.codes.not_found,
+    requests.codes.method_not_allowed,
+    requests.codes.not_implemented,
+}
+
 
 class SuperstaQJob(qiskit.providers.JobV1):
     def __init__(
@@ -45,50 +61,337 @@ class SuperstaQJob(qiskit.providers.JobV1):
 
         return self._job_id == other._job_id
 
-    def _wait_for_results(self, timeout: float = None, wait: float = 5) -> List[Dict]:
+    def _get_job(self, jid: str) -> Dict:
+        """Fetches the status (and, if done, the results) of a single sub-job."""
+        getstr = f"{self._backend.remote_host}/{qss.API_VERSION}/job/{jid}"
+        return self._backend._provider._session.get(
+            getstr, verify=(self._backend.remote_host == qss.API_URL)
+        ).json()
+
+    def _get_jobs_bulk(self, job_ids: List[str]) -> Optional[Dict[str, Dict]]:
+        """Fetches many sub-jobs in a single request.
+
+        Returns:
+            A dictionary mapping each job id to its result dictionary, or None if the server does
+            not support bulk job requests.
+        """
+        poststr = f"{self._backend.remote_host}/{qss.API_VERSION}/get_jobs"
+        response = self._backend._provider._session.post(
+            poststr, json={"job_ids": job_ids}, verify=(self._backend.remote_host == qss.API_URL)
+        )
+        if response.status_code in _BULK_UNSUPPORTED_STATUS_CODES:
+            return None
+        return response.json()
+
+    def _fetch_jobs(self, job_ids: List[str], max_workers: Optional[int] = None) -> Dict[str, Dict]:
+        """Fetches the given sub-jobs, using a single bulk request where the server supports it and
+        falling back to concurrent per-job requests otherwise.
+
+        Args:
+            job_ids: the (unique) ids of the sub-jobs to fetch.
+            max_workers: maximum number of per-job requests to make concurrently. Defaults to
+                `DEFAULT_MAX_POLLING_WORKERS`.
+        Returns:
+            A dictionary mapping each job id to its result dictionary.
+        """
+        if len(job_ids) > 1 and self._backend._bulk_job_fetch_supported:
+            results = self._get_jobs_bulk(job_ids)
+            if results is not None:
+                return results
+
+            # remember that this server can't handle bulk requests so we don't keep asking
+            self._backend._bulk_job_fetch_supported = False
 
-        result_list: List[Dict] = []
-        job_ids = self._job_id.split(",")  # separate aggregated job_ids
+        max_workers = min(max_workers or DEFAULT_MAX_POLLING_WORKERS, len(job_ids))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(job_ids, executor.map(self._get_job, job_ids)))
+
+    def _poll_finished(
+        self,
+        timeout: float = None,
+        wait: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        polling_strategy: Optional[qss.polling.PollingStrategy] = None,
+    ) -> Iterator[Dict[str, Dict]]:
+        """Polls every sub-job of this (possibly aggregated) job until they are all done.
+
+        Each round of polling fetches all unfinished sub-jobs at once (see `_fetch_jobs`).
+
+        Args:
+            timeout: maximum number of seconds to wait for the whole batch to finish.
+            wait: if set, poll at this fixed interval (in seconds) instead of using a polling
+                strategy.
+            max_workers: maximum number of sub-jobs to poll concurrently when the server does not
+                support bulk job requests. Defaults to `DEFAULT_MAX_POLLING_WORKERS`.
+            polling_strategy: the strategy deciding how long to wait between successive rounds
+                of polling. Defaults to the backend's "polling_strategy" option, or (if that is
+                not set) to `qss.polling.ExponentialBackoff()`.
+        Yields:
+            The result dictionaries of the sub-jobs which finished in each round of polling, keyed
+            by job id.
+        Raises:
+            qiskit.providers.JobTimeoutError: if the batch does not finish within `timeout`.
+            qiskit.providers.JobError: if any sub-job returns an error.
+        """
+        deadline = time.time() + timeout if timeout else None
+        polling_strategy = self._get_polling_strategy(wait, polling_strategy)
 
-        for jid in job_ids:
-            start_time = time.time()
-            result = None
+        # separate aggregated job_ids
+        pending_ids = list(dict.fromkeys(self._job_id.split(",")))
 
-            while True:
-                elapsed = time.time() - start_time
+        for num_polls in itertools.count(1):
+            fetched = self._fetch_jobs(pending_ids, max_workers)
+            finished: Dict[str, Dict] = {}
+            self._record_finished(fetched, finished)
+            yield finished
 
-                if timeout and elapsed >= timeout:
-                    raise qiskit.providers.JobTimeoutError(
-                        "Timed out waiting for result"
-                    )  # pragma: no cover b/c don't want slow test or mocking time
+            pending_ids = [jid for jid in pending_ids if jid not in finished]
+            if not pending_ids:
+                break
 
-                getstr = f"{self._backend.remote_host}/{qss.API_VERSION}/job/{jid}"
-                result = requests.get(
-                    getstr,
-                    headers=self._backend._provider._http_headers(),
-                    verify=(self._backend.remote_host == qss.API_URL),
-                ).json()
+            pending_jobs = {jid: fetched[jid] for jid in pending_ids}
+            delay = polling_strategy.next_delay(num_polls, pending_jobs)
+            time.sleep(self._poll_delay(deadline, delay))
 
-                if result["status"] == "Done":
-                    break
-                if result["status"] == "Error":
-                    raise qiskit.providers.JobError("API returned error:\n" + str(result))
-                time.sleep(wait)  # pragma: no cover b/c don't want slow test or mocking time
+    async def _poll_finished_async(
+        self,
+        timeout: float = None,
+        wait: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        polling_strategy: Optional[qss.polling.PollingStrategy] = None,
+    ) -> AsyncIterator[Dict[str, Dict]]:
+        """Asynchronous version of `_poll_finished`, which waits between rounds of polling
+        without blocking the event loop."""
+        deadline = time.time() + timeout if timeout else None
+        polling_strategy = self._get_polling_strategy(wait, polling_strategy)
+
+        # separate aggregated job_ids
+        pending_ids = list(dict.fromkeys(self._job_id.split(",")))
+
+        loop = asyncio.get_running_loop()
+        for num_polls in itertools.count(1):
+            fetched = await loop.run_in_executor(None, self._fetch_jobs, pending_ids, max_workers)
+            finished: Dict[str, Dict] = {}
+            self._record_finished(fetched, finished)
+            yield finished
+
+            pending_ids = [jid for jid in pending_ids if jid not in finished]
+            if not pending_ids:
+                break
 
-            result_list.append(result)
+            pending_jobs = {jid: fetched[jid] for jid in pending_ids}
+            delay = polling_strategy.next_delay(num_polls, pending_jobs)
+            await asyncio.sleep(self._poll_delay(deadline, delay))
 
-        return result_list
+    def _wait_for_results(
+        self,
+        timeout: float = None,
+        wait: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        polling_strategy: Optional[qss.polling.PollingStrategy] = None,
+    ) -> List[Dict]:
+        """Polls every sub-job of this (possibly aggregated) job until they are all done (see
+        `_poll_finished`).
+
+        Returns:
+            The result dictionary of each sub-job, in the order of the aggregated job id.
+        """
+        results: Dict[str, Dict] = {}
+        for finished in self._poll_finished(timeout, wait, max_workers, polling_strategy):
+            results.update(finished)
+        return [results[jid] for jid in self._job_id.split(",")]
 
-    def result(self, timeout: float = None, wait: float = 5) -> qiskit.result.Result:
-        # Get the result data of a circuit.
-        results = self._wait_for_results(timeout, wait)
+    async def _wait_for_results_async(
+        self,
+        timeout: float = None,
+        wait: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        polling_strategy: Optional[qss.polling.PollingStrategy] = None,
+    ) -> List[Dict]:
+        """Asynchronous version of `_wait_for_results`, which waits between rounds of polling
+        without blocking the event loop."""
+        results: Dict[str, Dict] = {}
+        async for finished in self._poll_finished_async(
+            timeout, wait, max_workers, polling_strategy
+        ):
+            results.update(finished)
+        return [results[jid] for jid in self._job_id.split(",")]
+
+    def _get_polling_strategy(
+        self, wait: Optional[float], polling_strategy: Optional[qss.polling.PollingStrategy]
+    ) -> qss.polling.PollingStrategy:
+        """Resolves the polling strategy to use, in order of precedence: the one given explicitly,
+        a fixed interval of `wait` seconds, the backend's "polling_strategy" option, and finally
+        the default exponential backoff."""
+        if polling_strategy is not None:
+            return polling_strategy
+        if wait is not None:
+            return qss.polling.FixedInterval(wait)
+        return self._backend.options.polling_strategy or qss.polling.ExponentialBackoff()
+
+    @staticmethod
+    def _record_finished(fetched: Dict[str, Dict], results: Dict[str, Dict]) -> None:
+        """Adds the finished sub-jobs in `fetched` to `results`, raising if any have failed."""
+        for jid, result in fetched.items():
+            if result["status"] == "Done":
+                results[jid] = result
+            elif result["status"] == "Error":
+                raise qiskit.providers.JobError("API returned error:\n" + str(result))
+
+    @staticmethod
+    def _poll_delay(deadline: Optional[float], delay: float) -> float:
+        """Clips `delay` so as not to sleep past the deadline, raising if it has already passed."""
+        if deadline is None:
+            return delay
+
+        remaining_time = deadline - time.time()
+        if remaining_time <= 0:
+            raise qiskit.providers.JobTimeoutError("Timed out waiting for result")
+        return min(delay, remaining_time)
+
+    def result(
+        self,
+        timeout: float = None,
+        wait: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        polling_strategy: Optional[qss.polling.PollingStrategy] = None,
+    ) -> qiskit.result.Result:
+        """Waits for every sub-job to finish and collects their results.
+
+        Args:
+            timeout: maximum number of seconds to wait for the whole batch to finish.
+            wait: if set, poll at this fixed interval (in seconds) instead of using a polling
+                strategy.
+            max_workers: maximum number of sub-jobs to poll concurrently (if bulk job requests
+                are not supported by the server).
+            polling_strategy: the strategy deciding how long to wait between successive rounds
+                of polling. Defaults to the backend's "polling_strategy" option, or (if that is
+                not set) to `qss.polling.ExponentialBackoff()`.
+        Returns:
+            A qiskit.result.Result containing the counts of every circuit in the batch.
+        """
+        results = self._wait_for_results(timeout, wait, max_workers, polling_strategy)
+        return self._to_qiskit_result(dict(zip(self._job_id.split(","), results)))
+
+    async def result_async(
+        self,
+        timeout: float = None,
+        wait: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        polling_strategy: Optional[qss.polling.PollingStrategy] = None,
+    ) -> qiskit.result.Result:
+        """Asynchronous version of `result`, which can be awaited from within an event loop.
+
+        Args:
+            timeout: maximum number of seconds to wait for the whole batch to finish.
+            wait: if set, poll at this fixed interval (in seconds) instead of using a polling
+                strategy.
+            max_workers: maximum number of sub-jobs to poll concurrently (if bulk job requests
+                are not supported by the server).
+            polling_strategy: the strategy deciding how long to wait between successive rounds
+                of polling. Defaults to the backend's "polling_strategy" option, or (if that is
+                not set) to `qss.polling.ExponentialBackoff()`.
+        Returns:
+            A qiskit.result.Result containing the counts of every circuit in the batch.
+        """
+        results = await self._wait_for_results_async(timeout, wait, max_workers, polling_strategy)
+        return self._to_qiskit_result(dict(zip(self._job_id.split(","), results)))
+
+    def iter_results(
+        self,
+        timeout: float = None,
+        wait: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        polling_strategy: Optional[qss.polling.PollingStrategy] = None,
+    ) -> Iterator[Tuple[int, Dict[str, int]]]:
+        """Yields the counts of each circuit in the batch as soon as its sub-job finishes, so that
+        they can be processed while the rest of the batch is still queued or running.
+
+        Args:
+            timeout: maximum number of seconds to wait for the whole batch to finish.
+            wait: if set, poll at this fixed interval (in seconds) instead of using a polling
+                strategy.
+            max_workers: maximum number of sub-jobs to poll concurrently (if bulk job requests
+                are not supported by the server).
+            polling_strategy: the strategy deciding how long to wait between successive rounds
+                of polling. Defaults to the backend's "polling_strategy" option, or (if that is
+                not set) to `qss.polling.ExponentialBackoff()`.
+        Yields:
+            The index of each circuit (in the batch) and its counts, in order of completion.
+        """
+        for finished in self._poll_finished(timeout, wait, max_workers, polling_strategy):
+            for index, experiment_result in self._experiment_results(finished).items():
+                yield index, experiment_result["data"]["counts"]
+
+    async def iter_results_async(
+        self,
+        timeout: float = None,
+        wait: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        polling_strategy: Optional[qss.polling.PollingStrategy] = None,
+    ) -> AsyncIterator[Tuple[int, Dict[str, int]]]:
+        """Asynchronous version of `iter_results`, for use with `async for`."""
+        async for finished in self._poll_finished_async(
+            timeout, wait, max_workers, polling_strategy
+        ):
+            for index, experiment_result in self._experiment_results(finished).items():
+                yield index, experiment_result["data"]["counts"]
+
+    def partial_result(self, max_workers: Optional[int] = None) -> qiskit.result.Result:
+        """Collects the results of the circuits whose sub-jobs have already finished, without
+        waiting for the rest.
+
+        Args:
+            max_workers: maximum number of sub-jobs to poll concurrently (if bulk job requests
+                are not supported by the server).
+        Returns:
+            A qiskit.result.Result with an entry for every circuit in the batch. Those which
+            haven't finished yet are marked as unsuccessful, with a status of "Pending" and no
+            counts (and `success` is only True if the whole batch has finished).
+        Raises:
+            qiskit.providers.JobError: if any sub-job returns an error.
+        """
+        job_ids = list(dict.fromkeys(self._job_id.split(",")))
+        finished: Dict[str, Dict] = {}
+        self._record_finished(self._fetch_jobs(job_ids, max_workers), finished)
+        return self._to_qiskit_result(finished)
+
+    def _experiment_results(self, results: Dict[str, Dict]) -> Dict[int, Dict]:
+        """Builds the (qiskit) result dictionary of every circuit in the batch whose sub-job is in
+        `results`, keyed by the index of the circuit."""
+        # Identical circuits deduplicated by `SuperstaQBackend.run` share a single sub-job (which
+        # was run with their combined shots), so its samples are split back out between them.
+        job_ids = self._job_id.split(",")
+        num_copies: Dict[str, int] = collections.Counter(job_ids)
+        split_samples: Dict[str, Iterator[Dict[str, int]]] = {}
+
+        experiment_results = {}
+        for index, jid in enumerate(job_ids):
+            if jid not in results:
+                continue
+
+            shots, samples = results[jid]["shots"], results[jid]["samples"]
+            if num_copies[jid] > 1 and samples:
+                if jid not in split_samples:
+                    split_samples[jid] = iter(_split_samples(samples, num_copies[jid], seed=jid))
+                samples = next(split_samples[jid])
+                shots = sum(samples.values())
+
+            experiment_results[index] = {
+                "success": True,
+                "shots": shots,
+                "data": {"counts": samples},
+            }
+
+        return experiment_results
+
+    def _to_qiskit_result(self, results: Dict[str, Dict]) -> qiskit.result.Result:
+        experiment_results = self._experiment_results(results)
+        pending_result = {"success": False, "shots": 0, "data": {}, "status": "Pending"}
 
         # create list of result dictionaries
-        results_list = []
-        for result in results:
-            results_list.append(
-                {"success": True, "shots": result["shots"], "data": {"counts": result["samples"]}}
-            )
+        num_circuits = len(self._job_id.split(","))
+        results_list = [experiment_results.get(i, pending_result) for i in range(num_circuits)]
 
         return qiskit.result.Result.from_dict(
             {
@@ -96,7 +399,7 @@ class SuperstaQJob(qiskit.providers.JobV1):
                 "qobj_id": -1,
                 "backend_name": self._backend._configuration.backend_name,
                 "backend_version": self._backend._configuration.backend_version,
-                "success": True,
+                "success": len(experiment_results) == num_circuits,
                 "job_id": self._job_id,
             }
         )
@@ -104,28 +407,17 @@ class SuperstaQJob(qiskit.providers.JobV1):
     def status(self) -> str:
         """Query for the job status."""
 
-        job_id_list = self._job_id.split(",")  # separate aggregated job ids
-
-        status = "Done"
+        job_id_list = list(dict.fromkeys(self._job_id.split(",")))  # separate aggregated job ids
+        statuses = {result["status"] for result in self._fetch_jobs(job_id_list).values()}
 
         # when we have multiple jobs, we will take the "worst status" among the jobs
         # For example, if any of the jobs are still queued, we report Queued as the status
         # for the entire batch.
-        for job_id in job_id_list:
-            get_url = f"{self._backend.remote_host}/{qss.API_VERSION}/job/{job_id}"
-            result = requests.get(
-                get_url,
-                headers=self._backend._provider._http_headers(),
-                verify=(self._backend.remote_host == qss.API_URL),
-            )
-
-            temp_status = result.json()["status"]
-
-            if temp_status == "Queued":
-                status = "Queued"
-                break
-            elif temp_status == "Running":
-                status = "Running"
+        status = "Done"
+        if "Queued" in statuses:
+            status = "Queued"
+        elif "Running" in statuses:
+            status = "Running"
 
         assert status in ["Queued", "Running", "Done"]
 
@@ -139,3 +431,28 @@ class SuperstaQJob(qiskit.providers.JobV1):
 
     def submit(self) -> None:
         raise NotImplementedError("Submit through SuperstaQBackend, not through SuperstaqJob")
+
+
+def _split_samples(samples: Dict[str, int], num_parts: int, seed: str) -> List[Dict[str, int]]:
+    """Randomly partitions samples into (almost) equally-sized parts, as if each part had been
+    sampled separately.
+
+    Args:
+        samples: the number of times each outcome was measured.
+        num_parts: the number of parts to split the samples into.
+        seed: a string seeding the partition, so that the same samples are always split the same
+            way.
+
+    Returns:
+        The samples in each part.
+    """
+    outcomes = list(samples)
+    remaining = np.array([samples[outcome] for outcome in outcomes], dtype=np.int64)
+    rng = np.random.default_rng(list(hashlib.sha256(seed.encode()).digest()))
+
+    parts = []
+    for num_remaining_parts in range(num_parts, 0, -1):
+        part = rng.multivariate_hypergeometric(remaining, remaining.sum() // num_remaining_parts)
+        remaining -= part
+        parts.append({outcome: int(count) for outcome, count in zip(outcomes, part) if count})
+    return parts
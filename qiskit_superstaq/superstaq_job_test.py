@@ -1,5 +1,9 @@
+import asyncio
+import http.server
 import json
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Tuple
 
 import pytest
 import qiskit
@@ -16,11 +20,13 @@ class MockConfiguration:
 class MockProvider(qss.superstaq_provider.SuperstaQProvider):
     def __init__(self) -> None:
         self.api_key = "very.tech"
+        self._session = self._create_session(pool_maxsize=16, max_retries=0, retry_backoff_factor=0)
 
 
 class MockDevice(qss.superstaq_backend.SuperstaQBackend):
     def __init__(self) -> None:
         self._provider = MockProvider()
+        self._options = self._default_options()
         self.diff = ""
 
     _configuration = MockConfiguration()
@@ -35,13 +41,6 @@ class MockJob(qss.superstaq_job.SuperstaQJob):
         self.qobj = None
 
 
-class MockJobs(qss.superstaq_job.SuperstaQJob):
-    def __init__(self) -> None:
-        self._backend = MockDevice()
-        self._job_id = "123abc,456def"
-        self.qobj = None
-
-
 class MockResponse:
     def __init__(self, status_str: str) -> None:
         self.content = json.dumps({"status": status_str, "samples": None, "shots": 100})
@@ -50,31 +49,188 @@ class MockResponse:
         return json.loads(self.content)
 
 
+class StandInServer(http.server.ThreadingHTTPServer):
+    """Local stand-in for the SuperstaQ API, which serves job results and records every request."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StandInRequestHandler)
+        self.jobs: Dict[str, Dict] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.num_connections = 0
+        self.bulk_supported = True
+
+    def get_request(self) -> Tuple[Any, Any]:
+        self.num_connections += 1
+        return super().get_request()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class StandInRequestHandler(http.server.BaseHTTPRequestHandler):
+    server: StandInServer
+    protocol_version = "HTTP/1.1"  # support keep-alive connections
+
+    def do_GET(self) -> None:
+        self.server.requests.append(("GET", self.path))
+        self._respond(200, self.server.jobs[self.path.split("/")[-1]])
+
+    def do_POST(self) -> None:
+        self.server.requests.append(("POST", self.path))
+        request_json = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if not self.server.bulk_supported:
+            self._respond(404, {"message": "Not found"})
+            return
+
+        self._respond(200, {jid: self.server.jobs[jid] for jid in request_json["job_ids"]})
+
+    def _respond(self, status_code: int, json_dict: Dict) -> None:
+        body = json.dumps(json_dict).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def stand_in_server() -> Iterator[StandInServer]:
+    server = StandInServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _stand_in_job(server: StandInServer, job_ids: List[str]) -> qss.superstaq_job.SuperstaQJob:
+    device = MockDevice()
+    device.remote_host = server.url
+    return qss.superstaq_job.SuperstaQJob(device, ",".join(job_ids))
+
+
 def test_wait_for_results(monkeypatch: Any) -> None:
 
     job = MockJob()
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Done"))
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Done"))
     assert job._wait_for_results() == [{"status": "Done", "samples": None, "shots": 100}]
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Error"))
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Error"))
 
     with pytest.raises(qiskit.providers.JobError, match="API returned error"):
         job._wait_for_results()
 
-    jobs = MockJobs()
-
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Done"))
-    assert jobs._wait_for_results() == [
-        {"status": "Done", "samples": None, "shots": 100},
-        {"status": "Done", "samples": None, "shots": 100},
+    responses = iter([MockResponse("Queued"), MockResponse("Running"), MockResponse("Done")])
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: next(responses))
+    assert job._wait_for_results(wait=0.01) == [{"status": "Done", "samples": None, "shots": 100}]
+
+
+def test_wait_for_results_bulk(stand_in_server: StandInServer) -> None:
+    job_ids = [f"job{i}" for i in range(8)]
+    for i, jid in enumerate(job_ids):
+        stand_in_server.jobs[jid] = {"status": "Done", "samples": {"0": i}, "shots": 100}
+
+    # all sub-jobs are fetched with a single request, and returned in their original order
+    job = _stand_in_job(stand_in_server, job_ids)
+    results = job._wait_for_results()
+    assert [result["samples"] for result in results] == [{"0": i} for i in range(8)]
+    assert stand_in_server.requests == [("POST", f"/{qss.API_VERSION}/get_jobs")]
+    assert job._backend._bulk_job_fetch_supported
+
+
+def test_wait_for_results_bulk_fallback(stand_in_server: StandInServer) -> None:
+    job_ids = [f"job{i}" for i in range(8)]
+    for i, jid in enumerate(job_ids):
+        stand_in_server.jobs[jid] = {"status": "Done", "samples": {"0": i}, "shots": 100}
+    stand_in_server.bulk_supported = False
+
+    # if bulk requests aren't supported, sub-jobs are fetched (concurrently) one at a time
+    job = _stand_in_job(stand_in_server, job_ids)
+    results = job._wait_for_results(max_workers=3)
+    assert [result["samples"] for result in results] == [{"0": i} for i in range(8)]
+    assert stand_in_server.requests[0] == ("POST", f"/{qss.API_VERSION}/get_jobs")
+    assert sorted(stand_in_server.requests[1:]) == [
+        ("GET", f"/{qss.API_VERSION}/job/{jid}") for jid in job_ids
     ]
+    assert not job._backend._bulk_job_fetch_supported
+
+    # the bulk endpoint isn't retried once the server has refused it
+    stand_in_server.requests.clear()
+    assert job.status() == qiskit.providers.JobStatus.DONE
+    assert len(stand_in_server.requests) == 8
+    assert all(method == "GET" for method, _ in stand_in_server.requests)
+
+
+def test_wait_for_results_errors(stand_in_server: StandInServer) -> None:
+    stand_in_server.jobs["123abc"] = {"status": "Running"}
+    stand_in_server.jobs["456def"] = {"status": "Error"}
+
+    # an erroring sub-job ends the batch without waiting on the remaining ones
+    job = _stand_in_job(stand_in_server, ["123abc", "456def"])
+    start_time = time.time()
+    with pytest.raises(qiskit.providers.JobError, match="API returned error"):
+        job._wait_for_results(wait=60)
+    assert time.time() - start_time < 30
+    assert len(stand_in_server.requests) == 1
+
+
+def test_wait_for_results_timeout(stand_in_server: StandInServer) -> None:
+    stand_in_server.jobs["123abc"] = {"status": "Done", "samples": None, "shots": 100}
+    stand_in_server.jobs["456def"] = {"status": "Running"}
+
+    # the timeout applies to the batch as a whole, and finished sub-jobs aren't polled again
+    job = _stand_in_job(stand_in_server, ["123abc", "456def"])
+    with pytest.raises(qiskit.providers.JobTimeoutError, match="Timed out"):
+        job._wait_for_results(timeout=0.1, wait=0.01)
+    assert ("GET", f"/{qss.API_VERSION}/job/456def") in stand_in_server.requests
+    assert ("GET", f"/{qss.API_VERSION}/job/123abc") not in stand_in_server.requests
+
+
+def test_polling_strategy(monkeypatch: Any) -> None:
+    job = MockJob()
+
+    sleeps: List[float] = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    def _mock_get(num_running: int) -> None:
+        responses = iter([MockResponse("Running")] * num_running + [MockResponse("Done")])
+        monkeypatch.setattr(requests.Session, "get", lambda *_, **__: next(responses))
+
+    # defaults to exponential backoff
+    _mock_get(3)
+    job.result()
+    assert len(sleeps) == 3
+    assert 0 < sleeps[0] < sleeps[2] <= 60
+
+    # the backend's polling strategy option is used if set...
+    job._backend.set_options(polling_strategy=qss.polling.FixedInterval(2))
+    sleeps.clear()
+    _mock_get(3)
+    job.result()
+    assert sleeps == [2, 2, 2]
+
+    # ...but can be overridden by a fixed `wait`...
+    sleeps.clear()
+    _mock_get(2)
+    job.result(wait=0.5)
+    assert sleeps == [0.5, 0.5]
+
+    # ...or with a polling strategy for an individual call
+    sleeps.clear()
+    _mock_get(4)
+    job.result(polling_strategy=qss.polling.ExponentialBackoff(1, 5, multiplier=2, jitter=0))
+    assert sleeps == [1, 2, 4, 5]
 
 
 def test_result(monkeypatch: Any) -> None:
     job = MockJob()
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Done"))
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Done"))
 
     expected_results = [{"success": True, "shots": 100, "data": {"counts": None}}]
 
@@ -95,18 +251,160 @@ def test_result(monkeypatch: Any) -> None:
     assert ans.job_id == expected.job_id
 
 
+def test_result_async(stand_in_server: StandInServer) -> None:
+    stand_in_server.jobs["123abc"] = {"status": "Done", "samples": {"11": 50}, "shots": 50}
+    stand_in_server.jobs["456def"] = {"status": "Done", "samples": {"00": 50}, "shots": 50}
+    stand_in_server.jobs["789ghi"] = {"status": "Running"}
+
+    job = _stand_in_job(stand_in_server, ["123abc", "456def"])
+    other_job = _stand_in_job(stand_in_server, ["789ghi"])
+
+    async def _gather() -> Tuple[Any, Any]:
+        return await asyncio.gather(
+            job.result_async(),
+            other_job.result_async(timeout=0.1, wait=0.01),
+            return_exceptions=True,
+        )
+
+    # one job's wait doesn't hold up the other
+    result, error = asyncio.run(_gather())
+    assert result.get_counts() == [{"11": 50}, {"00": 50}]
+    assert result.job_id == "123abc,456def"
+    assert isinstance(error, qiskit.providers.JobTimeoutError)
+
+
+def test_result_deduplicated(stand_in_server: StandInServer) -> None:
+    samples = {"00": 140, "01": 70, "11": 90}
+    stand_in_server.jobs["123abc"] = {"status": "Done", "samples": samples, "shots": 300}
+    stand_in_server.jobs["456def"] = {"status": "Done", "samples": {"10": 50}, "shots": 50}
+
+    # the samples of sub-jobs shared by identical circuits are split between them
+    job = _stand_in_job(stand_in_server, ["123abc", "456def", "123abc", "123abc"])
+    result = job.result()
+    counts = result.get_counts()
+    assert counts[1] == {"10": 50}
+    assert [sum(counts[i].values()) for i in [0, 2, 3]] == [100, 100, 100]
+    assert [result.results[i].shots for i in [0, 2, 3]] == [100, 100, 100]
+    for outcome, num_samples in samples.items():
+        assert sum(counts[i].get(outcome, 0) for i in [0, 2, 3]) == num_samples
+
+    # and always in the same way
+    assert job.result().get_counts() == counts
+
+    assert qss.superstaq_job._split_samples({"0": 3, "1": 2}, 2, seed="abc") in [
+        [{"0": 2}, {"0": 1, "1": 2}],
+        [{"0": 1, "1": 1}, {"0": 2, "1": 1}],
+        [{"1": 2}, {"0": 3}],
+    ]
+
+
+def test_iter_results(stand_in_server: StandInServer) -> None:
+    samples = {"00": 60, "11": 40}
+    stand_in_server.jobs["123abc"] = {"status": "Running"}
+    stand_in_server.jobs["456def"] = {"status": "Done", "samples": samples, "shots": 100}
+    stand_in_server.jobs["789ghi"] = {"status": "Queued"}
+
+    job = _stand_in_job(stand_in_server, ["123abc", "456def", "789ghi", "456def"])
+    # counts are yielded as soon as each sub-job finishes
+    iterator = job.iter_results(wait=0.01)
+    first_results = [next(iterator), next(iterator)]
+    assert [index for index, _ in first_results] == [1, 3]
+    assert sum(first_results[0][1].values()) == sum(first_results[1][1].values()) == 50
+
+    stand_in_server.jobs["789ghi"] = {"status": "Done", "samples": {"01": 10}, "shots": 10}
+    assert next(iterator) == (2, {"01": 10})
+
+    stand_in_server.jobs["123abc"] = {"status": "Done", "samples": {"10": 20}, "shots": 20}
+    assert list(iterator) == [(0, {"10": 20})]
+
+    # and match the full result
+    counts = job.result().get_counts()
+    assert counts == [{"10": 20}, first_results[0][1], {"01": 10}, first_results[1][1]]
+
+    stand_in_server.jobs["123abc"] = {"status": "Error", "data": "failed"}
+    with pytest.raises(qiskit.providers.JobError, match="API returned error"):
+        _ = list(job.iter_results(wait=0.01))
+
+
+def test_iter_results_async(stand_in_server: StandInServer) -> None:
+    stand_in_server.jobs["123abc"] = {"status": "Running"}
+    stand_in_server.jobs["456def"] = {"status": "Done", "samples": {"00": 50}, "shots": 50}
+
+    job = _stand_in_job(stand_in_server, ["123abc", "456def"])
+
+    async def _collect() -> List[Tuple[int, Dict[str, int]]]:
+        results = []
+        async for index, counts in job.iter_results_async(wait=0.01):
+            results.append((index, counts))
+            stand_in_server.jobs["123abc"] = {"status": "Done", "samples": {"11": 50}, "shots": 50}
+        return results
+
+    assert asyncio.run(_collect()) == [(1, {"00": 50}), (0, {"11": 50})]
+
+
+def test_partial_result(stand_in_server: StandInServer) -> None:
+    stand_in_server.jobs["123abc"] = {"status": "Running"}
+    stand_in_server.jobs["456def"] = {"status": "Done", "samples": {"00": 50}, "shots": 50}
+
+    job = _stand_in_job(stand_in_server, ["123abc", "456def"])
+    result = job.partial_result()
+    assert not result.success
+    assert not result.results[0].success
+    assert result.results[0].status == "Pending"
+    assert result.results[1].success
+    assert result.get_counts(1) == {"00": 50}
+    with pytest.raises(qiskit.QiskitError):
+        _ = result.get_counts(0)
+
+    stand_in_server.jobs["123abc"] = {"status": "Done", "samples": {"11": 50}, "shots": 50}
+    result = job.partial_result()
+    assert result.success
+    assert result.get_counts() == [{"11": 50}, {"00": 50}]
+
+
 def test_status(monkeypatch: Any) -> None:
     job = MockJob()
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Queued"))
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Queued"))
+    assert job.status() == qiskit.providers.JobStatus.QUEUED
+
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Running"))
+    assert job.status() == qiskit.providers.JobStatus.RUNNING
+
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Done"))
+    assert job.status() == qiskit.providers.JobStatus.DONE
+
+
+def test_status_bulk(stand_in_server: StandInServer) -> None:
+    job = _stand_in_job(stand_in_server, ["123abc", "456def"])
+
+    stand_in_server.jobs["123abc"] = {"status": "Done"}
+    stand_in_server.jobs["456def"] = {"status": "Queued"}
     assert job.status() == qiskit.providers.JobStatus.QUEUED
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Running"))
+    stand_in_server.jobs["456def"] = {"status": "Running"}
     assert job.status() == qiskit.providers.JobStatus.RUNNING
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Done"))
+    stand_in_server.jobs["456def"] = {"status": "Done"}
     assert job.status() == qiskit.providers.JobStatus.DONE
 
+    # each status check takes a single request, however many sub-jobs there are
+    assert len(stand_in_server.requests) == 3
+
+
+def test_connection_reuse(stand_in_server: StandInServer) -> None:
+    stand_in_server.jobs["123abc"] = {"status": "Running"}
+    job = _stand_in_job(stand_in_server, ["123abc"])
+
+    # repeated polls reuse the provider's keep-alive connection
+    for _ in range(5):
+        assert job.status() == qiskit.providers.JobStatus.RUNNING
+    assert len(stand_in_server.requests) == 5
+    assert stand_in_server.num_connections == 1
+
+    # headers are set once on the shared session rather than rebuilt for every request
+    assert job._backend._provider._session.headers["Authorization"] == "very.tech"
+
 
 def test_submit() -> None:
     job = qss.superstaq_job.SuperstaQJob(backend=MockDevice(), job_id="12345")
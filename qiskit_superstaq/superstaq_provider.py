@@ -12,11 +12,21 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import asyncio
+import functools
+import gzip
+import json
+import math
 import os
-from typing import List, Optional, Union
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
 
 import applications_superstaq
 import qiskit
+import requests
+import requests.adapters
+import urllib3
 from applications_superstaq import finance
 from applications_superstaq import logistics
 from applications_superstaq import superstaq_client
@@ -24,6 +34,170 @@ from applications_superstaq import user_config
 
 import qiskit_superstaq as qss
 
+try:
+    import zstandard
+except ModuleNotFoundError:
+    zstandard = None
+
+T = TypeVar("T")
+
+
+# request bodies smaller than this (in bytes) aren't worth compressing
+MIN_COMPRESSED_REQUEST_SIZE = 1024
+
+SUPPORTED_COMPRESSIONS = ("gzip", "zstd")
+
+# how long (in seconds) the list of available backends is cached before it is fetched again
+DEFAULT_BACKENDS_TTL = 3600.0
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    """Compresses a request body with the given content-coding ("gzip" or "zstd")."""
+    if compression == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+class _SuperstaQClient(superstaq_client._SuperstaQClient):
+    """SuperstaQ API client which sends all of its requests through a shared requests.Session, and
+    (optionally) compresses the bodies of large POST requests."""
+
+    def __init__(
+        self, session: requests.Session, compression: Optional[str] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self._session = session
+        self.compression = compression
+
+    def get_request(self, endpoint: str) -> dict:
+        def request() -> requests.Response:
+            return self._session.get(
+                f"{self.url}{endpoint}",
+                headers=self.headers,
+                verify=self.verify_https,
+            )
+
+        return self._make_request(request).json()
+
+    def post_request(
+        self, endpoint: str, json_dict: Dict[str, Any], headers: Optional[Dict[str, str]] = None
+    ) -> dict:
+        request_headers = {**self.headers, **(headers or {})}
+
+        if self.compression is None:
+
+            def request() -> requests.Response:
+                return self._session.post(
+                    f"{self.url}{endpoint}",
+                    json=json_dict,
+                    headers=request_headers,
+                    verify=self.verify_https,
+                )
+
+            return self._make_request(request).json()
+
+        body = json.dumps(json_dict, allow_nan=False).encode()
+        compressed_bodies: Dict[str, bytes] = {}
+
+        def compressed_request() -> requests.Response:
+            while self.compression is not None and len(body) >= MIN_COMPRESSED_REQUEST_SIZE:
+                compression = self.compression
+                if compression not in compressed_bodies:
+                    compressed_bodies[compression] = _compress(body, compression)
+
+                response = self._post(
+                    endpoint, compressed_bodies[compression], request_headers, compression
+                )
+                if response.status_code != requests.codes.unsupported_media_type:
+                    return response
+                self._negotiate_compression(response, excluded=compressed_bodies)
+
+            return self._post(endpoint, body, request_headers)
+
+        return self._make_request(compressed_request).json()
+
+    def _post(
+        self,
+        endpoint: str,
+        body: bytes,
+        headers: Dict[str, str],
+        compression: Optional[str] = None,
+    ) -> requests.Response:
+        if compression is not None:
+            headers = {**headers, "Content-Encoding": compression}
+        return self._session.post(
+            f"{self.url}{endpoint}", data=body, headers=headers, verify=self.verify_https
+        )
+
+    def create_job(
+        self,
+        serialized_circuits: Dict[str, str],
+        repetitions: Optional[int] = None,
+        target: Optional[str] = None,
+        ibmq_pulse: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> dict:
+        """Create a job.
+
+        Args:
+            serialized_circuits: The serialized representation of the circuit to run.
+            repetitions: The number of times to repeat the circuit.
+            target: If supplied the target to run on. If not set, uses `default_target`.
+            ibmq_pulse: Specify whether to run the job using SuperstaQ's pulse-level optimizations
+            idempotency_key: If supplied, sent in the "Idempotency-Key" header of the request, so
+                that the server only creates the job(s) once if the request is repeated (e.g. when
+                retrying a request which timed out).
+
+        Returns:
+            The json body of the response as a dict.
+        """
+        json_dict: Dict[str, Any] = {
+            **serialized_circuits,
+            "backend": self._target(target),
+            "shots": repetitions,
+        }
+        if ibmq_pulse:
+            json_dict["ibmq_pulse"] = ibmq_pulse
+
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        return self.post_request("/jobs", json_dict, headers=headers)
+
+    def target_info(self, targets: List[str]) -> dict:
+        """Gets the metadata (e.g. number of qubits, native gates, coupling map and maximum shots)
+        of one or more targets in a single request.
+
+        Args:
+            targets: The names of the targets.
+
+        Returns:
+            The json body of the response as a dict, with the metadata of each target under
+            "target_info".
+        """
+        return self.post_request("/target_info", {"targets": targets})
+
+    def _negotiate_compression(self, response: requests.Response, excluded: Iterable[str]) -> None:
+        """Picks another compression (or none at all) for future requests after the server refuses
+        a compressed request body. Following RFC 7694, the server may list the content-codings it
+        does accept in the Accept-Encoding header of its response.
+
+        Args:
+            response: the server's (415 Unsupported Media Type) response.
+            excluded: compressions which shouldn't be picked (e.g. because they have already been
+                refused).
+        """
+        accepted = response.headers.get("Accept-Encoding", "")
+        accepted_compressions = {coding.split(";")[0].strip() for coding in accepted.split(",")}
+        self.compression = next(
+            (
+                compression
+                for compression in SUPPORTED_COMPRESSIONS
+                if compression in accepted_compressions
+                and compression not in excluded
+                and (compression != "zstd" or zstandard is not None)
+            ),
+            None,
+        )
+
 
 class SuperstaQProvider(
     qiskit.providers.ProviderV1, finance.Finance, logistics.Logistics, user_config.UserConfig
@@ -60,9 +234,29 @@ class SuperstaQProvider(
             api_version: Version of the API.
             max_retry_seconds: The number of seconds to retry calls for. Defaults to one hour.
             verbose: Whether to print to stdio and stderr on retriable errors.
+            pool_maxsize: The maximum number of keep-alive connections to SuperstaQ which are
+                kept open for reuse by this provider and its backends and jobs.
+            max_retries: The number of times to retry a request (with exponential backoff) after
+                a connection error or a 502, 503 or 504 response.
+            retry_backoff_factor: The backoff factor for the retry delays. The nth retry is made
+                after `retry_backoff_factor * 2 ** (n - 1)` seconds.
+            compile_cache: An optional `qss.compile_cache.CompileCache`. If provided, responses to
+                (seeded) compile requests are cached in it, so that compiling the same circuit(s)
+                for the same target and options again doesn't require another request.
+            compression: If set to "gzip" or "zstd" (which requires the `zstandard` package),
+                large request bodies (e.g. serialized circuits) are compressed before being sent.
+                If the server refuses them, another compression it accepts is used instead (or
+                requests are sent uncompressed). Independently, responses are compressed with any
+                encoding supported by both the server and `requests`.
+            backends_ttl: The number of seconds for which the list of available backends (and
+                their target metadata) is cached by `backends`, before it is fetched again.
+            backends_snapshot: The path of a file written by `save_backends_snapshot`. If
+                provided, backends (and their target metadata) are loaded from it instead of being
+                fetched from SuperstaQ, until `refresh` is called.
         Raises:
             EnvironmentError: if the `api_key` is None and has no corresponding environment
                 variable set.
+            ValueError: if `compression` is not supported.
     """
 
     def __init__(
@@ -73,6 +267,13 @@ class SuperstaQProvider(
         api_version: str = applications_superstaq.API_VERSION,
         max_retry_seconds: int = 3600,
         verbose: bool = False,
+        pool_maxsize: int = 16,
+        max_retries: int = 3,
+        retry_backoff_factor: float = 0.5,
+        compile_cache: Optional["qss.compile_cache.CompileCache"] = None,
+        compression: Optional[str] = None,
+        backends_ttl: float = DEFAULT_BACKENDS_TTL,
+        backends_snapshot: Optional[str] = None,
     ) -> None:
         self._name = "superstaq_provider"
         self.remote_host = (
@@ -85,7 +286,20 @@ class SuperstaQProvider(
                 "SUPERSTAQ_API_KEY was also not set."
             )
 
-        self._client = superstaq_client._SuperstaQClient(
+        # a single pooled, keep-alive session shared by all HTTP traffic of this provider (and its
+        # backends and jobs), so that repeated requests don't each pay for a new TLS handshake
+        self._session = self._create_session(pool_maxsize, max_retries, retry_backoff_factor)
+
+        self._compile_cache = compile_cache
+
+        if compression is not None and compression not in SUPPORTED_COMPRESSIONS:
+            raise ValueError(f"Compression must be one of {SUPPORTED_COMPRESSIONS} (or None).")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package to be installed.")
+
+        self._client: _SuperstaQClient = _SuperstaQClient(
+            session=self._session,
+            compression=compression,
             client_name="qiskit-superstaq",
             remote_host=self.remote_host,
             api_key=self.api_key,
@@ -95,6 +309,17 @@ class SuperstaQProvider(
             verbose=verbose,
         )
 
+        # backends are created once (by name) and reused, and the list of available backends is
+        # cached for `backends_ttl` seconds
+        self.backends_ttl = backends_ttl
+        self._backends: Dict[str, qss.superstaq_backend.SuperstaQBackend] = {}
+        self._backend_names: List[str] = []
+        self._backends_expiry = -math.inf
+        self._backends_lock = threading.RLock()
+
+        if backends_snapshot is not None:
+            self._load_backends_snapshot(backends_snapshot)
+
     def __str__(self) -> str:
         return f"<SuperstaQProvider(name={self._name})>"
 
@@ -103,19 +328,163 @@ class SuperstaQProvider(
         return repr1 + f"api_key={self.api_key})>"
 
     def get_backend(self, backend: str) -> "qss.superstaq_backend.SuperstaQBackend":
-        return qss.superstaq_backend.SuperstaQBackend(
-            provider=self, remote_host=self.remote_host, backend=backend
-        )
+        """Returns the backend with the given name, which is created the first time it's requested
+        and reused thereafter."""
+        with self._backends_lock:
+            if backend not in self._backends:
+                if backend == qss.local_simulator.LOCAL_SIMULATOR_NAME:
+                    self._backends[backend] = qss.local_simulator.LocalSimulatorBackend(self)
+                else:
+                    self._backends[backend] = qss.superstaq_backend.SuperstaQBackend(
+                        provider=self, remote_host=self.remote_host, backend=backend
+                    )
+            return self._backends[backend]
 
     def get_access_token(self) -> Optional[str]:
         return self.api_key
 
     def backends(self) -> List[qss.superstaq_backend.SuperstaQBackend]:
-        ss_backends = self._client.get_backends()["superstaq_backends"]
-        backends = []
-        for backend_str in ss_backends["compile-and-run"]:
-            backends.append(self.get_backend(backend_str))
-        return backends
+        """Returns every SuperstaQ backend. The list of backends (and the metadata of all of their
+        targets) is fetched in a single pair of requests, and then cached for `backends_ttl`
+        seconds (see `refresh`)."""
+        with self._backends_lock:
+            if time.monotonic() >= self._backends_expiry:
+                self.refresh()
+            return [self._backends[backend_str] for backend_str in self._backend_names]
+
+    def refresh(self) -> None:
+        """Fetches the list of available backends and their target metadata from SuperstaQ,
+        updating the configurations of existing backends in place."""
+        with self._backends_lock:
+            ss_backends = self._client.get_backends()["superstaq_backends"]
+            target_info = self._fetch_target_info(ss_backends["compile-and-run"])
+            for backend_str in ss_backends["compile-and-run"]:
+                self.get_backend(backend_str)._set_target_info(target_info.get(backend_str))
+
+            self._backend_names = list(ss_backends["compile-and-run"])
+            self._backends_expiry = time.monotonic() + self.backends_ttl
+
+    def save_backends_snapshot(self, path: str) -> None:
+        """Saves the available backends and their target metadata to a JSON file, from which
+        future providers can be initialized without any requests (see `backends_snapshot`).
+
+        Args:
+            path: The path of the file to write.
+        """
+        backends = self.backends()
+        snapshot = {
+            "backends": [backend.name() for backend in backends],
+            "target_info": {backend.name(): backend._target_info for backend in backends},
+        }
+        with open(path, "w") as file:
+            json.dump(snapshot, file)
+
+    def _load_backends_snapshot(self, path: str) -> None:
+        """Populates the backend registry from a file written by `save_backends_snapshot`. Neither
+        the registry nor the loaded configurations expire until `refresh` is called."""
+        with open(path) as file:
+            snapshot = json.load(file)
+
+        for backend_str in snapshot["backends"]:
+            backend = self.get_backend(backend_str)
+            backend._set_target_info(snapshot["target_info"].get(backend_str))
+            backend._configuration_expiry = math.inf
+
+        self._backend_names = list(snapshot["backends"])
+        self._backends_expiry = math.inf
+
+    def _fetch_target_info(self, targets: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetches the metadata of the given targets, returning an empty dictionary if the server
+        can't provide it (so that backends fall back to placeholder configurations)."""
+        try:
+            json_dict = self._client.target_info(targets)
+        except applications_superstaq.SuperstaQException:
+            return {}
+
+        target_info = json_dict.get("target_info") if isinstance(json_dict, dict) else None
+        return target_info if isinstance(target_info, dict) else {}
+
+    def _create_session(
+        self, pool_maxsize: int, max_retries: int, retry_backoff_factor: float
+    ) -> requests.Session:
+        retry = urllib3.util.Retry(
+            total=max_retries,
+            backoff_factor=retry_backoff_factor,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self._http_headers())
+        return session
+
+    async def _run_async(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs a (blocking) provider method in the event loop's executor, so that serialization
+        and HTTP requests don't block other coroutines."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    def _compile(
+        self, endpoint: str, request_json: Dict[str, Any], cacheable: bool = True
+    ) -> Dict[str, Any]:
+        """Sends a request to the given compile endpoint of the API client, returning the cached
+        response instead if this provider has a compile cache and the identical request has been
+        made before."""
+        if self._compile_cache is None or not cacheable:
+            return getattr(self._client, endpoint)(request_json)
+
+        key = self._compile_cache.key(self._client.url, endpoint, request_json, self.api_key)
+        json_dict = self._compile_cache.get(key)
+        if json_dict is None:
+            json_dict = getattr(self._client, endpoint)(request_json)
+            self._compile_cache.put(key, json_dict)
+        return json_dict
+
+    def _validate(
+        self, circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]], target: str
+    ) -> None:
+        """Checks circuits before they are compiled, against the target's metadata if it has
+        already been fetched (see `qss.validation.validate_circuits`)."""
+        backend = self._backends.get(target)
+        configuration = backend._configuration if backend is not None else None
+        qss.validation.validate_circuits(circuits, configuration)
+
+    def ibmq_set_token(self, token: str) -> Dict[str, str]:
+        """Sets IBMQ token field in database (clearing the compile cache, if any, as compile output
+        may depend on it).
+
+        Args:
+            token: IBMQ token string.
+
+        Returns:
+            JSON dictionary containing status of update (whether or not it failed).
+        """
+        try:
+            return super().ibmq_set_token(token)
+        finally:
+            self._clear_compile_cache()
+
+    def aqt_upload_configs(self, pulses_file_path: str, variables_file_path: str) -> Dict[str, str]:
+        """Uploads configs for AQT (clearing the compile cache, if any, as compile output depends
+        on them).
+
+        Args:
+            pulses_file_path: The filepath for Pulses.yaml
+            variables_file_path: The filepath for Variables.yaml
+        Returns:
+            A dictionary of of the status of the update (Whether or not it failed)
+        """
+        try:
+            return super().aqt_upload_configs(pulses_file_path, variables_file_path)
+        finally:
+            self._clear_compile_cache()
+
+    def _clear_compile_cache(self) -> None:
+        if self._compile_cache is not None:
+            self._compile_cache.clear()
 
     def _http_headers(self) -> dict:
         return {
@@ -140,11 +509,12 @@ class SuperstaQProvider(
             pulse sequence corresponding to the optimized qiskit.QuantumCircuit(s) and the
             .pulse_list(s) attribute is the list(s) of cycles.
         """
+        self._validate(circuits, target)
         serialized_circuits = qss.serialization.serialize_circuits(circuits)
         circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
 
-        json_dict = self._client.aqt_compile(
-            {"qiskit_circuits": serialized_circuits, "backend": target}
+        json_dict = self._compile(
+            "aqt_compile", {"qiskit_circuits": serialized_circuits, "backend": target}
         )
 
         return qss.compiler_output.read_json_aqt(json_dict, circuits_is_list)
@@ -171,6 +541,7 @@ class SuperstaQProvider(
             pulse sequence corresponding to the QuantumCircuits and the .pulse_list(s) attribute is
             the list(s) of cycles.
         """
+        self._validate(circuit, target)
         serialized_circuit = qss.serialization.serialize_circuits(circuit)
 
         request_json = {
@@ -182,7 +553,8 @@ class SuperstaQProvider(
         if random_seed is not None:
             request_json["random_seed"] = random_seed
 
-        json_dict = self._client.post_request("/aqt_compile", request_json)
+        # without a seed each request is randomized, so the response can't be reused
+        json_dict = self._compile("aqt_compile", request_json, cacheable=random_seed is not None)
         return qss.compiler_output.read_json_aqt(json_dict, True)
 
     def ibmq_compile(
@@ -191,20 +563,25 @@ class SuperstaQProvider(
         target: str = "ibmq_qasm_simulator",
     ) -> "qss.compiler_output.CompilerOutput":
         """Returns pulse schedule(s) for the given circuit(s) and target."""
+        self._validate(circuits, target)
         serialized_circuits = qss.serialization.serialize_circuits(circuits)
 
-        json_dict = self._client.ibmq_compile(
-            {"qiskit_circuits": serialized_circuits, "backend": target}
+        json_dict = self._compile(
+            "ibmq_compile", {"qiskit_circuits": serialized_circuits, "backend": target}
         )
-        compiled_circuits = qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"])
-        pulses = applications_superstaq.converters.deserialize(json_dict["pulses"])
+        pulses_str = json_dict["pulses"]
 
+        # circuits and pulse schedules are only deserialized when first accessed
         if isinstance(circuits, qiskit.QuantumCircuit):
-            return qss.compiler_output.CompilerOutput(
-                circuits=compiled_circuits[0], pulse_sequences=pulses[0]
+            return qss.compiler_output.CompilerOutput._lazy(
+                circuits_is_list=False,
+                circuit=lambda: qss.compiler_output._deserialize_circuits(json_dict)[0],
+                pulse_sequence=lambda: applications_superstaq.converters.deserialize(pulses_str)[0],
             )
-        return qss.compiler_output.CompilerOutput(
-            circuits=compiled_circuits, pulse_sequences=pulses
+        return qss.compiler_output.CompilerOutput._lazy(
+            circuits_is_list=True,
+            circuits=lambda: qss.compiler_output._deserialize_circuits(json_dict),
+            pulse_sequences=lambda: applications_superstaq.converters.deserialize(pulses_str),
         )
 
     def qscout_compile(
@@ -222,10 +599,11 @@ class SuperstaQProvider(
             pulse sequence corresponding to the optimized qiskit.QuantumCircuit(s) and the
             .pulse_list(s) attribute is the list(s) of cycles.
         """
+        self._validate(circuits, target)
         serialized_circuits = qss.serialization.serialize_circuits(circuits)
         circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
-        json_dict = self._client.qscout_compile(
-            {"qiskit_circuits": serialized_circuits, "backend": target}
+        json_dict = self._compile(
+            "qscout_compile", {"qiskit_circuits": serialized_circuits, "backend": target}
         )
         return qss.compiler_output.read_json_qscout(json_dict, circuits_is_list)
 
@@ -242,10 +620,11 @@ class SuperstaQProvider(
         Returns:
             object whose .circuit(s) attribute is an optimized qiskit QuantumCircuit(s)
         """
+        self._validate(circuits, target)
         serialized_circuits = qss.serialization.serialize_circuits(circuits)
         circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
-        json_dict = self._client.cq_compile(
-            {"qiskit_circuits": serialized_circuits, "backend": target}
+        json_dict = self._compile(
+            "cq_compile", {"qiskit_circuits": serialized_circuits, "backend": target}
         )
 
         return qss.compiler_output.read_json_only_circuits(json_dict, circuits_is_list)
@@ -259,10 +638,11 @@ class SuperstaQProvider(
 
         Pulser must be installed for returned object to correctly deserialize to a pulse schedule.
         """
+        self._validate(circuits, target)
         serialized_circuits = qss.serialization.serialize_circuits(circuits)
 
-        json_dict = self._client.neutral_atom_compile(
-            {"qiskit_circuits": serialized_circuits, "backend": target}
+        json_dict = self._compile(
+            "neutral_atom_compile", {"qiskit_circuits": serialized_circuits, "backend": target}
         )
         try:
             pulses = applications_superstaq.converters.deserialize(json_dict["pulses"])
@@ -274,3 +654,59 @@ class SuperstaQProvider(
         if isinstance(circuits, qiskit.QuantumCircuit):
             return pulses[0]
         return pulses
+
+    async def aqt_compile_async(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        target: str = "keysight",
+    ) -> "qss.compiler_output.CompilerOutput":
+        """Asynchronous version of `aqt_compile`."""
+        return await self._run_async(self.aqt_compile, circuits, target=target)
+
+    async def aqt_compile_eca_async(
+        self,
+        circuit: qiskit.QuantumCircuit,
+        num_equivalent_circuits: int,
+        random_seed: Optional[int] = None,
+        target: str = "keysight",
+    ) -> "qss.compiler_output.CompilerOutput":
+        """Asynchronous version of `aqt_compile_eca`."""
+        return await self._run_async(
+            self.aqt_compile_eca,
+            circuit,
+            num_equivalent_circuits,
+            random_seed=random_seed,
+            target=target,
+        )
+
+    async def ibmq_compile_async(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        target: str = "ibmq_qasm_simulator",
+    ) -> "qss.compiler_output.CompilerOutput":
+        """Asynchronous version of `ibmq_compile`."""
+        return await self._run_async(self.ibmq_compile, circuits, target=target)
+
+    async def qscout_compile_async(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        target: str = "qscout",
+    ) -> "qss.compiler_output.CompilerOutput":
+        """Asynchronous version of `qscout_compile`."""
+        return await self._run_async(self.qscout_compile, circuits, target=target)
+
+    async def cq_compile_async(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        target: str = "cq",
+    ) -> "qss.compiler_output.CompilerOutput":
+        """Asynchronous version of `cq_compile`."""
+        return await self._run_async(self.cq_compile, circuits, target=target)
+
+    async def neutral_atom_compile_async(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        target: str = "neutral_atom_qpu",
+    ) -> Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]:
+        """Asynchronous version of `neutral_atom_compile`."""
+        return await self._run_async(self.neutral_atom_compile, circuits, target=target)
@@ -1,11 +1,18 @@
+import asyncio
+import gzip
+import json
+import operator
 import os
 import textwrap
+from typing import Any
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
 import applications_superstaq
 import pytest
 import qiskit
+import requests
+import requests.adapters
 
 import qiskit_superstaq as qss
 
@@ -68,8 +75,177 @@ def test_provider() -> None:
 
     mock_client = MagicMock()
     mock_client.get_backends.return_value = backends
+    mock_client.target_info.return_value = {
+        "target_info": {"ibmq_qasm_simulator": {"num_qubits": 32}, "ionq_ion_qpu": {}}
+    }
     ss_provider._client = mock_client
-    assert ss_provider.backends() == expected_backends
+    ss_backends = ss_provider.backends()
+    assert ss_backends == expected_backends
+
+    # the metadata of every backend is fetched in a single request
+    mock_client.target_info.assert_called_once_with(backend_names)
+    assert [backend.configuration().n_qubits for backend in ss_backends[:3]] == [32, -1, -1]
+    mock_client.target_info.assert_called_once()
+
+
+def test_backends_registry(tmp_path: Any) -> None:
+    ss_provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
+    backend = ss_provider.get_backend("ibmq_qasm_simulator")
+    assert ss_provider.get_backend("ibmq_qasm_simulator") is backend
+    assert ss_provider.get_backend("local_simulator") is ss_provider.get_backend("local_simulator")
+
+    mock_client = MagicMock()
+    mock_client.get_backends.return_value = {
+        "superstaq_backends": {"compile-and-run": ["ibmq_qasm_simulator", "ibmq_lima_qpu"]}
+    }
+    mock_client.target_info.return_value = {
+        "target_info": {"ibmq_lima_qpu": {"num_qubits": 5, "coupling_map": [[0, 1], [1, 2]]}}
+    }
+    ss_provider._client = mock_client
+
+    # the registry is cached (and returns the same backend instances) until its TTL expires
+    backends = ss_provider.backends()
+    assert backends[0] is backend
+    assert ss_provider.backends() == backends
+    assert all(map(operator.is_, ss_provider.backends(), backends))
+    mock_client.get_backends.assert_called_once()
+    mock_client.target_info.assert_called_once()
+
+    # an explicit refresh updates the existing backends in place
+    mock_client.target_info.return_value = {"target_info": {"ibmq_lima_qpu": {"num_qubits": 7}}}
+    ss_provider.refresh()
+    assert mock_client.get_backends.call_count == 2
+    assert backends[1].configuration().n_qubits == 7
+    assert backends[1].configuration().coupling_map is None
+
+    ss_provider.backends_ttl = 0.0
+    ss_provider.refresh()
+    _ = ss_provider.backends()
+    assert mock_client.get_backends.call_count == 4
+
+    # snapshots let new providers skip the network entirely
+    path = str(tmp_path / "backends.json")
+    ss_provider.save_backends_snapshot(path)
+
+    offline_provider = qss.superstaq_provider.SuperstaQProvider(
+        api_key="MY_TOKEN", backends_snapshot=path
+    )
+    offline_provider._client = MagicMock()
+    offline_backends = offline_provider.backends()
+    assert offline_backends == ss_provider.backends()
+    assert offline_backends[1].configuration().n_qubits == 7
+    assert offline_backends[0].configuration().n_qubits == -1
+    offline_provider._client.get_backends.assert_not_called()
+    offline_provider._client.target_info.assert_not_called()
+
+    offline_provider._client = mock_client
+    offline_provider.refresh()
+    assert offline_provider.backends()[1] is offline_backends[1]
+    assert mock_client.get_backends.call_count == 7
+
+
+@patch("requests.Session.get")
+def test_http_session(mock_get: MagicMock) -> None:
+    with patch("requests.adapters.HTTPAdapter", wraps=requests.adapters.HTTPAdapter) as adapter:
+        ss_provider = qss.superstaq_provider.SuperstaQProvider(
+            api_key="MY_TOKEN", pool_maxsize=4, max_retries=2, retry_backoff_factor=0.1
+        )
+
+    assert adapter.call_args.kwargs["pool_maxsize"] == 4
+    assert adapter.call_args.kwargs["max_retries"].total == 2
+    assert adapter.call_args.kwargs["max_retries"].backoff_factor == 0.1
+    assert ss_provider._session.headers["Authorization"] == "MY_TOKEN"
+
+    # API client requests are sent through the provider's session
+    mock_get.return_value.json = lambda: {"balance": 12345.6789}
+    assert ss_provider.get_balance(pretty_output=False) == 12345.6789
+    mock_get.assert_called_once()
+
+    # as is the traffic of the backends and jobs it creates
+    backend = ss_provider.get_backend("ibmq_qasm_simulator")
+    job = qss.superstaq_job.SuperstaQJob(backend, "job_id")
+    mock_get.return_value.json = lambda: {"status": "Running"}
+    assert job.status() == qiskit.providers.JobStatus.RUNNING
+    assert mock_get.call_count == 2
+    assert mock_get.call_args[0][0] == f"{qss.API_URL}/{qss.API_VERSION}/job/job_id"
+
+
+@patch("requests.Session.post")
+def test_compression(mock_post: MagicMock) -> None:
+    with pytest.raises(ValueError, match="Compression must be one of"):
+        _ = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN", compression="brotli")
+
+    with patch.object(qss.superstaq_provider, "zstandard", None):
+        with pytest.raises(ValueError, match="requires the zstandard package"):
+            _ = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN", compression="zstd")
+
+    mock_zstandard = MagicMock()
+    mock_zstandard.ZstdCompressor.return_value.compress = lambda data: b"zstd" + data
+
+    with patch.object(qss.superstaq_provider, "zstandard", mock_zstandard):
+        ss_provider = qss.superstaq_provider.SuperstaQProvider(
+            api_key="MY_TOKEN", compression="zstd"
+        )
+
+    client = ss_provider._client
+    assert isinstance(client, qss.superstaq_provider._SuperstaQClient)
+
+    large_json = {"qiskit_circuits": "x" * 2000}
+    large_body = json.dumps(large_json).encode()
+    small_json = {"qiskit_circuits": "x"}
+
+    # large requests are compressed
+    mock_post.return_value.status_code = 200
+    mock_post.return_value.json = lambda: {"job_ids": ["job_id"]}
+    with patch.object(qss.superstaq_provider, "zstandard", mock_zstandard):
+        assert client.post_request("/jobs", large_json) == {"job_ids": ["job_id"]}
+    assert mock_post.call_args.kwargs["data"] == b"zstd" + large_body
+    assert mock_post.call_args.kwargs["headers"]["Content-Encoding"] == "zstd"
+
+    # small ones aren't
+    _ = client.post_request("/jobs", small_json)
+    assert mock_post.call_args.kwargs["data"] == json.dumps(small_json).encode()
+    assert "Content-Encoding" not in mock_post.call_args.kwargs["headers"]
+
+    # if the server refuses a compression, we switch to one it accepts
+    unsupported = MagicMock(status_code=415, headers={"Accept-Encoding": "zstd, gzip;q=0.5"})
+    ok = MagicMock(status_code=200, json=lambda: {"job_ids": ["job_id"]})
+    mock_post.reset_mock(return_value=True)
+    mock_post.side_effect = [unsupported, ok]
+    with patch.object(qss.superstaq_provider, "zstandard", mock_zstandard):
+        assert client.post_request("/jobs", large_json) == {"job_ids": ["job_id"]}
+    assert client.compression == "gzip"
+    assert mock_post.call_count == 2
+    assert gzip.decompress(mock_post.call_args.kwargs["data"]) == large_body
+    assert mock_post.call_args.kwargs["headers"]["Content-Encoding"] == "gzip"
+
+    # other headers are sent along with compressed requests
+    mock_post.reset_mock(side_effect=True)
+    mock_post.return_value = ok
+    _ = client.create_job({"qiskit_circuits": "x" * 2000}, 100, "ibmq_qasm_simulator", True, "key")
+    assert mock_post.call_args.kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert mock_post.call_args.kwargs["headers"]["Idempotency-Key"] == "key"
+    assert json.loads(gzip.decompress(mock_post.call_args.kwargs["data"])) == {
+        "qiskit_circuits": "x" * 2000,
+        "backend": "ibmq_qasm_simulator",
+        "shots": 100,
+        "ibmq_pulse": True,
+    }
+
+    # ...or stop compressing requests altogether if it doesn't accept any
+    mock_post.reset_mock(side_effect=True)
+    mock_post.side_effect = [MagicMock(status_code=415, headers={}), ok]
+    assert client.post_request("/jobs", large_json) == {"job_ids": ["job_id"]}
+    assert client.compression is None
+    assert mock_post.call_count == 2
+    assert mock_post.call_args.kwargs["data"] == large_body
+    assert "Content-Encoding" not in mock_post.call_args.kwargs["headers"]
+
+    # after which requests are sent as before
+    mock_post.reset_mock(side_effect=True)
+    mock_post.return_value = ok
+    assert client.post_request("/jobs", large_json) == {"job_ids": ["job_id"]}
+    assert mock_post.call_args.kwargs["json"] == large_json
 
 
 @patch.dict(os.environ, {"SUPERSTAQ_API_KEY": ""})
@@ -83,7 +259,7 @@ def test_get_balance() -> None:
     assert ss_provider.get_balance(pretty_output=False) == 12345.6789
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_aqt_compile(mock_post: MagicMock) -> None:
     provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
 
@@ -103,6 +279,9 @@ def test_aqt_compile(mock_post: MagicMock) -> None:
     assert out.circuits == [qc]
     assert not hasattr(out, "circuit") and not hasattr(out, "pulse_list")
 
+    out = asyncio.run(provider.aqt_compile_async([qc]))
+    assert out.circuits == [qc]
+
     mock_post.return_value.json = lambda: {
         "qiskit_circuits": qss.serialization.serialize_circuits([qc, qc]),
         "state_jp": applications_superstaq.converters.serialize({}),
@@ -113,7 +292,28 @@ def test_aqt_compile(mock_post: MagicMock) -> None:
     assert not hasattr(out, "circuit") and not hasattr(out, "pulse_list")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
+def test_compile_validation(mock_post: MagicMock) -> None:
+    provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
+
+    qc = qiskit.QuantumCircuit(8)
+    qc.cz(4, 5)
+    qc.append(qiskit.circuit.Gate("opaque", 1, []), [0])
+
+    with pytest.raises(ValueError, match="unsupported instruction: 'opaque'"):
+        _ = provider.aqt_compile([qc, qc])
+    with pytest.raises(ValueError, match="unsupported instruction: 'opaque'"):
+        _ = provider.ibmq_compile(qc)
+
+    # circuits are also checked against the (cached) metadata of the target
+    provider.get_backend("ibmq_lima_qpu")._set_target_info({"num_qubits": 5})
+    with pytest.raises(ValueError, match="Circuit 0 has 8 qubits, but ibmq_lima_qpu only has 5"):
+        _ = provider.ibmq_compile(qiskit.QuantumCircuit(8), target="ibmq_lima_qpu")
+
+    mock_post.assert_not_called()
+
+
+@patch("requests.Session.post")
 def test_service_aqt_compile_eca(mock_post: MagicMock) -> None:
     provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
 
@@ -130,6 +330,9 @@ def test_service_aqt_compile_eca(mock_post: MagicMock) -> None:
     assert out.circuits == [qc]
     assert not hasattr(out, "circuit") and not hasattr(out, "pulse_list")
 
+    out = asyncio.run(provider.aqt_compile_eca_async(qc, num_equivalent_circuits=1))
+    assert out.circuits == [qc]
+
 
 @patch(
     "applications_superstaq.superstaq_client._SuperstaQClient.ibmq_compile",
@@ -149,9 +352,80 @@ def test_service_ibmq_compile(mock_ibmq_compile: MagicMock) -> None:
     assert provider.ibmq_compile([qiskit.QuantumCircuit()]) == qss.compiler_output.CompilerOutput(
         [qc], [mock.DEFAULT], None, None, None
     )
+    assert asyncio.run(
+        provider.ibmq_compile_async(qiskit.QuantumCircuit())
+    ) == qss.compiler_output.CompilerOutput(qc, mock.DEFAULT, None, None, None)
+
 
+@patch("requests.Session.post")
+def test_compile_cache(mock_post: MagicMock, tmp_path: Any) -> None:
+    cache = qss.compile_cache.CompileCache(cache_dir=str(tmp_path))
+    provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN", compile_cache=cache)
 
-@patch("requests.post")
+    qc = qiskit.QuantumCircuit(1)
+    qc.h(0)
+    mock_post.return_value.json = lambda: {
+        "qiskit_circuits": qss.serialization.serialize_circuits(qc)
+    }
+
+    # repeated compilations of the same circuit for the same target only hit the server once
+    assert provider.cq_compile(qc).circuit == qc
+    assert provider.cq_compile(qc).circuit == qc
+    assert mock_post.call_count == 1
+
+    assert provider.cq_compile(qc, target="other").circuit == qc
+    assert mock_post.call_count == 2
+
+    # (the same circuit as a list makes the same request, so also hits the cache)
+    assert provider.cq_compile([qc]).circuits == [qc]
+    assert mock_post.call_count == 2
+
+    # the on-disk cache is shared by other providers
+    other_provider = qss.superstaq_provider.SuperstaQProvider(
+        api_key="MY_TOKEN", compile_cache=qss.compile_cache.CompileCache(cache_dir=str(tmp_path))
+    )
+    assert other_provider.cq_compile(qc).circuit == qc
+    assert mock_post.call_count == 2
+
+    # but not by other users
+    other_user_provider = qss.superstaq_provider.SuperstaQProvider(
+        api_key="OTHER_TOKEN", compile_cache=qss.compile_cache.CompileCache(cache_dir=str(tmp_path))
+    )
+    assert other_user_provider.cq_compile(qc).circuit == qc
+    assert mock_post.call_count == 3
+    mock_post.reset_mock()
+
+    # unseeded ECA compilation isn't cached, as its output is random
+    mock_post.return_value.json = lambda: {
+        "qiskit_circuits": qss.serialization.serialize_circuits(qc),
+        "state_jp": applications_superstaq.converters.serialize({}),
+        "pulse_lists_jp": applications_superstaq.converters.serialize([[[]]]),
+    }
+    _ = provider.aqt_compile_eca(qc, num_equivalent_circuits=1)
+    _ = provider.aqt_compile_eca(qc, num_equivalent_circuits=1)
+    assert mock_post.call_count == 2
+    _ = provider.aqt_compile_eca(qc, num_equivalent_circuits=1, random_seed=123)
+    _ = provider.aqt_compile_eca(qc, num_equivalent_circuits=1, random_seed=123)
+    assert mock_post.call_count == 3
+
+    # changes to server-side state which affects compile output clear the cache
+    mock_post.return_value.json = lambda: {"status": "Your IBMQ account token has been updated"}
+    _ = provider.ibmq_set_token("ibmq_token")
+    assert os.listdir(tmp_path) == []
+    mock_post.return_value.json = lambda: {
+        "qiskit_circuits": qss.serialization.serialize_circuits(qc)
+    }
+    assert provider.cq_compile(qc).circuit == qc
+    assert mock_post.call_count == 5
+
+    for name in ["Pulses.yaml", "Variables.yaml"]:
+        (tmp_path / name).write_text("config")
+    mock_post.return_value.json = lambda: {"status": "Your AQT configuration has been updated"}
+    _ = provider.aqt_upload_configs(str(tmp_path / "Pulses.yaml"), str(tmp_path / "Variables.yaml"))
+    assert sorted(os.listdir(tmp_path)) == ["Pulses.yaml", "Variables.yaml"]
+
+
+@patch("requests.Session.post")
 def test_qscout_compile(mock_post: MagicMock) -> None:
     provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
 
@@ -179,6 +453,9 @@ def test_qscout_compile(mock_post: MagicMock) -> None:
     out = provider.qscout_compile([qc])
     assert out.circuits == [qc]
 
+    out = asyncio.run(provider.qscout_compile_async(qc))
+    assert out.circuit == qc
+
     mock_post.return_value.json = lambda: {
         "qiskit_circuits": qss.serialization.serialize_circuits([qc, qc]),
         "jaqal_programs": [jaqal_program, jaqal_program],
@@ -187,7 +464,7 @@ def test_qscout_compile(mock_post: MagicMock) -> None:
     assert out.circuits == [qc, qc]
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_cq_compile(mock_post: MagicMock) -> None:
     provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
 
@@ -203,6 +480,9 @@ def test_cq_compile(mock_post: MagicMock) -> None:
     out = provider.cq_compile([qc])
     assert out.circuits == [qc]
 
+    out = asyncio.run(provider.cq_compile_async(qc))
+    assert out.circuit == qc
+
     mock_post.return_value.json = lambda: {
         "qiskit_circuits": qss.serialization.serialize_circuits([qc, qc])
     }
@@ -218,9 +498,53 @@ def test_neutral_atom_compile(mock_ibmq_compile: MagicMock) -> None:
     provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
     assert provider.neutral_atom_compile(qiskit.QuantumCircuit()) == mock.DEFAULT
     assert provider.neutral_atom_compile([qiskit.QuantumCircuit()]) == [mock.DEFAULT]
+    assert asyncio.run(provider.neutral_atom_compile_async(qiskit.QuantumCircuit())) == mock.DEFAULT
 
     with mock.patch.dict("sys.modules", {"unittest": None}), pytest.raises(
         applications_superstaq.SuperstaQModuleNotFoundException,
         match="'neutral_atom_compile' requires module 'unittest'",
     ):
         _ = provider.neutral_atom_compile(qiskit.QuantumCircuit())
+
+
+@patch("requests.Session.post")
+def test_create_job(mock_post: MagicMock) -> None:
+    ss_provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
+    client = ss_provider._client
+    assert isinstance(client, qss.superstaq_provider._SuperstaQClient)
+    mock_post.return_value.json = lambda: {"job_ids": ["job_id"]}
+
+    assert client.create_job(
+        {"qiskit_circuits": "xyz"}, repetitions=100, target="ibmq_qasm_simulator"
+    ) == {"job_ids": ["job_id"]}
+    assert mock_post.call_args.kwargs["json"] == {
+        "qiskit_circuits": "xyz",
+        "backend": "ibmq_qasm_simulator",
+        "shots": 100,
+    }
+    assert "Idempotency-Key" not in mock_post.call_args.kwargs["headers"]
+
+    _ = client.create_job(
+        {"qiskit_circuits": "xyz"}, target="ibmq_qasm_simulator", idempotency_key="key"
+    )
+    assert mock_post.call_args.kwargs["headers"]["Idempotency-Key"] == "key"
+    assert mock_post.call_args.kwargs["headers"]["Authorization"] == "MY_TOKEN"
+
+
+@patch("requests.Session.post")
+def test_target_info(mock_post: MagicMock) -> None:
+    ss_provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
+    client = ss_provider._client
+    assert isinstance(client, qss.superstaq_provider._SuperstaQClient)
+    target_info = {"ibmq_lima_qpu": {"num_qubits": 5, "max_shots": 20000}}
+    mock_post.return_value.json = lambda: {"target_info": target_info}
+
+    assert client.target_info(["ibmq_lima_qpu"]) == {"target_info": target_info}
+    assert mock_post.call_args.args[0].endswith("/target_info")
+    assert mock_post.call_args.kwargs["json"] == {"targets": ["ibmq_lima_qpu"]}
+
+    assert ss_provider._fetch_target_info(["ibmq_lima_qpu"]) == target_info
+    assert ss_provider.get_backend("ibmq_lima_qpu").configuration().max_shots == 20000
+
+    mock_post.return_value.json = lambda: {}
+    assert ss_provider._fetch_target_info(["ibmq_lima_qpu"]) == {}
@@ -0,0 +1,95 @@
+from typing import Iterable, List, Optional, Set, Tuple, Union
+
+import qiskit
+
+import qiskit_superstaq as qss
+
+# non-gate instructions which can always be sent to SuperstaQ
+_SUPPORTED_INSTRUCTIONS = {"barrier", "reset"}
+
+_CircuitData = Iterable[Tuple[qiskit.circuit.Instruction, List, List]]
+
+
+def _unsupported_instructions(data: _CircuitData, supported_names: Set[str]) -> Set[str]:
+    """Finds the names of instructions (including those in the definitions of composite gates)
+    which are neither standard, registered custom gates, nor defined in terms of other gates."""
+    unsupported_names = set()
+    for inst, _, _ in data:
+        if inst.name in supported_names:
+            continue
+        if inst.definition is None:
+            unsupported_names.add(inst.name)
+        else:
+            unsupported_names |= _unsupported_instructions(inst.definition._data, supported_names)
+    return unsupported_names
+
+
+def find_errors(
+    circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+    configuration: Optional[qiskit.providers.models.BackendConfiguration] = None,
+    shots: Optional[int] = None,
+    require_measurements: bool = False,
+) -> List[str]:
+    """Checks a batch of circuits for errors which would otherwise only be reported by SuperstaQ
+    after the circuits were serialized and submitted.
+
+    Args:
+        circuits: the circuit(s) to check.
+        configuration: the (cached) configuration of the target, if known. Circuits are checked
+            against its number of qubits and maximum shots, where these are available.
+        shots: the number of shots the circuits are to be run with, if any.
+        require_measurements: whether every circuit must contain measurements (e.g. to be run).
+
+    Returns:
+        A description of every error found in the batch (which is empty if there are none).
+    """
+    if isinstance(circuits, qiskit.QuantumCircuit):
+        circuits = [circuits]
+
+    supported_names = set(qss.custom_gates._STANDARD_GATE_NAMES)
+    supported_names |= _SUPPORTED_INSTRUCTIONS | qss.custom_gates._CUSTOM_GATES_BY_NAME.keys()
+
+    target = configuration.backend_name if configuration else None
+    n_qubits = configuration.n_qubits if configuration else -1
+    max_shots = configuration.max_shots if configuration else -1
+
+    errors = []
+    if shots is not None and 0 < max_shots < shots:
+        errors.append(f"{target} supports at most {max_shots} shots (got {shots}).")
+
+    for index, circuit in enumerate(circuits):
+        if 0 < n_qubits < circuit.num_qubits:
+            errors.append(
+                f"Circuit {index} has {circuit.num_qubits} qubits, but {target} only has "
+                f"{n_qubits}."
+            )
+
+        for name in sorted(_unsupported_instructions(circuit._data, supported_names)):
+            errors.append(f"Circuit {index} contains an unsupported instruction: '{name}'.")
+
+        if require_measurements and not any(inst.name == "measure" for inst, _, _ in circuit._data):
+            errors.append(f"Circuit {index} contains no measurements.")
+
+    return errors
+
+
+def validate_circuits(
+    circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+    configuration: Optional[qiskit.providers.models.BackendConfiguration] = None,
+    shots: Optional[int] = None,
+    require_measurements: bool = False,
+) -> None:
+    """Checks a batch of circuits before submission, reporting every error found at once.
+
+    Args:
+        circuits: the circuit(s) to check.
+        configuration: the (cached) configuration of the target, if known.
+        shots: the number of shots the circuits are to be run with, if any.
+        require_measurements: whether every circuit must contain measurements.
+
+    Raises:
+        ValueError: if any errors were found (see `find_errors`).
+    """
+    errors = find_errors(circuits, configuration, shots, require_measurements)
+    if errors:
+        raise ValueError("\n".join(["Invalid circuit(s):", *errors]))
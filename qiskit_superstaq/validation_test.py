@@ -0,0 +1,73 @@
+import time
+
+import pytest
+import qiskit
+
+import qiskit_superstaq as qss
+
+
+def _configuration(n_qubits: int, max_shots: int) -> qiskit.providers.models.BackendConfiguration:
+    ss_provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
+    backend = ss_provider.get_backend("ibmq_lima_qpu")
+    backend._set_target_info({"num_qubits": n_qubits, "max_shots": max_shots})
+    return backend.configuration()
+
+
+def test_find_errors() -> None:
+    qc = qiskit.QuantumCircuit(3, 3)
+    qc.h(0)
+    qc.append(qss.ZZSwapGate(0.1), [0, 1])
+    qc.append(qss.ParallelGates(qss.AceCR("+-"), qiskit.circuit.library.RXGate(0.2)), [0, 1, 2])
+    qc.append(qss.AQTiCCXGate(), [0, 1, 2])
+    qc.barrier()
+    qc.reset(2)
+    qc.measure([0, 1, 2], [0, 1, 2])
+    assert qss.validation.find_errors(qc) == []
+    assert qss.validation.find_errors([qc, qc], _configuration(3, 1000), shots=1000) == []
+
+    subcircuit = qiskit.QuantumCircuit(2)
+    subcircuit.cx(0, 1)
+    subcircuit.append(qiskit.circuit.Gate("opaque", 1, []), [1])
+    composite_gate = subcircuit.to_gate()
+
+    bad_qc = qiskit.QuantumCircuit(4)
+    bad_qc.append(composite_gate, [0, 1])
+    bad_qc.append(qiskit.circuit.Gate("other_opaque", 2, []), [2, 3])
+
+    assert qss.validation.find_errors(
+        [qc, bad_qc], _configuration(3, 1000), shots=2000, require_measurements=True
+    ) == [
+        "ibmq_lima_qpu supports at most 1000 shots (got 2000).",
+        "Circuit 1 has 4 qubits, but ibmq_lima_qpu only has 3.",
+        "Circuit 1 contains an unsupported instruction: 'opaque'.",
+        "Circuit 1 contains an unsupported instruction: 'other_opaque'.",
+        "Circuit 1 contains no measurements.",
+    ]
+
+    # limits are only checked if they are known
+    assert qss.validation.find_errors(bad_qc, _configuration(-1, -1), shots=2000) == [
+        "Circuit 0 contains an unsupported instruction: 'opaque'.",
+        "Circuit 0 contains an unsupported instruction: 'other_opaque'.",
+    ]
+
+
+def test_validate_circuits() -> None:
+    qc = qiskit.QuantumCircuit(2)
+    qc.h(0)
+    qss.validation.validate_circuits(qc)
+
+    with pytest.raises(ValueError, match=r"Invalid circuit\(s\):\nCircuit 0 contains no meas"):
+        qss.validation.validate_circuits(qc, require_measurements=True)
+
+
+def test_validate_circuits_timing() -> None:
+    qc = qiskit.QuantumCircuit(5, 5)
+    for i in range(4):
+        qc.h(i)
+        qc.append(qss.ZZSwapGate(0.1 * i), [i, i + 1])
+        qc.cx(i, i + 1)
+    qc.measure(range(5), range(5))
+
+    start_time = time.perf_counter()
+    qss.validation.validate_circuits([qc] * 1000, _configuration(5, 1000), 1000, True)
+    assert time.perf_counter() - start_time < 1.0